@@ -0,0 +1,37 @@
+# Compares settled nodes and query time of Dijkstra and A*
+import time
+
+from synthetic import grid_graph, grid_coordinates, random_pairs
+
+def run(find, pairs, graph) -> tuple[float, float]:
+    """Return the mean query time in ms and the mean number of settled nodes."""
+    settled = 0
+    start = time.perf_counter()
+    for start_id, end_id in pairs:
+        find(start_id, end_id)
+        settled += graph.settled_count
+    elapsed = time.perf_counter() - start
+    return elapsed / len(pairs) * 1000, settled / len(pairs)
+
+def main():
+    print(f"{'grid':>10} {'nodes':>8} {'dijkstra ms':>12} {'a* ms':>8} "
+          f"{'dijkstra settled':>17} {'a* settled':>11} {'reduction':>10}")
+    for size in (30, 60, 120, 200):
+        # Weights of at least 50 per unit of spacing give the heuristic a scale of 50
+        graph = grid_graph(size, size, min_weight=50)
+        coords = grid_coordinates(size, size)
+        pairs = random_pairs(list(graph.paths), 20)
+
+        for start_id, end_id in pairs:
+            assert (graph.find_shortest_path(start_id, end_id)[1]
+                    == graph.find_shortest_path_astar(start_id, end_id, coords)[1])
+
+        dijkstra_ms, dijkstra_settled = run(graph.find_shortest_path, pairs, graph)
+        astar_ms, astar_settled = run(
+            lambda s, e: graph.find_shortest_path_astar(s, e, coords), pairs, graph)
+        print(f"{f'{size}x{size}':>10} {size * size:>8} {dijkstra_ms:>12.2f} {astar_ms:>8.2f} "
+              f"{dijkstra_settled:>17.0f} {astar_settled:>11.0f} "
+              f"{dijkstra_settled / max(astar_settled, 1):>9.1f}x")
+
+if __name__ == '__main__':
+    main()
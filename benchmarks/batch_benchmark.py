@@ -0,0 +1,46 @@
+# Throughput of the batch routing CLI for many-to-many pairs as workers are added
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+from synthetic import grid_map, write_map
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+from batch_routes import batch_routes
+
+def main(size: int, origins: int, worker_counts: list[int]):
+    locations, connections = grid_map(size)
+    ids = [location["id"] for location in locations]
+    # Every origin to every location, like every dorm to every classroom building
+    pairs = [(start, end) for start in ids[::max(1, len(ids) // origins)][:origins] for end in ids]
+
+    with tempfile.TemporaryDirectory() as folder:
+        map_file = os.path.join(folder, "map.json")
+        features_file = os.path.join(folder, "features.json")
+        write_map(map_file, locations, connections)
+        with open(features_file, "w") as file:
+            file.write("{}")
+
+        print(f"{len(ids)} locations, {len(pairs)} pairs, {os.cpu_count()} cores")
+        print(f"{'workers':>8} {'seconds':>8} {'pairs/s':>9} {'speedup':>8}")
+        baseline = None
+        for workers in worker_counts:
+            start = time.perf_counter()
+            with contextlib.redirect_stderr(io.StringIO()):
+                count = sum(1 for _ in batch_routes(pairs, map_file, features_file, workers))
+            seconds = time.perf_counter() - start
+            baseline = baseline or seconds
+            print(f"{workers:>8} {seconds:>8.2f} {count / seconds:>9.0f} {baseline / seconds:>8.2f}")
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark batch routing across worker counts.")
+    parser.add_argument("--size", type=int, default=2500, help="locations in the synthetic grid map")
+    parser.add_argument("--origins", type=int, default=40, help="origins routed to every location")
+    parser.add_argument("--workers", type=int, nargs="*",
+                        default=sorted({1, 2, 4, os.cpu_count() or 1}), help="pool sizes to time")
+    args = parser.parse_args()
+    main(args.size, args.origins, args.workers)
@@ -0,0 +1,39 @@
+# Compares settled nodes and query time of one- and two-sided Dijkstra
+import time
+
+from synthetic import grid_graph, random_pairs
+
+def run(find, pairs, graph) -> tuple[float, float]:
+    """Return the mean query time in ms and the mean number of settled nodes."""
+    settled = 0
+    start = time.perf_counter()
+    for start_id, end_id in pairs:
+        find(start_id, end_id)
+        settled += graph.settled_count
+    elapsed = time.perf_counter() - start
+    return elapsed / len(pairs) * 1000, settled / len(pairs)
+
+def main():
+    print(f"{'grid':>10} {'queries':>8} {'dijkstra ms':>12} {'bidir ms':>9} "
+          f"{'dijkstra settled':>17} {'bidir settled':>14} {'reduction':>10}")
+    for size in (30, 60, 120, 200):
+        graph = grid_graph(size, size)
+        node_count = size * size
+        # Corner to corner is the cross-campus case; random pairs are the mix
+        workloads = [
+            ('corners', [(0, node_count - 1), (size - 1, node_count - size)] * 5),
+            ('random', random_pairs(list(graph.paths), 20)),
+        ]
+        for name, pairs in workloads:
+            for start_id, end_id in pairs:
+                assert (graph.find_shortest_path(start_id, end_id)[1]
+                        == graph.find_shortest_path_bidirectional(start_id, end_id)[1])
+
+            dijkstra_ms, dijkstra_settled = run(graph.find_shortest_path, pairs, graph)
+            bidir_ms, bidir_settled = run(graph.find_shortest_path_bidirectional, pairs, graph)
+            print(f"{f'{size}x{size}':>10} {name:>8} {dijkstra_ms:>12.2f} {bidir_ms:>9.2f} "
+                  f"{dijkstra_settled:>17.0f} {bidir_settled:>14.0f} "
+                  f"{dijkstra_settled / max(bidir_settled, 1):>9.1f}x")
+
+if __name__ == '__main__':
+    main()
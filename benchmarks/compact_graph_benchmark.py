@@ -0,0 +1,40 @@
+# Compares memory and query latency of Graph and its frozen CompactGraph
+import sys
+import time
+import tracemalloc
+
+from synthetic import random_graph, random_pairs
+
+def traced(build):
+    """Return build() and the bytes it allocated that are still alive."""
+    tracemalloc.start()
+    result = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, size
+
+def query_ms(graph, pairs) -> float:
+    start = time.perf_counter()
+    for start_id, end_id in pairs:
+        graph.find_shortest_path(start_id, end_id)
+    return (time.perf_counter() - start) / len(pairs) * 1000
+
+def main(edge_counts: list[int]):
+    print(f"{'edges':>9} {'graph MiB':>10} {'compact MiB':>12} {'bytes/edge':>17} "
+          f"{'graph ms':>9} {'compact ms':>11}")
+    for edge_count in edge_counts:
+        # Average degree of 4, roughly that of a walking network
+        graph, graph_size = traced(lambda: random_graph(edge_count // 2, edge_count))
+        compact, compact_size = traced(graph.freeze)
+        pairs = random_pairs(list(graph.paths), 10)
+
+        for start_id, end_id in pairs:
+            assert graph.find_shortest_path(start_id, end_id)[1] == compact.find_shortest_path(start_id, end_id)[1]
+
+        per_edge = f"{graph_size / edge_count:.0f} -> {compact_size / edge_count:.0f}"
+        print(f"{edge_count:>9} {graph_size / 2**20:>10.1f} {compact_size / 2**20:>12.1f} {per_edge:>17} "
+              f"{query_ms(graph, pairs):>9.2f} {query_ms(compact, pairs):>11.2f}")
+
+if __name__ == '__main__':
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10_000, 100_000, 1_000_000]
+    main(sizes)
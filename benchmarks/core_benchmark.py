@@ -0,0 +1,81 @@
+# Load time, query throughput and memory of the headless core on synthetic maps
+import argparse
+import contextlib
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from synthetic import grid_map, random_geometric_map, replicated_campus_map, write_map
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(os.path.join(ROOT, 'src'))
+from core import CampusNavCore
+
+def build_map(kind: str, size: int):
+    """Return (locations, connections); for "campus" size is the number of copies."""
+    if kind == "grid":
+        return grid_map(size)
+    if kind == "geometric":
+        return random_geometric_map(size)
+    return replicated_campus_map(os.path.join(ROOT, "data", "campus_map.json"), size)
+
+def throughput(function, arguments, seconds: float = 1.0) -> float:
+    """Call function over arguments for about seconds and return calls per second."""
+    calls = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        function(*arguments[calls % len(arguments)])
+        calls += 1
+    return calls / (time.perf_counter() - start)
+
+def run(kind: str, size: int, compact: bool, folder: str):
+    locations, connections = build_map(kind, size)
+    map_file = os.path.join(folder, f"{kind}_{size}.json")
+    write_map(map_file, locations, connections)
+    features_file = os.path.join(folder, "features.json")
+    with open(features_file, "w") as file:
+        file.write("{}")
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        core = CampusNavCore(map_file, features_file, cache_size=0, compact=compact)
+    load_s = time.perf_counter() - start
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    rng = random.Random(0)
+    ids = [location["id"] for location in locations]
+    pairs = [(rng.choice(ids), rng.choice(ids)) for _ in range(50)]
+    xs = [location["x"] for location in locations]
+    ys = [location["y"] for location in locations]
+    points = [(rng.uniform(min(xs), max(xs)), rng.uniform(min(ys), max(ys))) for _ in range(1000)]
+    routes = throughput(core.find_route, pairs)
+    nearest = throughput(core.nearest_location, points)
+
+    print(f"{kind:>10} {len(locations):>9} {len(connections):>9} {load_s:>8.2f} "
+          f"{memory / 2**20:>8.1f} {routes:>10.1f} {nearest:>11.0f}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark CampusNavCore on synthetic maps.")
+    parser.add_argument("--kind", choices=["grid", "geometric", "campus"], nargs="*",
+                        default=["grid", "geometric", "campus"])
+    parser.add_argument("--size", type=int, nargs="*", default=[1000, 10000],
+                        help="locations per map (copies of the campus for --kind campus)")
+    parser.add_argument("--compact", action="store_true", help="route on the CompactGraph")
+    args = parser.parse_args()
+
+    print(f"{'map':>10} {'locations':>9} {'edges':>9} {'load s':>8} {'MiB':>8} "
+          f"{'routes/s':>10} {'nearest/s':>11}")
+    with tempfile.TemporaryDirectory() as folder:
+        for kind in args.kind:
+            for size in args.size:
+                # A campus copy has about 50 locations, so scale the copy count down
+                run(kind, max(1, size // 50) if kind == "campus" else size, args.compact, folder)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+# Compares the path-copying Dijkstra with the parent-pointer version
+import heapq
+import time
+import tracemalloc
+
+from synthetic import grid_graph, random_pairs
+
+def path_copying_shortest_path(graph, start_id: int, end_id: int) -> tuple[list[int], int]:
+    """The original find_shortest_path, which copies the path into every heap entry."""
+    heap = [(0, start_id, [start_id])]
+    visited = set()
+
+    while heap:
+        curr_dis, current, path = heapq.heappop(heap)
+        if current == end_id:
+            return path, curr_dis
+
+        if current in visited:
+            continue
+        visited.add(current)
+
+        for neighbor in graph.paths[current]:
+            if neighbor not in visited:
+                edge_weight = graph.get_edge_weight(current, neighbor)
+                heapq.heappush(heap, (curr_dis + edge_weight, neighbor, path + [neighbor]))
+
+    return [], 10**6
+
+def measure(find, graph, pairs) -> tuple[float, int]:
+    """Return the mean query time in ms and the peak traced memory in bytes."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    for start_id, end_id in pairs:
+        find(graph, start_id, end_id)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed / len(pairs) * 1000, peak
+
+def main():
+    print(f"{'graph':>12} {'nodes':>8} {'old ms':>9} {'new ms':>9} {'old peak KiB':>13} {'new peak KiB':>13}")
+    # Square grids keep the frontier wide; corridors make every route long.
+    shapes = [(30, 30), (60, 60), (120, 120), (2000, 2), (8000, 2)]
+    for width, height in shapes:
+        graph = grid_graph(width, height)
+        node_count = width * height
+        # Opposite corners give the longest routes, where path copying hurts most
+        pairs = [(0, node_count - 1)] + random_pairs(list(graph.paths), 4)
+
+        for start_id, end_id in pairs:
+            old = path_copying_shortest_path(graph, start_id, end_id)
+            new = graph.find_shortest_path(start_id, end_id)
+            assert old[1] == new[1], f'Distance mismatch for {start_id} -> {end_id}'
+
+        old_ms, old_peak = measure(path_copying_shortest_path, graph, pairs)
+        new_ms, new_peak = measure(type(graph).find_shortest_path, graph, pairs)
+        print(f"{f'{width}x{height}':>12} {node_count:>8} {old_ms:>9.2f} {new_ms:>9.2f} "
+              f"{old_peak / 1024:>13.1f} {new_peak / 1024:>13.1f}")
+
+if __name__ == '__main__':
+    main()
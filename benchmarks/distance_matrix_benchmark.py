@@ -0,0 +1,33 @@
+# Compares Graph.distance_matrix with one find_shortest_path call per pair
+import os
+import random
+import sys
+import time
+
+from synthetic import grid_graph
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+def main(sides: list[int], count: int = 30):
+    print(f"{'nodes':>8} {'pairs':>6} {'pairwise s':>11} {'matrix s':>9} {'speedup':>8} {'pool s':>7}")
+    for side in sides:
+        graph = grid_graph(side, side)
+        rng = random.Random(0)
+        ids = list(graph.paths)
+        sources, targets = rng.sample(ids, count), rng.sample(ids, count)
+
+        pairwise, pairwise_s = timed(lambda: [[graph.find_shortest_path(start, end)[1] for end in targets]
+                                              for start in sources])
+        matrix, matrix_s = timed(lambda: graph.distance_matrix(sources, targets))
+        pooled, pooled_s = timed(lambda: graph.distance_matrix(sources, targets, workers=None))
+        assert matrix.tolist() == pairwise == pooled.tolist()
+        print(f"{len(ids):>8} {count * count:>6} {pairwise_s:>11.2f} {matrix_s:>9.3f} "
+              f"{pairwise_s / matrix_s:>8.1f} {pooled_s:>7.2f}")
+    print(f"pool uses {os.cpu_count()} cores")
+
+if __name__ == '__main__':
+    sides = [int(arg) for arg in sys.argv[1:]] or [30, 100, 300]
+    main(sides)
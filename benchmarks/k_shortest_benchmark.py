@@ -0,0 +1,37 @@
+# Compares Yen's k shortest paths and the penalty method with a single shortest path search
+import random
+import sys
+import time
+
+from synthetic import grid_graph
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+def main(sides: list[int], ks: list[int], pairs: int = 5):
+    print(f"{'nodes':>8} {'k':>3} {'dijkstra ms':>12} {'yen ms':>9} {'penalty ms':>11} {'yen/penalty':>12}")
+    for side in sides:
+        graph = grid_graph(side, side)
+        rng = random.Random(0)
+        ids = list(graph.paths)
+        queries = [tuple(rng.sample(ids, 2)) for _ in range(pairs)]
+        for k in ks:
+            single_s = yen_s = penalty_s = 0.0
+            for start, end in queries:
+                graph.tree_cache.clear()
+                single_s += timed(lambda: graph.find_shortest_path(start, end))[1]
+                graph.tree_cache.clear()
+                yen, seconds = timed(lambda: graph.find_k_shortest_paths(start, end, k))
+                yen_s += seconds
+                graph.tree_cache.clear()
+                penalty, seconds = timed(lambda: graph.find_alternative_routes(start, end, k))
+                penalty_s += seconds
+                assert yen[0][1] == penalty[0][1]
+            print(f"{len(ids):>8} {k:>3} {single_s / pairs * 1000:>12.1f} {yen_s / pairs * 1000:>9.1f} "
+                  f"{penalty_s / pairs * 1000:>11.1f} {yen_s / penalty_s:>12.1f}")
+
+if __name__ == '__main__':
+    sides = [int(arg) for arg in sys.argv[1:]] or [50, 100, 200]
+    main(sides, [3, 5])
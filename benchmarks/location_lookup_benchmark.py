@@ -0,0 +1,49 @@
+# Shows per-lookup cost of LocationManager as the number of locations grows
+import os
+import sys
+import tempfile
+import time
+
+from synthetic import synthetic_locations, write_map
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+from location_manager import LocationManager
+
+def scan_location_name(locations: list[dict], id: int) -> str:
+    """The original linear-scan get_location_name."""
+    for location in locations:
+        if location['id'] == id:
+            return location['name']
+    raise KeyError(f'The id "{id}" does not exist.')
+
+def per_lookup_us(lookup, keys) -> float:
+    start = time.perf_counter()
+    for key in keys:
+        lookup(key)
+    return (time.perf_counter() - start) / len(keys) * 1e6
+
+def main():
+    print(f"{'locations':>10} {'scan us':>10} {'by id us':>10} {'by name us':>11} {'by coords us':>13}")
+    with tempfile.TemporaryDirectory() as folder:
+        features_file = os.path.join(folder, "features.json")
+        with open(features_file, "w") as file:
+            file.write("{}")
+        for count in (100, 1000, 10000, 100000):
+            map_file = os.path.join(folder, f"map_{count}.json")
+            write_map(map_file, synthetic_locations(count))
+            manager = LocationManager(map_file, features_file)
+
+            ids = [location['id'] for location in manager.locations[::max(1, count // 1000)]]
+            names = [manager.get_location_name(id) for id in ids]
+            coords = [manager.get_location_coordinates(id) for id in ids]
+            # The linear scan is slow enough that a spread of 50 lookups is plenty
+            scan_ids = ids[::max(1, len(ids) // 50)]
+
+            scan = per_lookup_us(lambda id: scan_location_name(manager.locations, id), scan_ids)
+            by_id = per_lookup_us(manager.get_location_name, ids)
+            by_name = per_lookup_us(manager.get_location_id, names)
+            by_coords = per_lookup_us(lambda xy: manager.get_location_name_from_cords(*xy), coords)
+            print(f"{count:>10} {scan:>10.2f} {by_id:>10.3f} {by_name:>11.3f} {by_coords:>13.3f}")
+
+if __name__ == '__main__':
+    main()
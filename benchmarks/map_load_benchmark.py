@@ -0,0 +1,56 @@
+# Map loading time per phase, from JSON and from the compiled binary copy,
+# against loading the file separately for the locations and the graph
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+from synthetic import grid_map, write_map
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+from data_structures.graph import Graph
+from location_manager import LocationManager
+from map_cache import cache_path
+from map_loader import load_map
+from precompute import precompute_binary_map
+
+PHASES = ["read", "locations", "graph"]
+
+def load_twice(map_file: str) -> float:
+    """Load the map the way the app used to, parsing the file once per class."""
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        manager = LocationManager(map_file, "missing.json")
+        graph = Graph()
+        for id in manager.get_location_ids():
+            graph.add_node(id)
+        graph.load_from_json(map_file)
+    return time.perf_counter() - start
+
+def load_once(map_file: str) -> dict[str, float]:
+    with contextlib.redirect_stdout(io.StringIO()):
+        return load_map(map_file, "missing.json")[2]
+
+def report(source: str, size: int, timings: dict[str, float]):
+    phases = " ".join(f"{timings[phase]:>9.2f}" for phase in PHASES)
+    print(f"{size:>10} {source:>13} {phases} {sum(timings.values()):>7.2f}")
+
+def main(sizes: list[int]):
+    print(f"{'locations':>10} {'source':>13} " + " ".join(f"{phase:>9}" for phase in PHASES) + f" {'total':>7}")
+    with tempfile.TemporaryDirectory() as folder:
+        for size in sizes:
+            map_file = os.path.join(folder, f"grid_{size}.json")
+            locations, connections = grid_map(size)
+            write_map(map_file, locations, connections)
+
+            print(f"{len(locations):>10} {'JSON, twice':>13} {'':>29} {load_twice(map_file):>7.2f}")
+            report("JSON, once", len(locations), load_once(map_file))
+            precompute_binary_map(map_file)
+            report("binary", len(locations), load_once(map_file))
+            os.remove(cache_path(map_file, "bin"))
+
+if __name__ == '__main__':
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10_000, 100_000, 500_000]
+    main(sizes)
@@ -0,0 +1,92 @@
+# Compares the hash-based Set and RecentItems with the list-backed structures they replaced
+import random
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+from data_structures.list import List
+from data_structures.recent_items import RecentItems
+from data_structures.set import Set
+
+class ListSet:
+    """The previous Set, which kept its items in a list."""
+
+    def __init__(self):
+        self.items = []
+
+    def add(self, item):
+        if item not in self.items:
+            self.items.append(item)
+
+    def contains(self, item):
+        return item in self.items
+
+    def union(self, other_set):
+        result = ListSet()
+        result.items = self.items[:]
+        for item in other_set.items:
+            if item not in result.items:
+                result.items.append(item)
+        return result
+
+    def intersection(self, other_set):
+        result = ListSet()
+        for item in self.items:
+            if item in other_set.items:
+                result.add(item)
+        return result
+
+def timed(function) -> float:
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+def set_operations(cls, first: list, second: list, lookups: list) -> float:
+    def run():
+        a, b = cls(), cls()
+        for item in first:
+            a.add(item)
+        for item in second:
+            b.add(item)
+        for item in lookups:
+            a.contains(item)
+        a.union(b)
+        a.intersection(b)
+    return timed(run)
+
+def list_touches(clicks: list) -> float:
+    def run():
+        recent = List()
+        for item in clicks:
+            if not recent.contains(item):
+                recent.add(item)
+    return timed(run)
+
+def recent_touches(clicks: list) -> float:
+    def run():
+        recent = RecentItems()
+        for item in clicks:
+            recent.touch(item)
+    return timed(run)
+
+def main(sizes: list[int]):
+    rng = random.Random(0)
+    print(f"{'items':>8} {'list set s':>11} {'hash set s':>11} {'speedup':>8} "
+          f"{'list recent s':>14} {'lru recent s':>13} {'speedup':>8}")
+    for size in sizes:
+        first = rng.sample(range(2 * size), size)
+        second = rng.sample(range(2 * size), size)
+        lookups = [rng.randrange(2 * size) for _ in range(size)]
+        clicks = [rng.randrange(size) for _ in range(2 * size)]
+
+        list_set_s = set_operations(ListSet, first, second, lookups)
+        hash_set_s = set_operations(Set, first, second, lookups)
+        list_recent_s = list_touches(clicks)
+        lru_recent_s = recent_touches(clicks)
+        print(f"{size:>8} {list_set_s:>11.3f} {hash_set_s:>11.4f} {list_set_s / hash_set_s:>8.0f} "
+              f"{list_recent_s:>14.3f} {lru_recent_s:>13.4f} {list_recent_s / lru_recent_s:>8.0f}")
+
+if __name__ == '__main__':
+    sizes = [int(arg) for arg in sys.argv[1:]] or [100, 1000, 5000, 20000]
+    main(sizes)
@@ -0,0 +1,60 @@
+# Times NameIndex per keystroke against scanning every name, on replicated campus names
+import gc
+import random
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+from data_structures.name_index import NameIndex
+from synthetic import replicated_campus_map
+
+def percentile(samples: list[float], p: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))]
+
+def typo(text: str, rng: random.Random) -> str:
+    """Drop one letter from the first word, as a hurried typist might."""
+    word = text.split()[0]
+    if len(word) < 4:
+        return word
+    i = rng.randrange(1, len(word))
+    return word[:i] + word[i + 1:]
+
+def main(copies: list[int], queries: int = 50):
+    rng = random.Random(0)
+    print(f"{'names':>8} {'build s':>8} {'prefix p50 us':>14} {'prefix p99 us':>14} "
+          f"{'typo p50 us':>12} {'typo p99 us':>12} {'scan p50 us':>12}")
+    for count in copies:
+        locations, _ = replicated_campus_map('../data/campus_map.json', count)
+        names = [location['name'] for location in locations]
+        start = time.perf_counter()
+        index = NameIndex((name, name) for name in names)
+        build_s = time.perf_counter() - start
+        folded = [name.casefold() for name in names]
+        # Keep full collections of the long-lived index out of the timings
+        gc.collect()
+        gc.freeze()
+
+        prefix_us, typo_us, scan_us = [], [], []
+        for name in rng.sample(names, queries):
+            # Every keystroke of typing the name
+            for end in range(1, len(name) + 1):
+                start = time.perf_counter()
+                index.search(name[:end])
+                prefix_us.append((time.perf_counter() - start) * 1e6)
+            start = time.perf_counter()
+            index.search(typo(name, rng))
+            typo_us.append((time.perf_counter() - start) * 1e6)
+
+            start = time.perf_counter()
+            query = name[:3].casefold()
+            [original for original, text in zip(names, folded) if query in text][:10]
+            scan_us.append((time.perf_counter() - start) * 1e6)
+        print(f"{len(names):>8} {build_s:>8.2f} {percentile(prefix_us, 50):>14.1f} {percentile(prefix_us, 99):>14.1f} "
+              f"{percentile(typo_us, 50):>12.1f} {percentile(typo_us, 99):>12.1f} {percentile(scan_us, 50):>12.0f}")
+        gc.unfreeze()
+
+if __name__ == '__main__':
+    copies = [int(arg) for arg in sys.argv[1:]] or [1, 100, 1000, 5000]
+    main(copies)
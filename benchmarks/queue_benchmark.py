@@ -0,0 +1,73 @@
+# Compares the ring-buffer Queue with the list-backed one it replaced and with collections.deque
+import os
+import sys
+import time
+from collections import deque
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+from data_structures.queue import Queue
+
+class ListQueue:
+    """The previous Queue, which dequeued with list.pop(0)."""
+
+    def __init__(self, source: list = None):
+        self.list = source if source is not None else []
+
+    def isEmpty(self) -> bool:
+        return not any(self.list)
+
+    def enqueue(self, item):
+        self.list.append(item)
+
+    def dequeue(self):
+        if not any(self.list):
+            raise IndexError("Stack is Empty.")
+        return self.list.pop(0)
+
+class DequeQueue:
+    def __init__(self):
+        self.items = deque()
+
+    def isEmpty(self) -> bool:
+        return not self.items
+
+    def enqueue(self, item):
+        self.items.append(item)
+
+    def dequeue(self):
+        return self.items.popleft()
+
+def fill_and_empty(queue, count: int) -> float:
+    """Enqueue count items, then dequeue them all, returning the seconds taken."""
+    start = time.perf_counter()
+    for i in range(1, count + 1):
+        queue.enqueue(i)
+    while not queue.isEmpty():
+        queue.dequeue()
+    return time.perf_counter() - start
+
+def batched(count: int, batch: int = 1000) -> float:
+    queue = Queue()
+    start = time.perf_counter()
+    for i in range(1, count + 1, batch):
+        queue.enqueue_many(range(i, min(i + batch, count + 1)))
+    while not queue.isEmpty():
+        queue.drain(batch)
+    return time.perf_counter() - start
+
+def main(counts: list[int], list_limit: int = 300_000):
+    print(f"{'items':>9} {'list s':>8} {'ring s':>8} {'batched s':>10} {'deque s':>8} {'list/ring':>10}")
+    for count in counts:
+        ring_s = fill_and_empty(Queue(), count)
+        deque_s = fill_and_empty(DequeQueue(), count)
+        batched_s = batched(count)
+        # list.pop(0) is quadratic, so very large runs are skipped
+        if count <= list_limit:
+            list_s = fill_and_empty(ListQueue(), count)
+            print(f"{count:>9} {list_s:>8.2f} {ring_s:>8.3f} {batched_s:>10.3f} {deque_s:>8.3f} {list_s / ring_s:>10.1f}")
+        else:
+            print(f"{count:>9} {'-':>8} {ring_s:>8.3f} {batched_s:>10.3f} {deque_s:>8.3f} {'-':>10}")
+
+if __name__ == '__main__':
+    counts = [int(arg) for arg in sys.argv[1:]] or [10**5, 3 * 10**5, 10**6]
+    main(counts)
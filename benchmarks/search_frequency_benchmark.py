@@ -0,0 +1,35 @@
+# Times SearchFrequency's searches and top-k reads against sorting every counter
+import random
+import os
+import sys
+import time
+from collections import Counter
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+from data_structures.search_frequency import SearchFrequency
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+def main(counts: list[int], names: int = 5000, reads: int = 1000):
+    rng = random.Random(0)
+    # Zipf-like popularity, as a few buildings get most searches
+    weights = [1 / (rank + 1) for rank in range(names)]
+    print(f"{'searches':>9} {'record us':>10} {'top us':>7} {'sorted top us':>14} {'top-10 overlap':>15}")
+    for count in counts:
+        searches = rng.choices(range(names), weights, k=count)
+        frequency = SearchFrequency(top_size=10, capacity=1000, clock=lambda: 0)
+        _, record_s = timed(lambda: [frequency.record(name) for name in searches])
+        top, top_s = timed(lambda: [frequency.top() for _ in range(reads)])
+
+        counter = Counter(searches)
+        exact, sorted_s = timed(lambda: [counter.most_common(10) for _ in range(reads)])
+        overlap = len({name for name, _ in top[0]} & {name for name, _ in exact[0]})
+        print(f"{count:>9} {record_s / count * 1e6:>10.2f} {top_s / reads * 1e6:>7.2f} "
+              f"{sorted_s / reads * 1e6:>14.1f} {overlap:>13}/10")
+
+if __name__ == '__main__':
+    counts = [int(arg) for arg in sys.argv[1:]] or [10**4, 10**5, 10**6]
+    main(counts)
@@ -0,0 +1,124 @@
+# Measures how long the map takes to appear, with the background image decoded
+# up front (as the app used to) or on a worker thread and swapped in when ready
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+IMAGE_FILE = os.path.join(ROOT, 'assets', 'mercer_map.png')
+
+# Each scenario runs in a fresh interpreter so that import costs are counted.
+# Times are seconds since the scenario started and are printed as JSON.
+PRELUDE = """
+import time
+start = time.perf_counter()
+import json, sys
+sys.path.insert(0, {src!r})
+import matplotlib
+matplotlib.use('Agg')
+"""
+
+EAGER = PRELUDE + """
+import matplotlib.pyplot as plt
+from core import CampusNavCore
+from utils import add_background_image, extract_coordinates_and_labels
+imported = time.perf_counter() - start
+core = CampusNavCore()
+fig, ax = plt.subplots(figsize=(8, 6))
+add_background_image(ax, {image!r})
+x, y, _ = extract_coordinates_and_labels(core.location_manager.get_visible_Locations())
+ax.scatter(x, y, color='blue')
+fig.canvas.draw()
+first_frame = time.perf_counter() - start
+print(json.dumps({{'imported': imported, 'first frame': first_frame, 'background': first_frame}}))
+"""
+
+DEFERRED = PRELUDE + """
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from core import CampusNavCore
+from background import BackgroundImage
+from rendering import TileView
+from utils import BACKGROUND_EXTENT, extract_coordinates_and_labels, set_background_limits
+imported = time.perf_counter() - start
+core = CampusNavCore()
+fig = Figure(figsize=(8, 6))
+canvas = FigureCanvasAgg(fig)
+ax = fig.add_subplot()
+background = BackgroundImage({image!r})
+background.load_async()
+set_background_limits(ax)
+x, y, _ = extract_coordinates_and_labels(core.location_manager.get_visible_Locations())
+ax.scatter(x, y, color='blue')
+canvas.draw()
+first_frame = time.perf_counter() - start
+background._thread.join()
+TileView(ax, background.pyramid, BACKGROUND_EXTENT)
+canvas.draw()
+shown = time.perf_counter() - start
+print(json.dumps({{'imported': imported, 'first frame': first_frame, 'background': shown}}))
+"""
+
+# The real window, where a display is available
+GUI = """
+import time
+start = time.perf_counter()
+import json, sys
+sys.path.insert(0, {src!r})
+import main
+imported = time.perf_counter() - start
+app = main.CampusNavigationApp()
+app.root.update()
+first_frame = time.perf_counter() - start
+while not app.ax.images:
+    app.root.update()
+    time.sleep(0.001)
+app.root.update()
+shown = time.perf_counter() - start
+app.root.destroy()
+print(json.dumps({{'imported': imported, 'first frame': first_frame, 'background': shown}}))
+"""
+
+def run(script: str, image_file: str) -> dict:
+    code = script.format(src=os.path.join(ROOT, 'src'), image=image_file)
+    output = subprocess.run([sys.executable, '-c', code], cwd=ROOT, check=True,
+                            capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def report(name: str, runs: list[dict]):
+    medians = {key: statistics.median(run[key] for run in runs) for key in runs[0]}
+    print(f"{name:<18} {medians['imported']:>9.3f} {medians['first frame']:>12.3f} {medians['background']:>11.3f}")
+
+def main(repeat: int, gui: bool):
+    with tempfile.TemporaryDirectory() as directory:
+        # A private copy of the image, so the .npy cache next to it can be removed between runs
+        image_file = os.path.join(directory, 'mercer_map.png')
+        cache_file = os.path.join(directory, 'mercer_map.npy')
+        shutil.copy(IMAGE_FILE, image_file)
+
+        print(f"median seconds over {repeat} runs")
+        print(f"{'scenario':<18} {'imported':>9} {'first frame':>12} {'background':>11}")
+        report('eager decode', [run(EAGER, image_file) for _ in range(repeat)])
+
+        cold = []
+        for _ in range(repeat):
+            if os.path.exists(cache_file):
+                os.remove(cache_file)
+            cold.append(run(DEFERRED, image_file))
+        report('deferred, no cache', cold)
+        report('deferred, cached', [run(DEFERRED, image_file) for _ in range(repeat)])
+
+    if gui:
+        report('app window', [run(GUI, IMAGE_FILE) for _ in range(repeat)])
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Time to first frame of the campus map')
+    parser.add_argument('--repeat', type=int, default=5, help='runs per scenario')
+    parser.add_argument('--gui', action='store_true', help='also time the real Tk window (needs a display)')
+    args = parser.parse_args()
+    main(args.repeat, args.gui)
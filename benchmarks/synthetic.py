@@ -0,0 +1,150 @@
+# Synthetic graphs for benchmarking
+import json
+import math
+import random
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from src.data_structures.graph import Graph
+
+def grid_graph(width: int, height: int, seed: int = 0,
+               min_weight: int = 1, max_weight: int = 100) -> Graph:
+    """Build a width x height grid graph with random edge weights.
+
+    Node ids are row-major, so node (col, row) has id row * width + col.
+    """
+    rng = random.Random(seed)
+    # Benchmarks repeat queries, so keep the route cache out of the timings
+    g = Graph(cache_size=0)
+    for id in range(width * height):
+        g.add_node(id)
+    for row in range(height):
+        for col in range(width):
+            id = row * width + col
+            if col + 1 < width:
+                g.add_edge(id, id + 1, rng.randint(min_weight, max_weight))
+            if row + 1 < height:
+                g.add_edge(id, id + width, rng.randint(min_weight, max_weight))
+    return g
+
+def random_pairs(node_ids: list[int], count: int, seed: int = 0) -> list[tuple[int, int]]:
+    """Pick count random (start, end) pairs from node_ids."""
+    rng = random.Random(seed)
+    return [(rng.choice(node_ids), rng.choice(node_ids)) for _ in range(count)]
+
+def grid_coordinates(width: int, height: int, spacing: int = 1) -> dict[int, tuple[int, int]]:
+    """Return the (x, y) position of every node of a grid_graph."""
+    return {row * width + col: (col * spacing, row * spacing)
+            for row in range(height) for col in range(width)}
+
+def synthetic_locations(count: int, seed: int = 0) -> list[dict]:
+    """Build count locations shaped like the entries of campus_map.json."""
+    rng = random.Random(seed)
+    side = max(1, int(count ** 0.5))
+    return [{
+        "id": id,
+        "name": f"Location {id}",
+        "category": rng.choice(["Dorms", "Food", "Sports", "Academic"]),
+        "x": (id % side) * 10,
+        "y": (id // side) * 10,
+        "pointOfInterest": rng.random() < 0.5,
+    } for id in range(count)]
+
+def write_map(path: str, locations: list[dict], connections: list[dict] = ()):
+    """Write locations and connections to a campus_map.json style file."""
+    with open(path, "w") as file:
+        json.dump({"locations": locations, "connections": list(connections)}, file)
+
+def random_graph(node_count: int, edge_count: int, seed: int = 0, max_weight: int = 100) -> Graph:
+    """Build a connected random graph: a random spanning path plus random extra edges."""
+    rng = random.Random(seed)
+    # Benchmarks repeat queries, so keep the route cache out of the timings
+    g = Graph(cache_size=0)
+    order = list(range(node_count))
+    rng.shuffle(order)
+    for id in order:
+        g.add_node(id)
+    for id_1, id_2 in zip(order, order[1:]):
+        g.add_edge(id_1, id_2, rng.randint(1, max_weight))
+    while g.edge_count < edge_count:
+        id_1, id_2 = rng.randrange(node_count), rng.randrange(node_count)
+        if id_1 != id_2 and id_2 not in g.paths[id_1]:
+            g.add_edge(id_1, id_2, rng.randint(1, max_weight))
+    return g
+
+def grid_map(count: int, spacing: int = 20, seed: int = 0) -> tuple[list[dict], list[dict]]:
+    """Return (locations, connections) for a square grid of about count locations."""
+    rng = random.Random(seed)
+    side = max(2, round(count ** 0.5))
+    locations = synthetic_locations(side * side, seed)
+    for location in locations:
+        location["x"] = (location["id"] % side) * spacing
+        location["y"] = (location["id"] // side) * spacing
+    connections = []
+    for id in range(side * side):
+        if id % side + 1 < side:
+            connections.append({"from": id, "to": id + 1, "distance": rng.randint(spacing, 2 * spacing)})
+        if id + side < side * side:
+            connections.append({"from": id, "to": id + side, "distance": rng.randint(spacing, 2 * spacing)})
+    return locations, connections
+
+def random_geometric_map(count: int, degree: float = 6, seed: int = 0) -> tuple[list[dict], list[dict]]:
+    """Return (locations, connections) for count random points joined to their neighbours.
+
+    Points closer than a radius chosen to give the average degree are joined,
+    with the straight-line distance (rounded up) as the edge weight.
+    """
+    rng = random.Random(seed)
+    side = 10_000
+    radius = side * (degree / (math.pi * count)) ** 0.5
+    locations = synthetic_locations(count, seed)
+    buckets = {}
+    for location in locations:
+        location["x"], location["y"] = rng.randrange(side), rng.randrange(side)
+        cell = (int(location["x"] // radius), int(location["y"] // radius))
+        buckets.setdefault(cell, []).append(location)
+
+    connections = []
+    for (cx, cy), bucket in buckets.items():
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for other in buckets.get((cx + dx, cy + dy), []):
+                    for location in bucket:
+                        if location["id"] < other["id"]:
+                            length = math.dist((location["x"], location["y"]), (other["x"], other["y"]))
+                            if length <= radius:
+                                connections.append({"from": location["id"], "to": other["id"],
+                                                    "distance": max(1, math.ceil(length))})
+    return locations, connections
+
+def replicated_campus_map(map_file: str, copies: int) -> tuple[list[dict], list[dict]]:
+    """Return (locations, connections) for copies of a real campus map laid side by side.
+
+    Neighbouring copies are joined by an edge between the right-most location
+    of one and the left-most location of the next.
+    """
+    with open(map_file, "r") as file:
+        data = json.load(file)
+    ids = [location["id"] for location in data["locations"]]
+    id_span = max(ids) - min(ids) + 1
+    xs = [location["x"] for location in data["locations"]]
+    x_span = max(xs) - min(xs) + 100
+
+    locations, connections = [], []
+    for copy in range(copies):
+        offset = copy * id_span
+        for location in data["locations"]:
+            locations.append(dict(location, id=location["id"] + offset,
+                                  name=f"{location['name']} ({copy})", x=location["x"] + copy * x_span))
+        for connection in data["connections"]:
+            connections.append({"from": connection["from"] + offset, "to": connection["to"] + offset,
+                                "distance": connection["distance"]})
+
+    copy_size = len(data["locations"])
+    for copy in range(copies - 1):
+        right = max(locations[copy * copy_size:(copy + 1) * copy_size], key=lambda loc: loc["x"])
+        left = min(locations[(copy + 1) * copy_size:(copy + 2) * copy_size], key=lambda loc: loc["x"])
+        length = math.dist((right["x"], right["y"]), (left["x"], left["y"]))
+        connections.append({"from": right["id"], "to": left["id"], "distance": math.ceil(length)})
+    return locations, connections
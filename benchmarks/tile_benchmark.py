@@ -0,0 +1,56 @@
+# Compares redraw time of the whole background image and of its tile pyramid
+# as the image grows, with the canvas size fixed
+import os
+import sys
+import time
+
+import matplotlib
+matplotlib.use('Agg')
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+from rendering import TileView
+from tile_pyramid import TilePyramid
+
+EXTENT = [-1300, 1300, -837, 837]
+
+def synthetic_image(size: int):
+    """Return a size x size RGBA image with some structure to resample."""
+    y, x = np.mgrid[0:size, 0:size]
+    pixels = np.empty((size, size, 4), dtype=np.uint8)
+    pixels[..., 0] = x * 255 // size
+    pixels[..., 1] = y * 255 // size
+    pixels[..., 2] = ((x // 16 + y // 16) % 2) * 255
+    pixels[..., 3] = 255
+    return pixels
+
+def draw_ms(show, zoom: float, repeat: int = 5) -> float:
+    figure = Figure(figsize=(8, 6))
+    canvas = FigureCanvasAgg(figure)
+    ax = figure.add_subplot()
+    ax.set_xlim(EXTENT[0] / zoom, EXTENT[1] / zoom)
+    ax.set_ylim(EXTENT[2] / zoom, EXTENT[3] / zoom)
+    show(ax)
+    canvas.draw()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        canvas.draw()
+    return (time.perf_counter() - start) / repeat * 1000
+
+def main(sizes: list[int]):
+    print(f"{'pixels':>7} {'build s':>8} {'zoom':>5} {'full image ms':>14} {'tiles ms':>9}")
+    for size in sizes:
+        pixels = synthetic_image(size)
+        start = time.perf_counter()
+        pyramid = TilePyramid.build(pixels)
+        build = time.perf_counter() - start
+        for zoom in (1, 4):
+            full = draw_ms(lambda ax: ax.imshow(pixels, extent=EXTENT, aspect='auto'), zoom)
+            tiles = draw_ms(lambda ax: TileView(ax, pyramid, EXTENT), zoom)
+            print(f"{size:>7} {build:>8.2f} {zoom:>5} {full:>14.1f} {tiles:>9.1f}")
+
+if __name__ == '__main__':
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1024, 2048, 4096, 8192]
+    main(sizes)
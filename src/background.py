@@ -0,0 +1,96 @@
+import os
+import threading
+
+from tile_pyramid import TilePyramid
+
+class BackgroundImage:
+    """The map's background image, decoded off the GUI thread.
+
+    The PNG is decoded once into an array of 8-bit RGBA pixels and saved next
+    to it as a .npy file, which later starts memory-map instead of decoding.
+    The downsampled levels of its tile pyramid are cached the same way, in a
+    .tiles directory. load_async() does the work on a worker thread; the GUI
+    polls ready() and draws the pyramid once it is there.
+    """
+
+    def __init__(self, image_file: str, cache: bool = True, tile_size: int = 256):
+        """Initialize the loader for image_file, caching the pixels unless cache is False."""
+        self.image_file = image_file
+        base = os.path.splitext(image_file)[0]
+        self.cache_file = base + ".npy" if cache else None
+        self.tile_directory = base + ".tiles" if cache else None
+        self.tile_size = tile_size
+        self.pixels = None
+        self.pyramid = None
+        self.error = None
+        self._thread = None
+
+    def _is_fresh(self, cache_file: str) -> bool:
+        try:
+            return os.path.getmtime(cache_file) >= os.path.getmtime(self.image_file)
+        except OSError:
+            return False
+
+    def load(self):
+        """Load the pixels and the tile pyramid, from up-to-date caches where possible, and return the pixels."""
+        self.pixels = self._load_pixels()
+        self.pyramid = self._load_pyramid(self.pixels)
+        return self.pixels
+
+    def _load_pyramid(self, pixels) -> TilePyramid:
+        if self.tile_directory is None:
+            return TilePyramid.build(pixels, self.tile_size)
+        manifest = os.path.join(self.tile_directory, TilePyramid.MANIFEST)
+        if self._is_fresh(manifest):
+            pyramid = TilePyramid.load(self.tile_directory, pixels)
+            if pyramid is not None and pyramid.tile_size == self.tile_size:
+                return pyramid
+
+        pyramid = TilePyramid.build(pixels, self.tile_size)
+        try:
+            pyramid.save(self.tile_directory)
+        except OSError:
+            pass  # kept in memory only, as with the pixels
+        return pyramid
+
+    def _load_pixels(self):
+        import numpy as np
+
+        if self.cache_file is not None and self._is_fresh(self.cache_file):
+            try:
+                return np.load(self.cache_file, mmap_mode="r")
+            except (OSError, ValueError):
+                pass  # a damaged cache is rebuilt below
+
+        from PIL import Image
+        with Image.open(self.image_file) as image:
+            # Palette, greyscale and RGB images are expanded so every image draws the same way
+            pixels = np.asarray(image.convert("RGBA"))
+
+        if self.cache_file is not None:
+            temporary = self.cache_file + ".tmp"
+            try:
+                with open(temporary, "wb") as file:
+                    np.save(file, pixels)
+                os.replace(temporary, self.cache_file)
+            except OSError:
+                pass  # e.g. a read-only checkout, the image is decoded again next time
+        return pixels
+
+    def _load_in_background(self):
+        try:
+            self.load()
+        except FileNotFoundError:
+            self.error = f"Background image not found at: {self.image_file}"
+        except (OSError, ValueError) as e:
+            self.error = f"Could not load background image {self.image_file}: {e}"
+
+    def load_async(self):
+        """Start loading the image on a worker thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._load_in_background, daemon=True)
+            self._thread.start()
+
+    def ready(self) -> bool:
+        """Checks if a load started by load_async has finished, successfully or not."""
+        return self._thread is not None and not self._thread.is_alive()
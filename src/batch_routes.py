@@ -0,0 +1,141 @@
+# Routes many origin-destination pairs from a file, without the GUI
+import argparse
+import contextlib
+import csv
+import json
+import multiprocessing
+import os
+import sys
+from collections import deque
+from itertools import chain, islice
+
+from core import CampusNavCore
+
+# Worker process state. With fork the core is set before the pool starts and
+# inherited copy-on-write; otherwise the pool initializer loads it per process.
+_core = None
+
+def _load_core(map_file: str, features_file: str) -> CampusNavCore:
+    # LocationManager reports progress on stdout, which may be the JSONL output
+    with contextlib.redirect_stdout(sys.stderr):
+        return CampusNavCore(map_file, features_file)
+
+def _init_worker(map_file: str, features_file: str):
+    global _core
+    if _core is None:
+        _core = _load_core(map_file, features_file)
+
+def read_pairs(pairs_file):
+    """Yield the (start, end) pairs of a CSV or JSONL file object.
+
+    CSV files need a header with start and end columns, and JSONL lines are
+    objects with start and end keys. Each end is a location id or name.
+    """
+    first = pairs_file.readline()
+    lines = chain([first], pairs_file)
+    if first.lstrip().startswith("{"):
+        for line in lines:
+            if line.strip():
+                record = json.loads(line)
+                yield record.get("start"), record.get("end")
+    else:
+        for row in csv.DictReader(lines):
+            yield row.get("start"), row.get("end")
+
+def _resolve(core: CampusNavCore, location) -> int:
+    """Return the id of a location given by id or name, raising KeyError if unknown."""
+    if isinstance(location, int):
+        id = location
+    else:
+        try:
+            id = int(location)
+        except (TypeError, ValueError):
+            return core.location_manager.get_location_id(location)
+    if id not in core.graph.paths:
+        raise KeyError(f"Location with ID {id} not found.")
+    return id
+
+def route_pairs(pairs: list) -> list[str]:
+    """Route a chunk of (start, end) pairs in the worker and return one JSON line per pair.
+
+    Pairs are grouped by origin. An origin with several destinations in the
+    chunk is searched once, into a shortest-path tree that answers all of
+    them and is dropped afterwards. Origins with one destination, and any
+    origin on a map too large for a tree to fit the graph's tree budget,
+    use find_route.
+    """
+    groups = {}
+    records = [None] * len(pairs)
+    for index, (start, end) in enumerate(pairs):
+        try:
+            start_id, end_id = _resolve(_core, start), _resolve(_core, end)
+        except KeyError as e:
+            records[index] = {"start": start, "end": end, "error": e.args[0]}
+            continue
+        groups.setdefault(start_id, []).append((index, end_id))
+
+    graph = _core.graph
+    use_trees = _core.route_table is None and graph.node_count <= graph.tree_cache.budget
+    for start_id, group in groups.items():
+        tree = graph.shortest_path_tree(start_id, cache=False) if use_trees and len(group) > 1 else None
+        for index, end_id in group:
+            if tree is not None:
+                path, distance = graph.path_from_tree(start_id, end_id, tree)
+            else:
+                path, distance = _core.find_route(start_id, end_id)
+            # Unreachable pairs have an empty path and no distance
+            records[index] = {"start": start_id, "end": end_id, "path": path,
+                              "distance": distance if path else None, "nodes": len(path)}
+    return [json.dumps(record, separators=(",", ":")) for record in records]
+
+def _chunks(pairs, size: int):
+    pairs = iter(pairs)
+    while chunk := list(islice(pairs, size)):
+        yield chunk
+
+def batch_routes(pairs, map_file: str, features_file: str, workers: int = None, chunk_size: int = 256):
+    """Yield a JSON line for every (start, end) pair, in input order.
+
+    workers is the pool size (None uses every core, 1 runs in-process).
+    Results are streamed as chunks finish and at most two chunks per worker
+    are queued, so pairs can be a generator over a file of any size and
+    memory stays bounded.
+    """
+    global _core
+    _core = _load_core(map_file, features_file)
+    if workers == 1:
+        for chunk in _chunks(pairs, chunk_size):
+            yield from route_pairs(chunk)
+        return
+
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("fork" if "fork" in methods else None)
+    # At most two chunks per worker are in flight, so a slow consumer holds back reading
+    window = 2 * (workers or os.cpu_count() or 1)
+    pending = deque()
+    with context.Pool(workers, initializer=_init_worker, initargs=(map_file, features_file)) as pool:
+        for chunk in _chunks(pairs, chunk_size):
+            pending.append(pool.apply_async(route_pairs, (chunk,)))
+            if len(pending) >= window:
+                yield from pending.popleft().get()
+        while pending:
+            yield from pending.popleft().get()
+
+def main():
+    parser = argparse.ArgumentParser(description="Find routes for many origin-destination pairs.")
+    parser.add_argument("pairs_file", help="CSV with start,end columns or JSONL with start and end keys ('-' for stdin)")
+    parser.add_argument("--output", default="-", help="JSONL file to write ('-' for stdout)")
+    parser.add_argument("--map", default="data/campus_map.json", help="campus map file")
+    parser.add_argument("--features", default="data/location_features.json", help="location features file")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: every core)")
+    parser.add_argument("--chunk-size", type=int, default=256, help="pairs sent to a worker at a time")
+    args = parser.parse_args()
+
+    with contextlib.ExitStack() as stack:
+        pairs_file = sys.stdin if args.pairs_file == "-" else stack.enter_context(open(args.pairs_file, newline=""))
+        output = sys.stdout if args.output == "-" else stack.enter_context(open(args.output, "w"))
+        for line in batch_routes(read_pairs(pairs_file), args.map, args.features, args.workers, args.chunk_size):
+            output.write(line + "\n")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+import time
+
+from data_structures.name_index import NameIndex, normalize
+from data_structures.tree import Tree
+from map_loader import load_map
+from route_table import RouteTable
+from precompute import load_hierarchy
+
+class CampusNavCore:
+    """The campus map, its routing graph and location lookups, without any GUI.
+
+    CampusNavigationApp is a client of this class, and benchmarks and tools
+    can use it directly.
+    """
+
+    def __init__(self, map_file: str = "data/campus_map.json",
+                 features_file: str = "data/location_features.json",
+                 cache_size: int = 128, compact: bool = False):
+        """Load the map and build the graph, indexes and location tree.
+
+        cache_size is passed on to Graph. With compact set, routes are found
+        on an immutable array-backed copy of the graph. load_timings holds
+        the seconds spent in each phase of loading.
+        """
+        self.map_file = map_file
+        # The map is read once, from the compiled binary copy while it is up to date
+        self.location_manager, self.graph, self.load_timings = load_map(
+            map_file, features_file, cache_size=cache_size)
+
+        start = time.perf_counter()
+        # Location coordinates let the graph use A* when its heuristic is admissible
+        self.location_coordinates = {
+            id: self.location_manager.get_location_coordinates(id)
+            for id in self.location_manager.get_location_ids()
+        }
+
+        self.router = self.graph.freeze() if compact else self.graph
+
+        # Precomputed routing data, if `python src/precompute.py` was run for this map
+        self.route_table = RouteTable.load_for_map(map_file)
+        self.graph.hierarchy = load_hierarchy(map_file)
+        self.load_timings["routing data"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        self.location_tree = Tree()
+        self._initialize_location_tree()
+        self.load_timings["location tree"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        # Names and features for searching as the user types, and every name in order for an empty search
+        names = [location["name"] for location in self.location_manager.locations]
+        features = [(feature, name) for name, contents in self.location_manager.location_features.items()
+                    for feature in contents if name in self.location_manager.locations_by_name]
+        self.name_index = NameIndex([(name, name) for name in names] + features)
+        self.sorted_location_names = sorted(names, key=normalize)
+        self.load_timings["search index"] = time.perf_counter() - start
+
+    def _initialize_location_tree(self):
+        """Initialize the tree structure for campus locations."""
+        root = "Campus"
+        self.location_tree.add_node(root)
+
+        # Group locations by their categories from the JSON file
+        categories = {}
+        for location in self.location_manager.locations:
+            category = location.get("category", "Miscellaneous")
+            location_name = location["name"]
+
+            if category not in categories:
+                categories[category] = []
+                self.location_tree.add_node(category)
+                self.location_tree.nodes[root].append(category)
+
+            categories[category].append(location_name)
+            self.location_tree.add_node(location_name)
+            self.location_tree.nodes[category].append(location_name)
+
+    def find_route(self, start_id: int, end_id: int) -> tuple[list[int], int]:
+        """Find the shortest route with the fastest method available.
+
+        Uses the precomputed route table, then the contraction hierarchy,
+        then a search on the graph.
+        """
+        if self.route_table is not None:
+            return self.route_table.find_shortest_path(start_id, end_id)
+        if self.graph.hierarchy is not None:
+            return self.graph.find_shortest_path_ch(start_id, end_id)
+        return self.router.find_shortest_path_astar(start_id, end_id, self.location_coordinates)
+
+    def find_alternative_routes(self, start_id: int, end_id: int, count: int = 3, method: str = "penalty",
+                                primary: tuple[list[int], int] = None) -> list[tuple[list[int], int]]:
+        """Return up to count (route, distance) pairs, shortest first.
+
+        method is "penalty" for the quick penalty method, suited to every
+        route request, or "yen" for the exact k shortest paths. primary is
+        the (route, distance) find_route already returned, which the penalty
+        method starts from instead of searching again.
+        """
+        if method == "yen":
+            return self.graph.find_k_shortest_paths(start_id, end_id, count)
+        return self.graph.find_alternative_routes(start_id, end_id, count, coords=self.location_coordinates,
+                                                  primary=primary)
+
+    def find_route_by_name(self, start_name: str, end_name: str) -> tuple[list[int], int]:
+        """Find the shortest route between two locations given by name."""
+        return self.find_route(self.location_manager.get_location_id(start_name),
+                               self.location_manager.get_location_id(end_name))
+
+    def route_names(self, route: list[int]) -> list[str]:
+        """Return the location names along a route."""
+        return [self.location_manager.get_location_name(id) for id in route]
+
+    def route_coordinates(self, route: list[int]) -> list[tuple[int, int]]:
+        """Return the (x, y) coordinates along a route."""
+        return [self.location_coordinates[id] for id in route]
+
+    def search_location(self, name: str):
+        """Return the location with the given name, or None."""
+        return self.location_manager.search_location(name)
+
+    def search_names(self, query: str, limit: int = 10) -> list[tuple[str, str]]:
+        """Return up to limit (text, location name) matches for a partly typed location or feature name, best first.
+
+        text is the matched location name, or the feature name for a
+        location containing that feature.
+        """
+        return self.name_index.search(query, limit)
+
+    def nearest_location(self, x: float, y: float):
+        """Return the point of interest closest to (x, y), or None."""
+        return self.location_manager.nearest_visible_location(x, y)
+
+    def locations_within(self, x: float, y: float, radius: float) -> list:
+        """Return the points of interest within radius of (x, y), nearest first."""
+        return self.location_manager.visible_locations_within(x, y, radius)
+
+    def nearest_points_of_interest(self, source_id: int, limit: int = None) -> list[tuple[int, str]]:
+        """Return (distance, name) for the points of interest closest by route to source_id."""
+        targets = [location['id'] for location in self.location_manager.get_visible_Locations()
+                   if location['id'] != source_id]
+        nearest = self.graph.distances_from(source_id, targets)[:limit]
+        return [(distance, self.location_manager.get_location_name(id)) for distance, id in nearest]
+
+    def location_info(self, name: str) -> str:
+        """Return the info card text for a location."""
+        text = name + '\n'
+        if name in self.location_manager.location_features:
+            text += '\nContains:'
+            for feature in self.location_manager.location_features[name]:
+                text += '\n- ' + feature
+        else:
+            text += '\nContains no notable\nfeatures or buildings.'
+        return text
@@ -0,0 +1,167 @@
+# Binary Map module
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+MAGIC = b"CNAVMAP1"
+_HEADER_LENGTH = struct.Struct("<I")
+_ALIGNMENT = 8
+
+def _aligned(position: int) -> int:
+    return -(-position // _ALIGNMENT) * _ALIGNMENT
+
+def _numbers(values: list) -> array:
+    """Pack values as 64-bit integers when they all are, otherwise as doubles."""
+    if all(isinstance(value, int) for value in values):
+        return array("q", values)
+    return array("d", values)
+
+class BinaryMap:
+    """A campus map compiled into flat arrays, loaded by memory-mapping the file.
+
+    Every section is a flat array. Per location there are ids, x, y and
+    point_of_interest, plus name and category, which index the string table
+    (category is -1 when a location has none). Per connection there are
+    edge_from, edge_to and edge_distance. The string table is the UTF-8 text
+    of every distinct string in strings, with string_offsets[i] and
+    string_offsets[i + 1] bounding string i.
+
+    The file is MAGIC, the length of a small JSON header (source hash, byte
+    order and where each section is) and the header, followed by the
+    sections, each aligned to 8 bytes. Loading views the sections in place,
+    so nothing is parsed and processes mapping the same file share its pages.
+    """
+
+    def __init__(self, sections: dict, source_hash: str = None, buffer=None):
+        """Initialize the map from its sections, arrays or memoryviews keyed by name."""
+        self.sections = sections
+        self.source_hash = source_hash
+        self._buffer = buffer  # the mapped file, kept open while its sections are in use
+        self.ids = sections["ids"]
+        self.x = sections["x"]
+        self.y = sections["y"]
+        self.point_of_interest = sections["point_of_interest"]
+        self.name = sections["name"]
+        self.category = sections["category"]
+        self.edge_from = sections["edge_from"]
+        self.edge_to = sections["edge_to"]
+        self.edge_distance = sections["edge_distance"]
+        self.strings = sections["strings"]
+        self.string_offsets = sections["string_offsets"]
+
+    @classmethod
+    def from_data(cls, data: dict) -> "BinaryMap":
+        """Compile the parsed contents of a campus_map.json style file."""
+        locations = data.get("locations", [])
+        connections = data.get("connections", [])
+        table = {}
+
+        def intern(text: str) -> int:
+            return table.setdefault(text, len(table))
+
+        sections = {
+            "ids": array("q", [location["id"] for location in locations]),
+            "x": _numbers([location["x"] for location in locations]),
+            "y": _numbers([location["y"] for location in locations]),
+            "point_of_interest": array("b", [bool(location.get("pointOfInterest")) for location in locations]),
+            "name": array("q", [intern(location["name"]) for location in locations]),
+            "category": array("q", [intern(location["category"]) if "category" in location else -1
+                                    for location in locations]),
+            "edge_from": array("q", [connection["from"] for connection in connections]),
+            "edge_to": array("q", [connection["to"] for connection in connections]),
+            "edge_distance": _numbers([connection["distance"] for connection in connections]),
+        }
+        encoded = [text.encode("utf-8") for text in table]
+        offsets = array("q", [0])
+        for text in encoded:
+            offsets.append(offsets[-1] + len(text))
+        sections["strings"] = array("B", b"".join(encoded))
+        sections["string_offsets"] = offsets
+        return cls(sections)
+
+    @classmethod
+    def from_json(cls, json_file: str) -> "BinaryMap":
+        """Compile a campus_map.json style file."""
+        with open(json_file, "r") as file:
+            return cls.from_data(json.load(file))
+
+    def save(self, path: str, source_hash: str = None):
+        """Write the map to a binary file, replacing any previous one in a single step."""
+        layout = {}
+        position = 0
+        for name, values in self.sections.items():
+            typecode = getattr(values, "typecode", None) or values.format
+            layout[name] = [position, typecode, len(values)]
+            position = _aligned(position + len(values) * array(typecode).itemsize)
+        header = json.dumps({
+            "source_hash": source_hash,
+            "byteorder": sys.byteorder,
+            "sections": layout,
+        }).encode("utf-8")
+        start = _aligned(len(MAGIC) + _HEADER_LENGTH.size + len(header))
+
+        temporary = path + ".tmp"
+        with open(temporary, "wb") as file:
+            file.write(MAGIC + _HEADER_LENGTH.pack(len(header)) + header)
+            for name, values in self.sections.items():
+                file.seek(start + layout[name][0])
+                file.write(values.tobytes())
+            file.truncate(start + position)
+        os.replace(temporary, path)
+
+    @classmethod
+    def load(cls, path: str, source_hash: str = None) -> "BinaryMap":
+        """Memory-map a binary map file.
+
+        Returns None if the file is missing or unreadable, was written on a
+        machine of the other byte order, or if source_hash is given and the
+        file was compiled from a different map.
+        """
+        try:
+            with open(path, "rb") as file:
+                buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            if buffer[:len(MAGIC)] != MAGIC:
+                return None
+            (length,) = _HEADER_LENGTH.unpack_from(buffer, len(MAGIC))
+            header_start = len(MAGIC) + _HEADER_LENGTH.size
+            header = json.loads(buffer[header_start:header_start + length])
+            if header["byteorder"] != sys.byteorder:
+                return None
+            if source_hash is not None and header["source_hash"] != source_hash:
+                return None
+
+            start = _aligned(header_start + length)
+            view = memoryview(buffer)
+            sections = {}
+            for name, (offset, typecode, count) in header["sections"].items():
+                begin = start + offset
+                sections[name] = view[begin:begin + count * array(typecode).itemsize].cast(typecode)
+            return cls(sections, header["source_hash"], buffer)
+        except (OSError, ValueError, KeyError, TypeError, struct.error):
+            return None
+
+    def string(self, index: int) -> str:
+        """Return string index of the string table."""
+        return bytes(self.strings[self.string_offsets[index]:self.string_offsets[index + 1]]).decode("utf-8")
+
+    def locations(self) -> list[dict]:
+        """Return the locations as dicts shaped like the entries of campus_map.json."""
+        text = bytes(self.strings)
+        offsets = self.string_offsets.tolist()
+        table = [text[offsets[i]:offsets[i + 1]].decode("utf-8") for i in range(len(offsets) - 1)]
+
+        locations = []
+        for id, name, category, x, y, point_of_interest in zip(
+                self.ids.tolist(), self.name.tolist(), self.category.tolist(),
+                self.x.tolist(), self.y.tolist(), self.point_of_interest.tolist()):
+            location = {"id": id, "name": table[name]}
+            if category >= 0:
+                location["category"] = table[category]
+            location["x"] = x
+            location["y"] = y
+            location["pointOfInterest"] = bool(point_of_interest)
+            locations.append(location)
+        return locations
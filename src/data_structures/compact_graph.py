@@ -0,0 +1,152 @@
+# Compact (CSR) Graph data structure
+import heapq
+import math
+from array import array
+from bisect import bisect_left
+
+class CompactGraph:
+    """An immutable undirected graph stored in compressed sparse row form.
+
+    Node ids are mapped to dense indices 0..n-1. The neighbours of index i are
+    neighbors[offsets[i]:offsets[i + 1]], sorted, with the matching edge
+    weights at the same positions in weights.
+    """
+
+    def __init__(self, ids: list[int], offsets: array, neighbors: array, weights: array):
+        """Initialize the graph from its id list and CSR arrays."""
+        self.ids = ids
+        self.index = {id: i for i, id in enumerate(ids)}
+        self.offsets = offsets
+        self.neighbors = neighbors
+        self.weights = weights
+        self.node_count = len(ids)
+        self.edge_count = len(neighbors) // 2
+        self.settled_count = 0
+        self._scale_coords = None
+        self._scale = None
+
+    @classmethod
+    def from_graph(cls, graph) -> "CompactGraph":
+        """Freeze a Graph's current nodes and edges."""
+        ids = list(graph.paths)
+        index = {id: i for i, id in enumerate(ids)}
+        integral = all(isinstance(weight, int)
+                       for neighbors in graph.paths.values() for weight in neighbors.values())
+
+        offsets = array('q', [0])
+        neighbors = array('q')
+        weights = array('q' if integral else 'd')
+        for id in ids:
+            row = sorted((index[neighbor], weight) for neighbor, weight in graph.paths[id].items())
+            neighbors.extend(i for i, _ in row)
+            weights.extend(weight for _, weight in row)
+            offsets.append(len(neighbors))
+        return cls(ids, offsets, neighbors, weights)
+
+    def __contains__(self, id: int) -> bool:
+        """Checks if id is a node of the graph."""
+        return id in self.index
+
+    def get_edge_weight(self, id_1: int, id_2: int) -> int:
+        try:
+            i, j = self.index[id_1], self.index[id_2]
+        except KeyError:
+            raise KeyError(f'Edge between {id_1} & {id_2} does not exist.')
+        lo, hi = self.offsets[i], self.offsets[i + 1]
+        position = bisect_left(self.neighbors, j, lo, hi)
+        if position == hi or self.neighbors[position] != j:
+            raise KeyError(f'Edge between {id_1} & {id_2} does not exist.')
+        return self.weights[position]
+
+    def find_shortest_path(self, start_id: int, end_id: int) -> tuple[list[int], int]:
+        """Find the shortest path using Dijkstra's algorithm over the CSR arrays."""
+        return self._search(start_id, end_id, None)
+
+    def find_shortest_path_astar(self, start_id: int, end_id: int,
+                                 coords: dict[int, tuple[int, int]]) -> tuple[list[int], int]:
+        """Find the shortest path using A*, as Graph.find_shortest_path_astar does."""
+        scale = self.heuristic_scale(coords)
+        if not scale:
+            return self.find_shortest_path(start_id, end_id)
+
+        ids = self.ids
+        end_x, end_y = coords[end_id]
+        estimates = {}
+
+        def estimate(i: int) -> float:
+            if i not in estimates:
+                x, y = coords[ids[i]]
+                estimates[i] = scale * math.hypot(x - end_x, y - end_y)
+            return estimates[i]
+
+        return self._search(start_id, end_id, estimate)
+
+    def _search(self, start_id: int, end_id: int, estimate) -> tuple[list[int], int]:
+        """Dijkstra, or A* when an estimate function over indices is given."""
+        start, end = self.index[start_id], self.index[end_id]
+        offsets, neighbors, weights = self.offsets, self.neighbors, self.weights
+        distances = [math.inf] * self.node_count
+        previous = array('q', [-1]) * self.node_count
+        distances[start] = 0
+        heap = [(estimate(start) if estimate else 0, 0, start)]
+        self.settled_count = 0
+
+        while heap:
+            _, curr_dis, current = heapq.heappop(heap)
+            if curr_dis > distances[current]:
+                continue  # stale entry, a shorter route was already found
+            self.settled_count += 1
+            if current == end:
+                path = []
+                while current != -1:
+                    path.append(self.ids[current])
+                    current = previous[current]
+                path.reverse()
+                return path, curr_dis
+
+            for position in range(offsets[current], offsets[current + 1]):
+                neighbor = neighbors[position]
+                new_dis = curr_dis + weights[position]
+                if new_dis < distances[neighbor]:
+                    distances[neighbor] = new_dis
+                    previous[neighbor] = current
+                    priority = new_dis + estimate(neighbor) if estimate else new_dis
+                    heapq.heappush(heap, (priority, new_dis, neighbor))
+
+        return [], 10**6
+
+    def heuristic_scale(self, coords: dict[int, tuple[int, int]]) -> float:
+        """Return the A* heuristic factor, as Graph.heuristic_scale does.
+
+        The graph is immutable, so the result is cached per coords mapping.
+        """
+        if self._scale_coords is coords:
+            return self._scale
+
+        scale = math.inf
+        if any(id not in coords for id in self.ids):
+            scale = 0
+        else:
+            points = [coords[id] for id in self.ids]
+            for i in range(self.node_count):
+                x_1, y_1 = points[i]
+                for position in range(self.offsets[i], self.offsets[i + 1]):
+                    x_2, y_2 = points[self.neighbors[position]]
+                    length = math.hypot(x_2 - x_1, y_2 - y_1)
+                    weight = self.weights[position]
+                    if length > 0:
+                        scale = min(scale, weight / length)
+                    elif weight < 0:
+                        scale = 0
+                if scale <= 0:
+                    scale = 0
+                    break
+
+        if scale == math.inf:
+            scale = 0  # no edge with a length to measure against
+        else:
+            scale *= 1 - 1e-9  # guard against float rounding overestimating
+
+        self._scale_coords = coords
+        self._scale = scale
+        return scale
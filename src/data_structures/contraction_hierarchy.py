@@ -0,0 +1,202 @@
+# Contraction Hierarchy module
+import heapq
+import json
+import math
+
+class ContractionHierarchy:
+    """A contraction hierarchy over an undirected weighted graph.
+
+    Nodes are contracted one at a time in order of importance. Contracting a
+    node adds a shortcut between two of its remaining neighbours whenever the
+    route through it is the only shortest one. Each node keeps its edges to
+    higher ranked nodes, so any shortest path is an upward search from the
+    start meeting an upward search from the end, and shortcuts are unpacked
+    back into the original nodes through the node they skip.
+    """
+
+    def __init__(self, rank: dict[int, int], upward: dict[int, dict[int, int]],
+                 middle: dict[tuple[int, int], int]):
+        """Initialize the hierarchy from its node ranks, upward edges and shortcut middles."""
+        self.rank = rank
+        self.upward = upward
+        self.middle = middle
+
+    @classmethod
+    def build(cls, graph, witness_limit: int = 64) -> "ContractionHierarchy":
+        """Contract every node of graph, which must have an undirected paths dict.
+
+        witness_limit caps how many nodes each witness search may settle. A
+        lower limit builds faster but may add shortcuts that are not needed.
+        """
+        remaining = {id: dict(neighbors) for id, neighbors in graph.paths.items()}
+        contracted_neighbors = dict.fromkeys(remaining, 0)
+        rank = {}
+        upward = {}
+        middle = {}
+
+        def priority(id: int) -> int:
+            shortcuts = cls._shortcuts(remaining, id, witness_limit)
+            return len(shortcuts) - len(remaining[id]) + contracted_neighbors[id]
+
+        queue = [(priority(id), id) for id in remaining]
+        heapq.heapify(queue)
+
+        while queue:
+            _, id = heapq.heappop(queue)
+            # Priorities go stale as neighbours are contracted, so recheck lazily
+            current = priority(id)
+            if queue and current > queue[0][0]:
+                heapq.heappush(queue, (current, id))
+                continue
+
+            for id_1, id_2, weight in cls._shortcuts(remaining, id, witness_limit):
+                remaining[id_1][id_2] = weight
+                remaining[id_2][id_1] = weight
+                middle[cls._key(id_1, id_2)] = id
+
+            rank[id] = len(rank)
+            upward[id] = remaining.pop(id)
+            for neighbor in upward[id]:
+                remaining[neighbor].pop(id)
+                contracted_neighbors[neighbor] += 1
+
+        return cls(rank, upward, middle)
+
+    @staticmethod
+    def _key(id_1: int, id_2: int) -> tuple[int, int]:
+        return (id_1, id_2) if id_1 <= id_2 else (id_2, id_1)
+
+    @staticmethod
+    def _shortcuts(remaining: dict[int, dict[int, int]], id: int, witness_limit: int) -> list[tuple[int, int, int]]:
+        """Return the shortcuts needed to contract id, as (id_1, id_2, weight)."""
+        neighbors = remaining[id]
+        shortcuts = []
+        for source, source_weight in neighbors.items():
+            targets = {target: source_weight + weight
+                       for target, weight in neighbors.items() if target != source}
+            if not targets:
+                continue
+
+            # Witness search: shortest distances from source avoiding id
+            limit = max(targets.values())
+            distances = {source: 0}
+            heap = [(0, source)]
+            settled = 0
+            while heap and settled < witness_limit:
+                curr_dis, current = heapq.heappop(heap)
+                if curr_dis > distances[current]:
+                    continue
+                if curr_dis > limit:
+                    break
+                settled += 1
+                for neighbor, weight in remaining[current].items():
+                    new_dis = curr_dis + weight
+                    if neighbor != id and new_dis < distances.get(neighbor, math.inf):
+                        distances[neighbor] = new_dis
+                        heapq.heappush(heap, (new_dis, neighbor))
+
+            for target, weight in targets.items():
+                # Each pair is seen from both ends, keep it once
+                if source < target and distances.get(target, math.inf) > weight:
+                    shortcuts.append((source, target, weight))
+        return shortcuts
+
+    def _upward_search(self, source: int) -> tuple[dict[int, int], dict[int, int]]:
+        """Dijkstra from source over upward edges only."""
+        distances = {source: 0}
+        previous = {source: None}
+        heap = [(0, source)]
+        while heap:
+            curr_dis, current = heapq.heappop(heap)
+            if curr_dis > distances[current]:
+                continue
+            for neighbor, weight in self.upward[current].items():
+                new_dis = curr_dis + weight
+                if new_dis < distances.get(neighbor, math.inf):
+                    distances[neighbor] = new_dis
+                    previous[neighbor] = current
+                    heapq.heappush(heap, (new_dis, neighbor))
+        return distances, previous
+
+    def find_shortest_path(self, start_id: int, end_id: int) -> tuple[list[int], int]:
+        """Find the shortest path, returning the same shape as Graph.find_shortest_path."""
+        if start_id not in self.upward or end_id not in self.upward:
+            raise KeyError(f'{start_id} or {end_id} is not in the hierarchy.')
+
+        forward, forward_previous = self._upward_search(start_id)
+        backward, backward_previous = self._upward_search(end_id)
+
+        best = math.inf
+        meeting = None
+        for id, distance in forward.items():
+            if id in backward and distance + backward[id] < best:
+                best = distance + backward[id]
+                meeting = id
+        if meeting is None:
+            return [], 10**6
+
+        # Hierarchy nodes from start up to the meeting node and back down to end
+        hops = []
+        node = meeting
+        while node is not None:
+            hops.append(node)
+            node = forward_previous[node]
+        hops.reverse()
+        node = backward_previous[meeting]
+        while node is not None:
+            hops.append(node)
+            node = backward_previous[node]
+
+        path = [start_id]
+        for id_1, id_2 in zip(hops, hops[1:]):
+            path.extend(self._unpack(id_1, id_2))
+        return path, best
+
+    def _unpack(self, id_1: int, id_2: int) -> list[int]:
+        """Expand the edge id_1 -> id_2 into original nodes, excluding id_1."""
+        path = []
+        stack = [(id_1, id_2)]
+        while stack:
+            a, b = stack.pop()
+            skipped = self.middle.get(self._key(a, b))
+            if skipped is None:
+                path.append(b)
+            else:
+                stack.append((skipped, b))
+                stack.append((a, skipped))
+        return path
+
+    def save(self, path: str, source_hash: str = None):
+        """Write the hierarchy to a JSON file."""
+        with open(path, "w") as file:
+            json.dump({
+                "source_hash": source_hash,
+                "rank": list(self.rank.items()),
+                "upward": [[id_1, id_2, weight]
+                           for id_1, neighbors in self.upward.items()
+                           for id_2, weight in neighbors.items()],
+                "middle": [[id_1, id_2, id] for (id_1, id_2), id in self.middle.items()],
+            }, file, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, path: str, source_hash: str = None) -> "ContractionHierarchy":
+        """Read a hierarchy from a JSON file.
+
+        Returns None if the file is missing or unreadable, or if source_hash
+        is given and the hierarchy was built from a different map.
+        """
+        try:
+            with open(path, "r") as file:
+                data = json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+        if source_hash is not None and data.get("source_hash") != source_hash:
+            return None
+
+        rank = {id: r for id, r in data["rank"]}
+        upward = {id: {} for id in rank}
+        for id_1, id_2, weight in data["upward"]:
+            upward[id_1][id_2] = weight
+        middle = {(id_1, id_2): id for id_1, id_2, id in data["middle"]}
+        return cls(rank, upward, middle)
@@ -1,13 +1,30 @@
 # An Undirected Graph data structure
 import heapq
 import json
+import math
+from collections import Counter
+
+from .compact_graph import CompactGraph
+from .contraction_hierarchy import ContractionHierarchy
+from .route_cache import RouteCache, ShortestPathTreeCache
 
 class Graph:
-    def __init__(self):
-        """Initialize the graph."""
+    def __init__(self, cache_size: int = 128, tree_budget: int = 200_000):
+        """Initialize the graph.
+
+        cache_size is how many routes to cache and tree_budget how many nodes
+        the cached shortest-path trees may hold in total (0 disables either).
+        """
         self.paths = dict[int, dict[int, int]]()
         self.node_count = 0
         self.edge_count = 0
+        self.version = 0
+        self.route_cache = RouteCache(cache_size)
+        self.tree_cache = ShortestPathTreeCache(tree_budget)
+        self.settled_count = 0
+        self._scale_coords = None
+        self._scale = None
+        self.hierarchy = None
 
     def add_node(self, id: int):
         """Add a new node to the graph."""
@@ -15,6 +32,7 @@ class Graph:
             raise ValueError(f'{id} is already a node.')
         self.paths[id] = dict()
         self.node_count += 1
+        self._graph_changed()
 
     def add_edge(self, id_1: int, id_2: int, weight:int):
         """Add a bidirectional edge between two nodes."""
@@ -27,6 +45,44 @@ class Graph:
         self.paths[id_2][id_1] = weight
 
         self.edge_count += 1
+        self._graph_changed()
+
+    def add_edges(self, from_ids, to_ids, weights):
+        """Add many bidirectional edges, given as parallel sequences of ends and weights.
+
+        Every end is checked in a single pass before anything is added, so
+        an invalid edge leaves the graph unchanged.
+        """
+        from_ids, to_ids, weights = list(from_ids), list(to_ids), list(weights)
+        if not len(from_ids) == len(to_ids) == len(weights):
+            raise ValueError('from_ids, to_ids and weights must have the same length.')
+        missing = (set(from_ids) | set(to_ids)) - self.paths.keys()
+        if missing:
+            raise ValueError(f'{sorted(missing)[0]} is not a valid node.')
+
+        paths = self.paths
+        for id_1, id_2, weight in zip(from_ids, to_ids, weights):
+            paths[id_1][id_2] = weight
+            paths[id_2][id_1] = weight
+
+        self.edge_count += len(weights)
+        self._graph_changed()
+
+    @classmethod
+    def from_arrays(cls, ids, from_ids, to_ids, weights, **kwargs) -> "Graph":
+        """Build a graph from node ids and parallel edge sequences.
+
+        kwargs are passed on to the constructor.
+        """
+        ids = list(ids)
+        graph = cls(**kwargs)
+        graph.paths = {id: {} for id in ids}
+        graph.node_count = len(graph.paths)
+        if graph.node_count != len(ids):
+            duplicate = next(id for id, count in Counter(ids).items() if count > 1)
+            raise ValueError(f'{duplicate} is already a node.')
+        graph.add_edges(from_ids, to_ids, weights)
+        return graph
 
     def remove_node(self, id: int):
         """Remove a node and all connected edges."""
@@ -36,12 +92,21 @@ class Graph:
             self.paths[node].pop(id)
 
         self.node_count -= 1
+        self._graph_changed()
 
     def remove_edge(self, id_1: int, id_2: int):
         self.paths[id_1].pop(id_2)
         self.paths[id_2].pop(id_1)
 
         self.edge_count -= 1
+        self._graph_changed()
+
+    def _graph_changed(self):
+        """Drop anything derived from the current nodes and edges."""
+        self.version += 1
+        self._scale_coords = None
+        self._scale = None
+        self.hierarchy = None
 
     def get_edge_weight(self, id_1:int, id_2:int) -> int:
         try:
@@ -50,26 +115,520 @@ class Graph:
             raise KeyError(f'Edge between {id_1} & {id_2} does not exist.')
 
     def find_shortest_path(self, start_id: int, end_id: int) -> tuple[list[int], int]:
-        """Find the shortest path using Dijkstra like BFS"""
-        heap = [(0, start_id, [start_id])]
-        visited = set()
+        """Find the shortest path using Dijkstra's algorithm.
+
+        Only the best known distance and predecessor of each node are kept,
+        so heap entries stay constant size and the path is rebuilt once the
+        end node is settled. Results are served from the route cache when
+        the same pair was asked for since the graph last changed, or walked
+        from a cached shortest-path tree of either end.
+        """
+        cached = self._cached_route(start_id, end_id)
+        if cached is not None:
+            return cached
+
+        path, distance = self._dijkstra(start_id, end_id)
+        self.route_cache.put(start_id, end_id, path, distance, self.version)
+        return path, distance
+
+    def _cached_route(self, start_id: int, end_id: int):
+        """Return a route from the route cache or a cached tree, or None."""
+        cached = self.route_cache.get(start_id, end_id, self.version)
+        if cached is None:
+            # The graph is undirected, so a tree from either end will do
+            for source_id, target_id in ((start_id, end_id), (end_id, start_id)):
+                if source_id in self.tree_cache:
+                    tree = self.tree_cache.get(source_id, self.version)
+                    if tree is not None:
+                        path, distance = self._walk_tree(tree, target_id)
+                        if source_id != start_id:
+                            path.reverse()
+                        cached = path, distance
+                        break
+        if cached is not None:
+            self.settled_count = 0
+        return cached
+
+    def _dijkstra(self, start_id: int, end_id: int) -> tuple[list[int], int]:
+        """Uncached Dijkstra search behind find_shortest_path."""
+        distances = {start_id: 0}
+        previous = {start_id: None}
+        heap = [(0, start_id)]
+        self.settled_count = 0
+
+        while heap:
+            curr_dis, current = heapq.heappop(heap)
+            if curr_dis > distances[current]:
+                continue  # stale entry, a shorter route was already found
+            self.settled_count += 1
+            if current == end_id:
+                return self._build_path(previous, end_id), curr_dis
+
+            for neighbor, edge_weight in self.paths[current].items():
+                new_dis = curr_dis + edge_weight
+                if neighbor not in distances or new_dis < distances[neighbor]:
+                    distances[neighbor] = new_dis
+                    previous[neighbor] = current
+                    heapq.heappush(heap, (new_dis, neighbor))
+
+        return [], 10**6
+
+    def find_shortest_path_astar(self, start_id: int, end_id: int,
+                                 coords: dict[int, tuple[int, int]]) -> tuple[list[int], int]:
+        """Find the shortest path using A* with a straight-line heuristic.
+
+        coords maps every node id to its (x, y) position. The straight-line
+        distance is scaled into edge-weight units by the largest factor that
+        never overestimates any edge. If no such factor exists (missing
+        coordinates, or an edge shorter than a positive multiple of its
+        straight-line length) this falls back to find_shortest_path.
+        """
+        scale = self.heuristic_scale(coords)
+        if not scale:
+            return self.find_shortest_path(start_id, end_id)
+
+        cached = self._cached_route(start_id, end_id)
+        if cached is not None:
+            return cached
+
+        path, distance = self._astar(start_id, end_id, coords, scale)
+        self.route_cache.put(start_id, end_id, path, distance, self.version)
+        return path, distance
+
+    def _astar(self, start_id: int, end_id: int, coords: dict[int, tuple[int, int]],
+               scale: float) -> tuple[list[int], int]:
+        """Uncached A* search behind find_shortest_path_astar."""
+        end_x, end_y = coords[end_id]
+
+        def estimate(id: int) -> float:
+            x, y = coords[id]
+            return scale * math.hypot(x - end_x, y - end_y)
+
+        distances = {start_id: 0}
+        previous = {start_id: None}
+        heap = [(estimate(start_id), 0, start_id)]
+        self.settled_count = 0
+
+        while heap:
+            _, curr_dis, current = heapq.heappop(heap)
+            if curr_dis > distances[current]:
+                continue  # stale entry, a shorter route was already found
+            self.settled_count += 1
+            if current == end_id:
+                return self._build_path(previous, end_id), curr_dis
+
+            for neighbor, edge_weight in self.paths[current].items():
+                new_dis = curr_dis + edge_weight
+                if neighbor not in distances or new_dis < distances[neighbor]:
+                    distances[neighbor] = new_dis
+                    previous[neighbor] = current
+                    heapq.heappush(heap, (new_dis + estimate(neighbor), new_dis, neighbor))
+
+        return [], 10**6
+
+    def heuristic_scale(self, coords: dict[int, tuple[int, int]]) -> float:
+        """Return the factor turning straight-line distance into edge-weight units.
+
+        The factor is the smallest weight / length ratio over all edges, which
+        keeps the A* heuristic admissible and consistent. Returns 0 when the
+        check fails and A* would not be safe or useful. The result is cached
+        until the graph changes or a different coords mapping is passed.
+        """
+        if self._scale_coords is coords:
+            return self._scale
+
+        scale = math.inf
+        for id_1, neighbors in self.paths.items():
+            if id_1 not in coords:
+                scale = 0
+                break
+            x_1, y_1 = coords[id_1]
+            for id_2, weight in neighbors.items():
+                if id_2 not in coords:
+                    scale = 0
+                    break
+                x_2, y_2 = coords[id_2]
+                length = math.hypot(x_2 - x_1, y_2 - y_1)
+                if length > 0:
+                    scale = min(scale, weight / length)
+                elif weight < 0:
+                    scale = 0
+            if scale <= 0:
+                scale = 0
+                break
+
+        if scale == math.inf:
+            scale = 0  # no edge with a length to measure against
+        else:
+            scale *= 1 - 1e-9  # guard against float rounding overestimating
+
+        self._scale_coords = coords
+        self._scale = scale
+        return scale
+
+    def find_shortest_path_bidirectional(self, start_id: int, end_id: int) -> tuple[list[int], int]:
+        """Find the shortest path with Dijkstra searches from both ends.
+
+        The graph is undirected, so the backward search walks the same edges.
+        Each step advances the side whose next node is closer, and the search
+        stops once the two frontiers' smallest distances add up to at least
+        the best route found where they meet.
+        """
+        if start_id == end_id:
+            self.settled_count = 1
+            return [start_id], 0
+
+        distances = ({start_id: 0}, {end_id: 0})
+        previous = ({start_id: None}, {end_id: None})
+        heaps = ([(0, start_id)], [(0, end_id)])
+        settled = (set(), set())
+        best = math.inf
+        meeting = None
+        self.settled_count = 0
+
+        while heaps[0] and heaps[1]:
+            if heaps[0][0][0] + heaps[1][0][0] >= best:
+                break
+            side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+            curr_dis, current = heapq.heappop(heaps[side])
+            if current in settled[side]:
+                continue  # stale entry, already settled
+            settled[side].add(current)
+            self.settled_count += 1
+
+            dist, other_dist = distances[side], distances[1 - side]
+            for neighbor, edge_weight in self.paths[current].items():
+                new_dis = curr_dis + edge_weight
+                if neighbor not in dist or new_dis < dist[neighbor]:
+                    dist[neighbor] = new_dis
+                    previous[side][neighbor] = current
+                    heapq.heappush(heaps[side], (new_dis, neighbor))
+                if neighbor in other_dist and dist[neighbor] + other_dist[neighbor] < best:
+                    best = dist[neighbor] + other_dist[neighbor]
+                    meeting = neighbor
+
+        if meeting is None:
+            return [], 10**6
+
+        path = self._build_path(previous[0], meeting)
+        node = previous[1][meeting]
+        while node is not None:
+            path.append(node)
+            node = previous[1][node]
+        return path, best
+
+    def freeze(self) -> CompactGraph:
+        """Return an immutable, array-backed copy of the graph."""
+        return CompactGraph.from_graph(self)
+
+    def build_contraction_hierarchy(self, witness_limit: int = 64) -> ContractionHierarchy:
+        """Preprocess the graph into a contraction hierarchy for fast queries.
+
+        The hierarchy is kept in self.hierarchy until the graph changes.
+        """
+        self.hierarchy = ContractionHierarchy.build(self, witness_limit)
+        return self.hierarchy
+
+    def find_shortest_path_ch(self, start_id: int, end_id: int) -> tuple[list[int], int]:
+        """Find the shortest path using the contraction hierarchy.
+
+        Falls back to find_shortest_path when no hierarchy is loaded.
+        """
+        if self.hierarchy is None:
+            return self.find_shortest_path(start_id, end_id)
+        return self.hierarchy.find_shortest_path(start_id, end_id)
+
+    def shortest_path_tree(self, source_id: int, cache: bool = True) -> tuple[dict[int, int], dict[int, int]]:
+        """Run Dijkstra from source_id to every reachable node.
+
+        Returns (distances, previous). Both dicts are filled in the order the
+        nodes were settled, so every node appears after its predecessor.
+        With cache set the tree is kept in the tree cache and reused, so the
+        returned dicts must not be modified.
+        """
+        if cache:
+            tree = self.tree_cache.get(source_id, self.version)
+            if tree is not None:
+                return tree
+
+        tree = self._shortest_path_tree(source_id)
+        if cache:
+            self.tree_cache.put(source_id, *tree, self.version)
+        return tree
+
+    def path_from_tree(self, source_id: int, target_id: int, tree=None) -> tuple[list[int], int]:
+        """Find the shortest path by walking source_id's shortest-path tree.
+
+        The tree is built on first use and cached, so later queries from the
+        same source to any target need no search. A tree already returned by
+        shortest_path_tree(source_id) can be passed in instead.
+        """
+        return self._walk_tree(tree if tree is not None else self.shortest_path_tree(source_id), target_id)
+
+    def distances_from(self, source_id: int, target_ids) -> list[tuple[int, int]]:
+        """Return (distance, id) for every reachable target, nearest first."""
+        distances, _ = self.shortest_path_tree(source_id)
+        return sorted((distances[id], id) for id in target_ids if id in distances)
+
+    def distance_matrix(self, source_ids, target_ids, workers: int = 1):
+        """Return a NumPy matrix of the shortest distances from every source to every target.
+
+        matrix[i, j] is the distance from source_ids[i] to target_ids[j], or
+        inf when there is no route. Each distinct source is searched once,
+        from its cached tree if there is one, and a search stops as soon as
+        every target is settled. The graph is undirected, so when there are
+        fewer distinct targets than sources the searches run from the targets.
+        workers > 1 spreads the searches over a process pool (None uses every
+        core).
+        """
+        import numpy as np
+
+        source_ids, target_ids = list(source_ids), list(target_ids)
+        for id in source_ids + target_ids:
+            if id not in self.paths:
+                raise KeyError(f'{id} is not a valid node.')
+
+        sources = list(dict.fromkeys(source_ids))
+        targets = list(dict.fromkeys(target_ids))
+        transpose = len(targets) < len(sources)
+        origins, ends = (targets, sources) if transpose else (sources, targets)
+
+        if workers == 1 or len(origins) < 2:
+            rows = [self._distance_row(origin, ends) for origin in origins]
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_matrix_worker,
+                                     initargs=(self, ends)) as pool:
+                rows = list(pool.map(_matrix_row, origins, chunksize=max(1, len(origins) // 64)))
+
+        matrix = np.array(rows, dtype=float).reshape(len(origins), len(ends))
+        if transpose:
+            matrix = matrix.T
+
+        # Back to the order asked for, repeating duplicated ids
+        source_index = {id: i for i, id in enumerate(sources)}
+        target_index = {id: i for i, id in enumerate(targets)}
+        return matrix[np.ix_([source_index[id] for id in source_ids],
+                             [target_index[id] for id in target_ids])]
+
+    def _distance_row(self, source_id: int, target_ids: list[int]) -> list[float]:
+        """Distances from source_id to each target, inf where unreachable."""
+        tree = self.tree_cache.get(source_id, self.version) if source_id in self.tree_cache else None
+        distances = tree[0] if tree is not None else self._distances_to(source_id, target_ids)
+        return [distances.get(id, math.inf) for id in target_ids]
+
+    def _distances_to(self, source_id: int, target_ids: list[int]) -> dict[int, int]:
+        """Run Dijkstra from source_id until every target is settled, returning the settled distances."""
+        remaining = set(target_ids)
+        distances = {}
+        best = {source_id: 0}
+        heap = [(0, source_id)]
+
+        while heap and remaining:
+            curr_dis, current = heapq.heappop(heap)
+            if current in distances:
+                continue  # stale entry, already settled
+            distances[current] = curr_dis
+            remaining.discard(current)
+
+            for neighbor, edge_weight in self.paths[current].items():
+                new_dis = curr_dis + edge_weight
+                if neighbor not in best or new_dis < best[neighbor]:
+                    best[neighbor] = new_dis
+                    heapq.heappush(heap, (new_dis, neighbor))
+
+        self.settled_count = len(distances)
+        return distances
+
+    def find_k_shortest_paths(self, start_id: int, end_id: int, k: int) -> list[tuple[list[int], int]]:
+        """Find up to k shortest loopless paths, shortest first, using Yen's algorithm.
+
+        Each later path deviates from an earlier one at a spur node, avoiding
+        the earlier path's nodes before the spur and the edges taken from it.
+        Every spur search is an A* guided by end_id's cached shortest-path
+        tree. Its distances to end_id are exact in the full graph and can only
+        grow once nodes and edges are avoided, so the searches go almost
+        straight to end_id.
+        """
+        to_end, towards_end = self.shortest_path_tree(end_id)
+        if start_id not in to_end or k < 1:
+            return []
+
+        # end_id's tree points every node one step closer to end_id
+        first = [start_id]
+        while first[-1] != end_id:
+            first.append(towards_end[first[-1]])
+        paths = [(first, to_end[start_id])]
+        candidates = []
+        seen = {tuple(first)}
+
+        while len(paths) < k:
+            last, _ = paths[-1]
+            root_distance = 0
+            for i, spur_id in enumerate(last[:-1]):
+                root = last[:i + 1]
+                taken = {path[i + 1] for path, _ in paths if path[:i + 1] == root}
+                spur_path, spur_distance = self._guided_search(spur_id, end_id, to_end.get,
+                                                               avoid_nodes=set(root[:-1]), avoid_next=taken)
+                if spur_path:
+                    path = root[:-1] + spur_path
+                    if tuple(path) not in seen:
+                        seen.add(tuple(path))
+                        heapq.heappush(candidates, (root_distance + spur_distance, path))
+                root_distance += self.paths[spur_id][last[i + 1]]
+
+            if not candidates:
+                break
+            distance, path = heapq.heappop(candidates)
+            paths.append((path, distance))
+        return paths
+
+    def find_alternative_routes(self, start_id: int, end_id: int, count: int = 3, penalty: float = 1.5,
+                                coords: dict[int, tuple[int, int]] = None,
+                                primary: tuple[list[int], int] = None) -> list[tuple[list[int], int]]:
+        """Find up to count distinct routes with the penalty method, shortest first.
+
+        After each route is found the weights of its edges are multiplied by
+        penalty and the search is repeated, which steers later routes onto
+        different streets. This is cheaper than find_k_shortest_paths and
+        gives routes that differ more, but they are not guaranteed to be the
+        next shortest. Distances are reported in the real weights.
+
+        primary is the shortest route as (path, distance) when the caller
+        has already found it, so its search is not repeated. The searches
+        are A* guided by end_id's cached shortest-path tree if there is one,
+        otherwise by the straight-line estimate from coords when given.
+        """
+        if count < 1:
+            return []
+        estimate = self._estimate_to(end_id, coords)
+
+        routes = []
+        seen = set()
+        penalties = {}
+        # Popular edges may keep reappearing, so allow a few extra searches
+        for _ in range(2 * count):
+            if primary is not None:
+                path, distance = primary
+                primary = None
+            else:
+                path, _ = self._guided_search(start_id, end_id, estimate, penalties=penalties)
+                distance = sum(self.paths[a][b] for a, b in zip(path, path[1:]))
+            if not path:
+                break  # unreachable
+            if tuple(path) not in seen:
+                seen.add(tuple(path))
+                routes.append((path, distance))
+                if len(routes) == count:
+                    break
+            for a, b in zip(path, path[1:]):
+                edge = (a, b) if a <= b else (b, a)
+                penalties[edge] = penalties.get(edge, 1) * penalty
+        return sorted(routes, key=lambda route: route[1])
+
+    def _estimate_to(self, end_id: int, coords: dict[int, tuple[int, int]] = None):
+        """Return a function giving a lower bound on each node's distance to end_id.
+
+        The bound is exact when end_id's shortest-path tree is cached, and
+        then None for nodes that cannot reach end_id. Otherwise it is the
+        straight-line estimate if coords allow A*, or else 0.
+        """
+        if end_id in self.tree_cache:
+            tree = self.tree_cache.get(end_id, self.version)
+            if tree is not None:
+                return tree[0].get
+        scale = self.heuristic_scale(coords) if coords else 0
+        if not scale:
+            return lambda id: 0
+        end_x, end_y = coords[end_id]
+        return lambda id: scale * math.hypot(coords[id][0] - end_x, coords[id][1] - end_y)
+
+    def _guided_search(self, start_id: int, end_id: int, estimate, avoid_nodes=(),
+                       avoid_next=(), penalties: dict[tuple[int, int], float] = None) -> tuple[list[int], int]:
+        """A* from start_id to end_id, with estimate(id) bounding the distance left from below.
+
+        estimate returns None for nodes known not to reach end_id, which are
+        skipped. Nodes in avoid_nodes are skipped too, as are the edges from
+        start_id to the nodes in avoid_next. penalties multiplies the weights
+        of edges keyed by (smaller id, larger id). None of these can shorten
+        a route, so the estimate stays a lower bound. The returned distance
+        includes the penalties.
+        """
+        distances = {start_id: 0}
+        previous = {start_id: None}
+        start_estimate = estimate(start_id)
+        if start_estimate is None:
+            return [], 10**6
+        heap = [(start_estimate, 0, start_id)]
+        self.settled_count = 0
 
         while heap:
-            curr_dis, current, path = heapq.heappop(heap)
+            _, curr_dis, current = heapq.heappop(heap)
+            if curr_dis > distances[current]:
+                continue  # stale entry, a shorter route was already found
+            self.settled_count += 1
             if current == end_id:
-                return path, curr_dis
-            
-            if current in visited:
-                continue
-            visited.add(current)
+                return self._build_path(previous, end_id), curr_dis
 
-            for neighbor in self.paths[current]:
-                if neighbor not in visited:
-                    edge_weight = self.get_edge_weight(current, neighbor)
-                    heapq.heappush(heap, (curr_dis + edge_weight, neighbor, path + [neighbor]))
+            for neighbor, edge_weight in self.paths[current].items():
+                if neighbor in avoid_nodes:
+                    continue
+                if current == start_id and neighbor in avoid_next:
+                    continue
+                remaining = estimate(neighbor)
+                if remaining is None:
+                    continue
+                if penalties:
+                    edge_weight *= penalties.get((current, neighbor) if current <= neighbor
+                                                 else (neighbor, current), 1)
+                new_dis = curr_dis + edge_weight
+                if neighbor not in distances or new_dis < distances[neighbor]:
+                    distances[neighbor] = new_dis
+                    previous[neighbor] = current
+                    heapq.heappush(heap, (new_dis + remaining, new_dis, neighbor))
 
         return [], 10**6
 
+    def _walk_tree(self, tree: tuple[dict[int, int], dict[int, int]], target_id: int) -> tuple[list[int], int]:
+        distances, previous = tree
+        if target_id not in distances:
+            return [], 10**6
+        return self._build_path(previous, target_id), distances[target_id]
+
+    def _shortest_path_tree(self, source_id: int) -> tuple[dict[int, int], dict[int, int]]:
+        """Uncached search behind shortest_path_tree."""
+        distances = {}
+        previous = {}
+        best = {source_id: 0}
+        parents = {source_id: None}
+        heap = [(0, source_id)]
+
+        while heap:
+            curr_dis, current = heapq.heappop(heap)
+            if current in distances:
+                continue  # stale entry, already settled
+            distances[current] = curr_dis
+            previous[current] = parents[current]
+
+            for neighbor, edge_weight in self.paths[current].items():
+                new_dis = curr_dis + edge_weight
+                if neighbor not in best or new_dis < best[neighbor]:
+                    best[neighbor] = new_dis
+                    parents[neighbor] = current
+                    heapq.heappush(heap, (new_dis, neighbor))
+
+        return distances, previous
+
+    def _build_path(self, previous: dict[int, int], end_id: int) -> list[int]:
+        """Walk the predecessor map back from end_id to rebuild a path."""
+        path = []
+        node = end_id
+        while node is not None:
+            path.append(node)
+            node = previous[node]
+        path.reverse()
+        return path
+
     def __str__(self):
         s = ''
         for node in self.paths:
@@ -82,10 +641,30 @@ class Graph:
             with open(json_file, "r") as file:
                 data = json.load(file)
                 connections = data.get("connections", [])
-                for connection in connections:
-                    self.add_edge(connection['from'], connection['to'], connection['distance'])
+            self.add_edges([connection['from'] for connection in connections],
+                           [connection['to'] for connection in connections],
+                           [connection['distance'] for connection in connections])
             print('Graph built successfully from JSON.')
         except json.JSONDecodeError:
             print(f"Error decoding JSON from {json_file}. Graph will have no connections.")
         except FileNotFoundError:
-            print(f"JSON file {json_file} not found.")
\ No newline at end of file
+            print(f"JSON file {json_file} not found.")
+
+    def load_from_binary(self, binary_map):
+        """Load the edges of a memory-mapped BinaryMap, as load_from_json does for the JSON file."""
+        self.add_edges(binary_map.edge_from.tolist(), binary_map.edge_to.tolist(),
+                       binary_map.edge_distance.tolist())
+        print('Graph built successfully from binary map.')
+
+
+# Worker process state for distance_matrix, set once per process by the pool initializer
+_matrix_graph = None
+_matrix_targets = None
+
+def _init_matrix_worker(graph: Graph, target_ids: list[int]):
+    global _matrix_graph, _matrix_targets
+    _matrix_graph = graph
+    _matrix_targets = target_ids
+
+def _matrix_row(source_id: int) -> list[float]:
+    return _matrix_graph._distance_row(source_id, _matrix_targets)
@@ -0,0 +1,82 @@
+# KD-Tree module
+
+class KDTree:
+    """A static 2-d tree over (x, y) points, each carrying an item.
+
+    The tree is stored implicitly: the median point of a range is kept at the
+    middle of that range, with lower points on the left and higher on the
+    right, alternating between splitting on x and on y.
+    """
+
+    def __init__(self, points: list[tuple[float, float, object]] = ()):
+        """Build the tree from (x, y, item) tuples."""
+        self.points = list(points)
+        self._build(0, len(self.points), 0)
+
+    def _build(self, lo: int, hi: int, axis: int):
+        """Arrange points[lo:hi] so its median on axis sits in the middle."""
+        if hi - lo <= 1:
+            return
+        self.points[lo:hi] = sorted(self.points[lo:hi], key=lambda point: point[axis])
+        mid = (lo + hi) // 2
+        self._build(lo, mid, 1 - axis)
+        self._build(mid + 1, hi, 1 - axis)
+
+    def __len__(self):
+        """Return the number of points in the tree."""
+        return len(self.points)
+
+    def nearest(self, x: float, y: float):
+        """Return the item closest to (x, y), or None if the tree is empty."""
+        points = self.points
+        best_item = None
+        best_dis = float('inf')
+        # Each entry is a range still to search and a lower bound on its distance
+        stack = [(0, len(points), 0, 0)]
+
+        while stack:
+            lo, hi, axis, bound = stack.pop()
+            if lo >= hi or bound >= best_dis:
+                continue
+            mid = (lo + hi) // 2
+            px, py, item = points[mid]
+            dis = (px - x) ** 2 + (py - y) ** 2
+            if dis < best_dis:
+                best_dis = dis
+                best_item = item
+
+            diff = (x - px) if axis == 0 else (y - py)
+            if diff < 0:
+                stack.append((mid + 1, hi, 1 - axis, diff * diff))
+                stack.append((lo, mid, 1 - axis, 0))
+            else:
+                stack.append((lo, mid, 1 - axis, diff * diff))
+                stack.append((mid + 1, hi, 1 - axis, 0))
+
+        return best_item
+
+    def within_radius(self, x: float, y: float, radius: float) -> list:
+        """Return the items within radius of (x, y), nearest first."""
+        points = self.points
+        radius_sq = radius * radius
+        found = []
+        stack = [(0, len(points), 0)]
+
+        while stack:
+            lo, hi, axis = stack.pop()
+            if lo >= hi:
+                continue
+            mid = (lo + hi) // 2
+            px, py, item = points[mid]
+            dis = (px - x) ** 2 + (py - y) ** 2
+            if dis <= radius_sq:
+                found.append((dis, mid, item))
+
+            diff = (x - px) if axis == 0 else (y - py)
+            if diff <= radius:
+                stack.append((lo, mid, 1 - axis))
+            if diff >= -radius:
+                stack.append((mid + 1, hi, 1 - axis))
+
+        found.sort(key=lambda entry: entry[:2])
+        return [item for _, _, item in found]
@@ -0,0 +1,152 @@
+# Name Index module
+import heapq
+import re
+from bisect import bisect_left
+from collections import Counter
+
+# Trigrams shared by more entries than this are too common to pick fuzzy candidates
+_MAX_POSTING = 5000
+
+def normalize(text: str) -> str:
+    """Return text in lower case with every run of other characters than letters and digits as one space."""
+    return re.sub(r"[^0-9a-z]+", " ", text.casefold()).strip()
+
+def trigrams(key: str) -> set[str]:
+    """Return the three-character pieces of a normalized key, padded so word starts count."""
+    padded = f" {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+def prefix_distance(query: str, text: str, limit: int) -> int:
+    """Return the fewest edits turning query into some prefix of text, or limit + 1 if that is more than limit.
+
+    Only prefixes within limit characters of the query's length can be close
+    enough, so text is cut there and one table gives them all. Cells more
+    than limit off the diagonal cannot be within limit either, so each row
+    only fills the band around it.
+    """
+    text = text[:len(query) + limit]
+    over = limit + 1
+    previous = [j if j <= limit else over for j in range(len(text) + 1)]
+    for i, char in enumerate(query, 1):
+        low, high = max(1, i - limit), min(len(text), i + limit)
+        current = [over] * (len(text) + 1)
+        if i <= limit:
+            current[0] = i
+        for j in range(low, high + 1):
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char != text[j - 1]), over)
+        if min(current[low - 1:high + 1]) > limit:
+            return over
+        previous = current
+    return min(previous[max(0, len(query) - limit):] + [over])
+
+class NameIndex:
+    """Prefix and fuzzy search over names, each pointing at a value.
+
+    Entries are (text, value) pairs, such as a location name and the
+    location, or a feature and the location containing it. Normalized texts
+    are kept in one sorted array and the text from each later word on in
+    another, so a prefix of the whole text or of any word is found with
+    bisect in O(log n). Queries without any such match fall back to fuzzy
+    matching: entries sharing enough trigrams with the query to be within a
+    few edits of it are ranked by the edit distance from the query to the
+    start of their closest word.
+    """
+
+    def __init__(self, entries):
+        """Build the index from (text, value) pairs, dropping repeated pairs."""
+        self.entries = list(dict.fromkeys(entries))
+        self.keys = [normalize(text) for text, _ in self.entries]
+
+        names, words = [], []
+        self.postings = {}
+        for i, key in enumerate(self.keys):
+            names.append((key, i))
+            for match in re.finditer(r" (?=\S)", key):
+                words.append((key[match.end():], i))
+            for trigram in trigrams(key):
+                self.postings.setdefault(trigram, []).append(i)
+        names.sort()
+        words.sort()
+        self._names = [key for key, _ in names]
+        self._name_owners = [i for _, i in names]
+        self._words = [key for key, _ in words]
+        self._word_owners = [i for _, i in words]
+
+    def __len__(self):
+        """Return the number of entries."""
+        return len(self.entries)
+
+    @staticmethod
+    def _prefixed(keys: list[str], owners: list[int], prefix: str):
+        """Yield the owners of keys starting with prefix, in key order."""
+        i = bisect_left(keys, prefix)
+        while i < len(keys) and keys[i].startswith(prefix):
+            yield owners[i]
+            i += 1
+
+    def search(self, query: str, limit: int = 10) -> list[tuple]:
+        """Return up to limit (text, value) entries matching query, best first.
+
+        Texts equal to the query come first, then texts starting with it,
+        then texts with a word starting with it, each in alphabetical order.
+        When no text or word starts with the query, close misspellings are
+        returned instead, nearest first.
+        """
+        query = normalize(query)
+        if not query or limit <= 0:
+            return []
+
+        # A text equal to the query sorts before every longer text it starts
+        found = []
+        for i in self._prefixed(self._names, self._name_owners, query):
+            found.append(i)
+            if len(found) == limit:
+                break
+        seen = set(found)
+        if len(found) < limit:
+            for i in self._prefixed(self._words, self._word_owners, query):
+                if i not in seen:
+                    found.append(i)
+                    seen.add(i)
+                    if len(found) == limit:
+                        break
+        if not found and len(query) >= 3:
+            found = self._fuzzy(query, limit)
+        return [self.entries[i] for i in found[:limit]]
+
+    def _fuzzy(self, query: str, limit: int) -> list[int]:
+        """Return up to limit entries with a word starting close to query."""
+        query_trigrams = trigrams(query)
+        shared = Counter()
+        for trigram in query_trigrams:
+            posting = self.postings.get(trigram, ())
+            if len(posting) <= _MAX_POSTING:
+                shared.update(posting)
+
+        # One edit is allowed in queries of up to five characters and two in longer ones
+        allowed = 1 if len(query) <= 5 else 2
+        # An edit changes at most three trigrams, and the query's closing one need not match
+        needed = len(query_trigrams) - 3 * allowed - 1
+        ranked = []
+        distances = {}  # many names share words, so each distinct word start is compared once
+        window = len(query) + allowed
+        candidates = heapq.nlargest(20 * limit, ((common, i) for i, common in shared.items() if common >= needed))
+        for common, i in candidates:
+            if len(ranked) >= 4 * limit:
+                break
+            key = self.keys[i]
+            starts = [0] + [match.end() for match in re.finditer(r" (?=\S)", key)]
+            # The closest word start, preferring earlier words on ties
+            distance, word = allowed + 1, None
+            for position, start in enumerate(starts):
+                text = key[start:start + window]
+                if text not in distances:
+                    distances[text] = prefix_distance(query, text, allowed)
+                if distances[text] < distance:
+                    distance, word = distances[text], position
+                    if distance == 0:
+                        break
+            if distance <= allowed:
+                ranked.append((distance, word, -common, key, i))
+        ranked.sort()
+        return [ranked_entry[-1] for ranked_entry in ranked[:limit]]
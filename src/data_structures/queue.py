@@ -1,45 +1,134 @@
 # Queue module
 
 class Queue:
-    def __init__(self, source: list = []):
-        """Initialize the queue."""
-        self.list = source
+    """A first-in, first-out queue stored in a ring buffer.
+
+    Items live in a list used as a circular buffer: head is the index of the
+    front item, and the back wraps around to the start of the list. Enqueue
+    and dequeue are O(1); when the buffer is full it doubles, unless the
+    queue has a fixed capacity, in which case enqueueing raises IndexError.
+    """
+
+    _MINIMUM_SIZE = 8
+
+    def __init__(self, source: list = None, capacity: int = None):
+        """Initialize the queue with the items of source, front first.
+
+        capacity fixes the most items the queue can hold; by default it grows
+        without limit.
+        """
+        source = list(source) if source is not None else []
+        if capacity is not None and len(source) > capacity:
+            raise IndexError("Queue is Full.")
+        self.capacity = capacity
+        size = capacity if capacity is not None else max(self._MINIMUM_SIZE, len(source))
+        self._buffer = source + [None] * (size - len(source))
+        self._head = 0
+        self._size = len(source)
 
     def isEmpty(self) -> bool:
         """Checks if the queue is empty."""
-        return not any(self.list)
-    
+        return self._size == 0
+
+    def isFull(self) -> bool:
+        """Checks if a queue of fixed capacity holds as many items as it can."""
+        return self.capacity is not None and self._size == self.capacity
+
     def __len__(self):
         """Gets the number of items in the queue."""
-        return len(self.list)
-    
+        return self._size
+
+    def __iter__(self):
+        """Iterates over the items from front to back."""
+        buffer, head = self._buffer, self._head
+        for i in range(self._size):
+            yield buffer[(head + i) % len(buffer)]
+
     def __str__(self):
         """Returns the queue as a string."""
-        string = ''
-        for i in self.list:
-            string += str(i) + ' '
-        return string[:-1]
-    
+        return ' '.join(str(i) for i in self)
+
     def __contains__(self, item):
         """Checks if an item is in the queue."""
-        return item in self.list
-    
+        return any(i == item for i in self)
+
+    def _resize(self, size: int):
+        """Moves the items, front first, into a new buffer of the given size."""
+        items = list(self)
+        self._buffer = items + [None] * (size - len(items))
+        self._head = 0
+
     def enqueue(self, item):
         """Adds an item to the end of the queue."""
-        self.list.append(item)
+        if self._size == len(self._buffer):
+            if self.capacity is not None:
+                raise IndexError("Queue is Full.")
+            self._resize(2 * len(self._buffer))
+        self._buffer[(self._head + self._size) % len(self._buffer)] = item
+        self._size += 1
+
+    def enqueue_many(self, items):
+        """Adds the items, in order, to the end of the queue.
+
+        A queue of fixed capacity is left unchanged if they do not all fit.
+        """
+        items = list(items)
+        if not items:
+            return
+        size = self._size + len(items)
+        if size > len(self._buffer):
+            if self.capacity is not None:
+                raise IndexError("Queue is Full.")
+            new_size = len(self._buffer)
+            while new_size < size:
+                new_size *= 2
+            self._resize(new_size)
+
+        # Copy in at most two slices, up to the end of the buffer and from its start
+        buffer = self._buffer
+        tail = (self._head + self._size) % len(buffer)
+        first = min(len(items), len(buffer) - tail)
+        buffer[tail:tail + first] = items[:first]
+        buffer[:len(items) - first] = items[first:]
+        self._size = size
 
     def dequeue(self):
         """Removes and returns the item in the front of the queue."""
-        if not any(self.list):
-            raise IndexError("Stack is Empty.")
-        return self.list.pop(0)
-    
+        if self._size == 0:
+            raise IndexError("Queue is Empty.")
+        item = self._buffer[self._head]
+        self._buffer[self._head] = None  # release the reference
+        self._head = (self._head + 1) % len(self._buffer)
+        self._size -= 1
+        return item
+
+    def drain(self, count: int = None) -> list:
+        """Removes and returns up to count items from the front of the queue, or all of them."""
+        count = self._size if count is None else max(0, min(count, self._size))
+        if count == 0:
+            return []
+        buffer = self._buffer
+        end = self._head + count
+        if end <= len(buffer):
+            items = buffer[self._head:end]
+            buffer[self._head:end] = [None] * count
+        else:
+            end -= len(buffer)
+            items = buffer[self._head:] + buffer[:end]
+            buffer[self._head:] = [None] * (len(buffer) - self._head)
+            buffer[:end] = [None] * end
+        self._head = end % len(buffer)
+        self._size -= count
+        return items
+
     def clear(self):
         """Empties the queue."""
-        self.list = []
-    
+        self._buffer = [None] * (self.capacity if self.capacity is not None else self._MINIMUM_SIZE)
+        self._head = 0
+        self._size = 0
+
     def peek(self):
         """Returns the item in the front of the queue without removing it."""
-        if not any(self.list):
-            raise IndexError("Stack is Empty.")
-        return self.list[0]
+        if self._size == 0:
+            raise IndexError("Queue is Empty.")
+        return self._buffer[self._head]
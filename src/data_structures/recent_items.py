@@ -0,0 +1,50 @@
+# Recent Items module
+from collections import OrderedDict
+
+class RecentItems:
+    """Distinct items in the order they were last used, most recent last.
+
+    An OrderedDict keeps the order, so touching an item, whether it is new
+    or already present, and checking membership take constant time. Past
+    maxsize items the least recently used are dropped.
+    """
+
+    def __init__(self, maxsize: int = None):
+        """Initialize the collection, holding at most maxsize items (None for no limit)."""
+        self.maxsize = maxsize
+        self.items = OrderedDict()
+
+    def touch(self, item):
+        """Record a use of item, making it the most recent."""
+        self.items[item] = None
+        self.items.move_to_end(item)
+        if self.maxsize is not None:
+            while len(self.items) > self.maxsize:
+                self.items.popitem(last=False)
+
+    def remove(self, item):
+        """Forget an item."""
+        self.items.pop(item, None)
+
+    def __contains__(self, item):
+        """Check if an item has been used and not yet dropped."""
+        return item in self.items
+
+    def __len__(self):
+        """Return the number of items."""
+        return len(self.items)
+
+    def __iter__(self):
+        """Iterate from the least to the most recently used item."""
+        return iter(self.items)
+
+    def most_recent(self, count: int = None) -> list:
+        """Return up to count items, or all of them, most recently used first."""
+        items = reversed(self.items)
+        if count is None:
+            return list(items)
+        return [item for item, _ in zip(items, range(count))]
+
+    def clear(self):
+        """Remove every item."""
+        self.items.clear()
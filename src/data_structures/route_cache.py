@@ -0,0 +1,170 @@
+# Route Cache module
+from collections import OrderedDict
+
+class RouteCache:
+    """A bounded least-recently-used cache of routes for an undirected graph.
+
+    Routes are stored once per unordered pair of ends and reversed when asked
+    for the other way round. Every lookup passes the graph's version, and
+    the cache empties itself when the version has moved on.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        """Initialize the cache, holding at most maxsize routes (0 disables it)."""
+        self.maxsize = maxsize
+        self.routes = OrderedDict()
+        self.version = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def __len__(self):
+        """Return the number of cached routes."""
+        return len(self.routes)
+
+    def _check_version(self, version: int):
+        if version != self.version:
+            if self.routes:
+                self.invalidations += 1
+                self.routes.clear()
+            self.version = version
+
+    def get(self, start_id: int, end_id: int, version: int):
+        """Return the cached (path, distance) from start_id to end_id, or None."""
+        if self.maxsize <= 0:
+            return None
+        self._check_version(version)
+        key = (start_id, end_id) if start_id <= end_id else (end_id, start_id)
+        route = self.routes.get(key)
+        if route is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.routes.move_to_end(key)
+        path, distance = route
+        return (list(path) if path[0] == start_id else list(reversed(path))), distance
+
+    def put(self, start_id: int, end_id: int, path: list[int], distance: int, version: int):
+        """Store a route found while the graph was at version."""
+        if self.maxsize <= 0 or not path:
+            return
+        self._check_version(version)
+        key = (start_id, end_id) if start_id <= end_id else (end_id, start_id)
+        self.routes[key] = (tuple(path), distance)
+        self.routes.move_to_end(key)
+        while len(self.routes) > self.maxsize:
+            self.routes.popitem(last=False)
+            self.evictions += 1
+
+    def resize(self, maxsize: int):
+        """Change the capacity, evicting the oldest routes if needed."""
+        self.maxsize = maxsize
+        while len(self.routes) > max(maxsize, 0):
+            self.routes.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        """Empty the cache and reset its counters."""
+        self.routes.clear()
+        self.hits = self.misses = self.evictions = self.invalidations = 0
+
+    def stats(self) -> dict:
+        """Return the cache size and counters."""
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self.routes),
+            'maxsize': self.maxsize,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'invalidations': self.invalidations,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+    def __str__(self):
+        """Returns the cache stats as a string."""
+        stats = self.stats()
+        return (f"RouteCache({stats['size']}/{stats['maxsize']}, hits={stats['hits']}, "
+                f"misses={stats['misses']}, evictions={stats['evictions']}, "
+                f"invalidations={stats['invalidations']})")
+
+
+class ShortestPathTreeCache:
+    """A least-recently-used cache of single-source shortest-path trees.
+
+    Each tree is a (distances, previous) pair covering every node reachable
+    from its source. The cache holds at most budget tree entries in total,
+    counting one per reachable node, and evicts the least recently used trees
+    to stay within it. Like RouteCache it empties itself when the graph
+    version changes.
+    """
+
+    def __init__(self, budget: int = 200_000):
+        """Initialize the cache, holding at most budget nodes across all trees (0 disables it)."""
+        self.budget = budget
+        self.trees = OrderedDict()
+        self.size = 0
+        self.version = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        """Return the number of cached trees."""
+        return len(self.trees)
+
+    def __contains__(self, source_id: int) -> bool:
+        """Checks if a tree for source_id is cached, without counting a lookup."""
+        return source_id in self.trees
+
+    def _check_version(self, version: int):
+        if version != self.version:
+            self.trees.clear()
+            self.size = 0
+            self.version = version
+
+    def get(self, source_id: int, version: int):
+        """Return the cached (distances, previous) tree for source_id, or None."""
+        if self.budget <= 0:
+            return None
+        self._check_version(version)
+        tree = self.trees.get(source_id)
+        if tree is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.trees.move_to_end(source_id)
+        return tree
+
+    def put(self, source_id: int, distances: dict[int, int], previous: dict[int, int], version: int):
+        """Store the tree for source_id built while the graph was at version."""
+        if len(distances) > self.budget:
+            return  # a tree larger than the whole budget is not worth keeping
+        self._check_version(version)
+        if source_id in self.trees:
+            self.size -= len(self.trees.pop(source_id)[0])
+        self.trees[source_id] = (distances, previous)
+        self.size += len(distances)
+        while self.size > self.budget:
+            _, (old_distances, _) = self.trees.popitem(last=False)
+            self.size -= len(old_distances)
+            self.evictions += 1
+
+    def clear(self):
+        """Empty the cache and reset its counters."""
+        self.trees.clear()
+        self.size = 0
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict:
+        """Return the cache size and counters."""
+        return {
+            'trees': len(self.trees),
+            'size': self.size,
+            'budget': self.budget,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
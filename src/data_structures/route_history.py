@@ -0,0 +1,144 @@
+# Route History module
+import sys
+from array import array
+
+# Approximate bytes taken by an entry besides its id array, with its index key
+_ENTRY_OVERHEAD = 200
+
+class RouteEntry:
+    """A route in the history: its location ids and its distance."""
+
+    __slots__ = ("route", "distance", "size", "older", "newer", "_names")
+
+    def __init__(self, route: list[int], distance: int):
+        """Initialize the entry, keeping the ids packed in an array."""
+        self.route = array("q", route)
+        self.distance = distance
+        self.size = sys.getsizeof(self.route) + _ENTRY_OVERHEAD
+        self.older = None
+        self.newer = None
+        self._names = None
+
+    def names(self, route_names) -> list[str]:
+        """Return the names of the route's locations, looked up with route_names(ids) the first time."""
+        if self._names is None:
+            self._names = route_names(list(self.route))
+        return self._names
+
+    def text(self, route_names) -> str:
+        """Return the entry as text, such as "Shortest Route: [...] (Distance: 417m)"."""
+        return f"Shortest Route: {self.names(route_names)} (Distance: {self.distance}m)"
+
+class RouteHistory:
+    """A bounded history of routes, newest last, with a cursor for back and forward.
+
+    Entries form a doubly linked list from oldest to newest and are also
+    indexed by their ids, so adding a route that is already in the history
+    moves it to the newest place instead of storing it twice. Once there are
+    more than max_entries entries, or they take more than max_bytes, the
+    oldest are dropped. Adding, moving the cursor and dropping are O(1).
+    """
+
+    def __init__(self, max_entries: int = 100, max_bytes: int = None):
+        """Initialize the history, holding at most max_entries routes and about max_bytes bytes."""
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries = {}  # bytes of the id array -> entry
+        self.oldest = None
+        self.newest = None
+        self.bytes = 0
+        self.cursor = None
+        self.position = 0  # 1-based place of the cursor, counted from the oldest
+
+    def __len__(self):
+        """Return the number of routes in the history."""
+        return len(self.entries)
+
+    def __iter__(self):
+        """Iterate over the entries from oldest to newest."""
+        entry = self.oldest
+        while entry is not None:
+            yield entry
+            entry = entry.newer
+
+    def is_empty(self) -> bool:
+        """Check if the history is empty."""
+        return not self.entries
+
+    def _unlink(self, entry: RouteEntry):
+        if entry.older is None:
+            self.oldest = entry.newer
+        else:
+            entry.older.newer = entry.newer
+        if entry.newer is None:
+            self.newest = entry.older
+        else:
+            entry.newer.older = entry.older
+        entry.older = entry.newer = None
+
+    def _append(self, entry: RouteEntry):
+        entry.older = self.newest
+        if self.newest is None:
+            self.oldest = entry
+        else:
+            self.newest.newer = entry
+        self.newest = entry
+
+    def push(self, route: list[int], distance: int) -> RouteEntry:
+        """Add a route as the newest entry, or move it there if it is already in the history.
+
+        The cursor moves to the route. Returns its entry.
+        """
+        entry = RouteEntry(route, distance)
+        key = entry.route.tobytes()
+        existing = self.entries.get(key)
+        if existing is not None:
+            self._unlink(existing)
+            existing.distance = distance
+            entry = existing
+        else:
+            self.entries[key] = entry
+            self.bytes += entry.size
+        self._append(entry)
+
+        while self.oldest is not entry and (len(self.entries) > self.max_entries or
+                                            (self.max_bytes is not None and self.bytes > self.max_bytes)):
+            dropped = self.oldest
+            self._unlink(dropped)
+            del self.entries[dropped.route.tobytes()]
+            self.bytes -= dropped.size
+
+        self.cursor = entry
+        self.position = len(self.entries)
+        return entry
+
+    def current(self) -> RouteEntry:
+        """Return the entry at the cursor, or None if the history is empty."""
+        return self.cursor
+
+    def back(self) -> RouteEntry:
+        """Move the cursor to the next older entry, if any, and return the entry at the cursor."""
+        if self.cursor is not None and self.cursor.older is not None:
+            self.cursor = self.cursor.older
+            self.position -= 1
+        return self.cursor
+
+    def forward(self) -> RouteEntry:
+        """Move the cursor to the next newer entry, if any, and return the entry at the cursor."""
+        if self.cursor is not None and self.cursor.newer is not None:
+            self.cursor = self.cursor.newer
+            self.position += 1
+        return self.cursor
+
+    def latest(self) -> RouteEntry:
+        """Move the cursor to the newest entry and return it, or None if the history is empty."""
+        self.cursor = self.newest
+        self.position = len(self.entries)
+        return self.cursor
+
+    def clear(self):
+        """Remove every route from the history."""
+        self.entries.clear()
+        self.oldest = self.newest = self.cursor = None
+        self.bytes = 0
+        self.position = 0
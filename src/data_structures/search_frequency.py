@@ -0,0 +1,150 @@
+# Search Frequency module
+import heapq
+import json
+import math
+import os
+import time
+from itertools import count as sequence
+
+# Counters are rescaled before their growth factor passes e**_MAX_EXPONENT
+_MAX_EXPONENT = 50.0
+
+class SearchFrequency:
+    """Decayed search counts per item with the top items always ranked.
+
+    Every search adds a weight that halves every half_life seconds. Instead
+    of decaying every counter as time passes, searches are weighted by
+    e**(rate * (now - landmark)), which grows with time, so all counters
+    keep their relative order and a score is read by scaling one counter
+    back down. When the weights grow too large the counters are rescaled and
+    the landmark moves to the present.
+
+    At most capacity counters are kept. A new item arriving when they are
+    full takes over the smallest counter, adding to its value (the
+    Space-Saving algorithm), so items searched often enough are never lost
+    and scores of the rest are overestimated by at most the smallest
+    counter. Because only one counter changes per search, the top_size
+    highest are kept in a small ranked list and read in O(k).
+    """
+
+    def __init__(self, top_size: int = 10, capacity: int = 1000, half_life: float = 30 * 24 * 3600,
+                 clock=time.time):
+        """Initialize empty counts, ranking the top_size items out of at most capacity."""
+        self.top_size = top_size
+        self.capacity = max(capacity, top_size)
+        self.half_life = half_life
+        self.rate = math.log(2) / half_life
+        self.clock = clock
+        self.landmark = clock()
+        self.counts = {}
+        self._top = []  # items with the highest counts, highest first
+        self._heap = []  # (count, order, item), including entries made stale by later searches
+        self._order = sequence()
+
+    def __len__(self):
+        """Return the number of items counted."""
+        return len(self.counts)
+
+    def __contains__(self, item):
+        """Check if an item has a counter."""
+        return item in self.counts
+
+    def _rescale(self, now: float):
+        factor = math.exp(-self.rate * (now - self.landmark))
+        self.counts = {item: count * factor for item, count in self.counts.items()}
+        self.landmark = now
+        self._rebuild_heap()
+
+    def _rebuild_heap(self):
+        self._heap = [(count, next(self._order), item) for item, count in self.counts.items()]
+        heapq.heapify(self._heap)
+
+    def _pop_smallest(self):
+        """Remove and return the item with the smallest counter, and the counter."""
+        while True:
+            count, _, item = heapq.heappop(self._heap)
+            if self.counts.get(item) == count:
+                del self.counts[item]
+                if item in self._top:
+                    self._top.remove(item)
+                return item, count
+
+    def _rank(self, item, count: float):
+        """Move item to its place in the top list after its counter rose to count."""
+        top = self._top
+        if item in top:
+            top.remove(item)
+        elif len(top) == self.top_size:
+            if count <= self.counts[top[-1]]:
+                return
+            top.pop()
+        i = len(top)
+        while i > 0 and self.counts[top[i - 1]] < count:
+            i -= 1
+        top.insert(i, item)
+
+    def record(self, item, now: float = None):
+        """Count a search for item at time now (the clock by default)."""
+        now = self.clock() if now is None else now
+        if self.rate * (now - self.landmark) > _MAX_EXPONENT:
+            self._rescale(now)
+
+        count = self.counts.get(item)
+        if count is None:
+            count = self._pop_smallest()[1] if len(self.counts) >= self.capacity else 0.0
+        count += math.exp(self.rate * (now - self.landmark))
+        self.counts[item] = count
+        heapq.heappush(self._heap, (count, next(self._order), item))
+        if len(self._heap) > 2 * self.capacity:
+            self._rebuild_heap()
+        self._rank(item, count)
+
+    def score(self, item, now: float = None) -> float:
+        """Return the decayed number of searches for item at time now."""
+        now = self.clock() if now is None else now
+        return self.counts.get(item, 0.0) * math.exp(-self.rate * (now - self.landmark))
+
+    def top(self, count: int = None, now: float = None) -> list[tuple]:
+        """Return up to count (item, score) pairs, or top_size of them, highest score first."""
+        now = self.clock() if now is None else now
+        factor = math.exp(-self.rate * (now - self.landmark))
+        return [(item, self.counts[item] * factor) for item in self._top[:count]]
+
+    def save(self, path: str):
+        """Write the scores as of now to a JSON file, replacing any previous one in a single step."""
+        now = self.clock()
+        data = {
+            "half_life": self.half_life,
+            "saved_at": now,
+            "scores": {item: round(self.score(item, now), 6) for item in self.counts},
+        }
+        temporary = path + ".tmp"
+        with open(temporary, "w") as file:
+            json.dump(data, file, separators=(",", ":"))
+        os.replace(temporary, path)
+
+    @classmethod
+    def load(cls, path: str, **kwargs) -> "SearchFrequency":
+        """Read counts saved by save(), decaying them by the time since.
+
+        A missing or unreadable file gives empty counts. kwargs are passed on
+        to the constructor; the saved half_life is used unless they give one.
+        """
+        try:
+            with open(path, "r") as file:
+                data = json.load(file)
+            saved_at, scores = float(data["saved_at"]), dict(data["scores"])
+            half_life = float(data.get("half_life", 0))
+        except (OSError, ValueError, KeyError, TypeError):
+            return cls(**kwargs)
+        if half_life > 0:
+            kwargs.setdefault("half_life", half_life)
+        frequency = cls(**kwargs)
+
+        # The saved scores are counters with the save time as their landmark
+        frequency.landmark = saved_at
+        ranked = sorted(scores.items(), key=lambda pair: pair[1], reverse=True)
+        frequency.counts = dict(ranked[:frequency.capacity])
+        frequency._top = [item for item, _ in ranked[:frequency.top_size]]
+        frequency._rebuild_heap()
+        return frequency
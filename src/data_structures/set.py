@@ -1,24 +1,36 @@
 # Set module
 
 class Set:
-    def __init__(self):
-        """Initialize the set."""
-        self.items = []
+    """An unordered collection of distinct items, stored in a hash table.
+
+    Items are the keys of a dict, so adding, removing and membership tests
+    take constant time on average, and iteration follows insertion order.
+    """
+
+    def __init__(self, items=()):
+        """Initialize the set with the distinct items of an iterable."""
+        self.items = dict.fromkeys(items)
 
     def add(self, item):
         """Add an item to the set."""
-        if item not in self.items:
-            self.items.append(item)
+        self.items[item] = None
 
     def remove(self, item):
         """Remove an item from the set."""
-        if item in self.items:
-            self.items.remove(item)
+        self.items.pop(item, None)
 
     def contains(self, item):
         """Check if the set contains an item."""
         return item in self.items
 
+    def __contains__(self, item):
+        """Check if the set contains an item."""
+        return item in self.items
+
+    def __len__(self):
+        """Return the number of items in the set."""
+        return len(self.items)
+
     def __iter__(self):
         """Make the set iterable."""
         return iter(self.items)
@@ -26,27 +38,17 @@ class Set:
     def union(self, other_set):
         """Return the union of this set and another set."""
         result = Set()
-        result.items = self.items[:]
-        for item in other_set.items:
-            if item not in result.items:
-                result.items.append(item)
+        result.items = self.items | other_set.items
         return result
 
     def intersection(self, other_set):
         """Return the intersection of this set and another set."""
-        result = Set()
-        for item in self.items:
-            if item in other_set.items:
-                result.add(item)
-        return result
+        smaller, larger = (self, other_set) if len(self) <= len(other_set) else (other_set, self)
+        return Set(item for item in smaller.items if item in larger.items)
 
     def difference(self, other_set):
         """Return the difference of this set and another set."""
-        result = Set()
-        for item in self.items:
-            if item not in other_set.items:
-                result.add(item)
-        return result
+        return Set(item for item in self.items if item not in other_set.items)
 
     def size(self):
         """Return the number of items in the set."""
@@ -54,4 +56,4 @@ class Set:
 
     def display(self):
         """Display the set."""
-        print(f"Set: {self.items}")
\ No newline at end of file
+        print(f"Set: {list(self.items)}")
@@ -1,9 +1,9 @@
 # Stacks module
 
 class Stack:
-    def __init__(self, source: list = []):
+    def __init__(self, source: list = None):
         """Initialize the stack."""
-        self.list = source
+        self.list = source if source is not None else []
 
     def push(self, item):
         """Add an item to the top of the stack."""
@@ -11,19 +11,19 @@ class Stack:
 
     def pop(self):
         """Remove and return the item at the top of the stack."""
-        if not any(self.list):
+        if not self.list:
             raise IndexError("Stack is empty.")
         return self.list.pop()
 
     def peek(self):
-        if not any(self.list):
-            raise IndexError("Stack is empty.")
         """Return the item at the top of the stack without removing it."""
-        return self.list[len(self.list)-1]
+        if not self.list:
+            raise IndexError("Stack is empty.")
+        return self.list[-1]
 
     def is_empty(self) -> bool:
         """Check if the stack is empty."""
-        return not any(self.list)
+        return not self.list
 
     def __len__(self):
         """Return the number of items in the stack."""
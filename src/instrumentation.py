@@ -0,0 +1,130 @@
+import functools
+import json
+import math
+import os
+import signal
+import time
+from collections import deque
+
+ENV_VAR = "CAMPUSNAV_PROFILE"
+DEFAULT_OUTPUT = "campusnav_profile.json"
+
+class LatencyRecorder:
+    """Rolling windows of latencies, summarised as percentiles on demand."""
+
+    def __init__(self, window: int = 1000):
+        """Initialize the recorder, keeping the latest window samples per name."""
+        self.window = window
+        self.samples = {}
+        self.counts = {}
+
+    def record(self, name: str, seconds: float):
+        """Record one latency sample under name."""
+        if name not in self.samples:
+            self.samples[name] = deque(maxlen=self.window)
+            self.counts[name] = 0
+        self.samples[name].append(seconds)
+        self.counts[name] += 1
+
+    def summary(self) -> dict:
+        """Return count, mean, p50, p95 and p99 in milliseconds for every name."""
+        result = {}
+        for name, samples in sorted(self.samples.items()):
+            ordered = sorted(samples)
+            result[name] = {
+                'count': self.counts[name],
+                'mean_ms': sum(ordered) / len(ordered) * 1000,
+                'p50_ms': _percentile(ordered, 50) * 1000,
+                'p95_ms': _percentile(ordered, 95) * 1000,
+                'p99_ms': _percentile(ordered, 99) * 1000,
+            }
+        return result
+
+def _percentile(ordered: list[float], percent: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    rank = max(0, math.ceil(percent / 100 * len(ordered)) - 1)
+    return ordered[rank]
+
+class Profiler:
+    """Times GUI handlers and the routing, lookup and drawing work inside them.
+
+    Handler times are recorded under "handler:<name>" and phase times under
+    "<handler>/<phase>". A phase is attributed to the handler that started
+    the current interaction, which covers work done later in click callbacks
+    the handler registered. Nested calls of the same phase are timed once.
+    """
+
+    def __init__(self, output: str = DEFAULT_OUTPUT, window: int = 1000):
+        """Initialize the profiler, dumping to output."""
+        self.output = output
+        self.recorder = LatencyRecorder(window)
+        self.active_handler = "startup"
+        self._open_phases = set()
+
+    @classmethod
+    def from_environment(cls):
+        """Return a Profiler if CAMPUSNAV_PROFILE is set, otherwise None.
+
+        The variable is the JSON output path, or "1" for the default path.
+        """
+        value = os.environ.get(ENV_VAR)
+        if not value or value == "0":
+            return None
+        return cls(DEFAULT_OUTPUT if value == "1" else value)
+
+    def wrap_handler(self, name: str, function):
+        """Return function timed as the handler name."""
+        @functools.wraps(function)
+        def timed(*args, **kwargs):
+            self.active_handler = name
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.recorder.record(f"handler:{name}", time.perf_counter() - start)
+        return timed
+
+    def wrap_phase(self, phase: str, function):
+        """Return function timed as part of phase."""
+        @functools.wraps(function)
+        def timed(*args, **kwargs):
+            if phase in self._open_phases:
+                return function(*args, **kwargs)
+            self._open_phases.add(phase)
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self._open_phases.discard(phase)
+                self.record_phase(phase, time.perf_counter() - start)
+        return timed
+
+    def record_phase(self, phase: str, seconds: float):
+        """Record time measured elsewhere as part of phase."""
+        self.recorder.record(f"{self.active_handler}/{phase}", seconds)
+
+    def instrument(self, obj, names, phase: str = None):
+        """Replace the named methods of obj with timed versions.
+
+        Without a phase each method is timed as a handler of the same name.
+        """
+        for name in names:
+            method = getattr(obj, name, None)
+            if method is None:
+                continue
+            if phase is None:
+                setattr(obj, name, self.wrap_handler(name, method))
+            else:
+                setattr(obj, name, self.wrap_phase(phase, method))
+
+    def dump(self, path: str = None) -> str:
+        """Write the current percentiles to a JSON file and return its path."""
+        path = path or self.output
+        with open(path, "w") as file:
+            json.dump(self.recorder.summary(), file, indent=2)
+        return path
+
+    def dump_on_signal(self):
+        """Dump whenever the process receives SIGUSR1, where the platform has it."""
+        if hasattr(signal, "SIGUSR1"):
+            signal.signal(signal.SIGUSR1, lambda signum, frame: self.dump())
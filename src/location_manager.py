@@ -1,20 +1,41 @@
 import json
 
+from data_structures.kd_tree import KDTree
+from map_cache import load_binary_map
+
 class LocationManager:
-    def __init__(self, json_file="data/campus_map.json", features_file="data/location_features.json"):
+    def __init__(self, json_file="data/campus_map.json", features_file="data/location_features.json",
+                 locations: list[dict] = None):
+        """Initialize the manager, reading json_file unless its locations are given already parsed."""
         # List to store locations with their full structure
         self.locations = []
+        # Indexes into self.locations, rebuilt on load and kept in sync on add/remove
+        self.locations_by_id = {}
+        self.locations_by_name = {}
+        self.locations_by_coords = {}
+        # Points of interest and their spatial index, built on first use
+        self._visible_locations = None
+        self._visible_index = None
         self.json_file = json_file
         self.location_features = {}
         self.features_file = features_file
-        self.load_locations()
+        if locations is None:
+            self.load_locations()
+        else:
+            self.locations = locations
+            self._build_indexes()
+            self.load_features()
 
     def load_locations(self):
-        """Load locations from the JSON file."""
+        """Load locations from the compiled binary map, or from the JSON file if it is missing or stale."""
+        binary_map = load_binary_map(self.json_file)
         try:
-            with open(self.json_file, "r") as file:
-                data = json.load(file)
-                self.locations = data.get("locations", [])
+            if binary_map is not None:
+                self.locations = binary_map.locations()
+            else:
+                with open(self.json_file, "r") as file:
+                    data = json.load(file)
+                    self.locations = data.get("locations", [])
             print("Locations loaded successfully.")
         except FileNotFoundError:
             print(f"File {self.json_file} not found. Starting with an empty location list.")
@@ -23,6 +44,11 @@ class LocationManager:
             print(f"Error decoding JSON from {self.json_file}. Starting with an empty location list.")
             self.locations = []
 
+        self._build_indexes()
+        self.load_features()
+
+    def load_features(self):
+        """Load the features of each location from the features file."""
         try:
             with open(self.features_file, "r") as file:
                 self.location_features = json.load(file)
@@ -34,15 +60,78 @@ class LocationManager:
             print(f"Error decoding JSON from {self.features_file}. Starting with an empty feature dictionary.")
             self.location_features = {}
 
+    def _build_indexes(self):
+        """Index every location by id, name and (x, y)."""
+        self.locations_by_id = {}
+        self.locations_by_name = {}
+        self.locations_by_coords = {}
+        for location in self.locations:
+            self._index_location(location)
+        self._visible_locations = None
+        self._visible_index = None
+
+    def _index_location(self, location: dict):
+        # The first location with a given name or position wins, as in a linear scan
+        self.locations_by_id.setdefault(location['id'], location)
+        self.locations_by_name.setdefault(location['name'], location)
+        self.locations_by_coords.setdefault((location['x'], location['y']), location)
+
+    def add_location(self, location: dict):
+        """Add a location, keeping the indexes up to date."""
+        if location['id'] in self.locations_by_id:
+            raise ValueError(f'A location with id "{location["id"]}" already exists.')
+        self.locations.append(location)
+        self._index_location(location)
+        self._visible_locations = None
+        self._visible_index = None
+
+    def remove_location(self, id: int) -> dict:
+        """Remove the location with the given id, keeping the indexes up to date."""
+        location = self.locations_by_id.get(id)
+        if location is None:
+            raise KeyError(f'The id "{id}" does not exist.')
+        self.locations.remove(location)
+        del self.locations_by_id[id]
+        self._visible_locations = None
+        self._visible_index = None
+
+        # Another location may share the removed name or position
+        name, coords = location['name'], (location['x'], location['y'])
+        if self.locations_by_name.get(name) is location:
+            del self.locations_by_name[name]
+        if self.locations_by_coords.get(coords) is location:
+            del self.locations_by_coords[coords]
+        for other in self.locations:
+            if other['name'] == name:
+                self.locations_by_name.setdefault(name, other)
+            if (other['x'], other['y']) == coords:
+                self.locations_by_coords.setdefault(coords, other)
+        return location
+
     def get_visible_Locations(self):
-        return [loc for loc in self.locations if loc['pointOfInterest']]
+        if self._visible_locations is None:
+            self._visible_locations = [loc for loc in self.locations if loc['pointOfInterest']]
+        return self._visible_locations
+
+    def get_visible_index(self) -> KDTree:
+        """Return a spatial index over the points of interest."""
+        if self._visible_index is None:
+            self._visible_index = KDTree(
+                [(loc['x'], loc['y'], loc) for loc in self.get_visible_Locations()]
+            )
+        return self._visible_index
+
+    def nearest_visible_location(self, x: float, y: float):
+        """Return the point of interest closest to (x, y), or None if there are none."""
+        return self.get_visible_index().nearest(x, y)
+
+    def visible_locations_within(self, x: float, y: float, radius: float) -> list:
+        """Return the points of interest within radius of (x, y), nearest first."""
+        return self.get_visible_index().within_radius(x, y, radius)
 
     def search_location(self, name):
         """Search for a location by name."""
-        for location in self.locations:
-            if location["name"] == name:
-                return location
-        return None
+        return self.locations_by_name.get(name)
 
     def list_location_names(self):
         """List all locations on the campus map."""
@@ -67,32 +156,28 @@ class LocationManager:
         return ids
     
     def get_location_id(self, name: str) -> int:
-        for location in self.locations:
-            if location['name'] == name:
-                return location['id']
-        raise KeyError(f'The name "{name}" does not exit.')
+        if name not in self.locations_by_name:
+            raise KeyError(f'The name "{name}" does not exit.')
+        return self.locations_by_name[name]['id']
     
     def get_location_name(self, id: int) -> str:
-        for location in self.locations:
-            if location['id'] == id:
-                return location['name']
-        raise KeyError(f'The id "{id}" does not exist.')
+        if id not in self.locations_by_id:
+            raise KeyError(f'The id "{id}" does not exist.')
+        return self.locations_by_id[id]['name']
     
     def get_location_name_from_cords(self, x: int, y: int) -> str:
-        for location in self.locations:
-            if location['x'] == x and location['y'] == y:
-                return location['name']
-        raise KeyError(f'A point at "{x},{y}" does not exist.')
+        if (x, y) not in self.locations_by_coords:
+            raise KeyError(f'A point at "{x},{y}" does not exist.')
+        return self.locations_by_coords[(x, y)]['name']
     
     def get_location_coordinates(self, id: int) -> tuple[int, int]:
         """Get the coordinates (x, y) of a location by its ID."""
-        for location in self.locations:
-            if location["id"] == id:
-                return location["x"], location["y"]
-        raise KeyError(f'The id "{id}" does not exist.')
+        if id not in self.locations_by_id:
+            raise KeyError(f'The id "{id}" does not exist.')
+        location = self.locations_by_id[id]
+        return location["x"], location["y"]
     
     def is_point_of_interest(self, name: str) -> bool:
-        for location in self.locations:
-            if location['name'] == name:
-                return location['pointOfInterest']
-        raise KeyError(f'The name "{name}" does not exit.')
\ No newline at end of file
+        if name not in self.locations_by_name:
+            raise KeyError(f'The name "{name}" does not exit.')
+        return self.locations_by_name[name]['pointOfInterest']
\ No newline at end of file
@@ -5,24 +5,25 @@ import os
 import tkinter as tk
 from tkinter import ttk
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
 from matplotlib.patches import FancyBboxPatch
 
 # Local Imports
-from location_manager import LocationManager
-from data_structures.stack import Stack
-from data_structures.graph import Graph
+from core import CampusNavCore
+from background import BackgroundImage
+from rendering import BlitManager, TileView
+from instrumentation import Profiler
+from data_structures.route_history import RouteHistory
 from data_structures.queue import Queue
-from data_structures.tree import Tree
-from data_structures.array import Array, LinkedStructures
-from data_structures.set import Set
-from data_structures.list import List
-from data_structures.searching_sorting import Searching, Sorting
+from data_structures.array import LinkedStructures
+from data_structures.recent_items import RecentItems
+from data_structures.search_frequency import SearchFrequency
 from utils import (
     extract_coordinates_and_labels,
-    add_background_image,
+    BACKGROUND_EXTENT,
+    set_background_limits,
     select_nearest_location,
-    parse_route_details,
     format_route_label,
     update_route_on_map,
     create_popup_window,
@@ -31,6 +32,9 @@ from utils import (
     add_menu_buttons,
 )
 
+# Colours and line styles of the alternative routes drawn next to the shortest one
+ALTERNATIVE_STYLES = [("darkorange", "--"), ("purple", ":"), ("teal", "-.")]
+
 class CampusNavigationApp:
     def __init__(self):
         self.root = tk.Tk()
@@ -39,22 +43,33 @@ class CampusNavigationApp:
 
         self.current_marker = None
 
-        self.location_manager = LocationManager()
-        self.route_history = Stack()
-        self.graph = Graph()
-        self.location_tree = Tree()
-        self.frequent_locations = Array(size=10, default_value=None)
-        self.current_route = LinkedStructures()
-        self.recent_locations = List()
-        self.searching = Searching()
-        self.sorting = Sorting()
-
-        for id in self.location_manager.get_location_ids():
-            self.graph.add_node(id)
+        # Set CAMPUSNAV_PROFILE to record load phases and handler latencies (see instrumentation.py)
+        self.profiler = Profiler.from_environment()
 
-        self.graph.load_from_json("data/campus_map.json")
-
-        self._initialize_location_tree()
+        # The map, graph and lookups live in the headless core; the GUI is a client of it
+        self.core = CampusNavCore(
+            # CAMPUSNAV_ROUTE_CACHE_SIZE sets how many routes are cached (0 disables the cache)
+            cache_size=int(os.environ.get("CAMPUSNAV_ROUTE_CACHE_SIZE", 128)),
+            # Set CAMPUSNAV_COMPACT_GRAPH=1 to route on an immutable array-backed copy of the graph
+            compact=bool(os.environ.get("CAMPUSNAV_COMPACT_GRAPH")),
+        )
+        if self.profiler is not None:
+            for phase, seconds in self.core.load_timings.items():
+                self.profiler.record_phase(f"load {phase}", seconds)
+        self.location_manager = self.core.location_manager
+        self.graph = self.core.graph
+        # CAMPUSNAV_ALTERNATIVES sets how many alternative routes are drawn (0 disables them)
+        self.alternative_count = int(os.environ.get("CAMPUSNAV_ALTERNATIVES", 2))
+        self.location_tree = self.core.location_tree
+
+        # CAMPUSNAV_ROUTE_HISTORY_SIZE caps how many routes the history keeps
+        self.route_history = RouteHistory(max_entries=int(os.environ.get("CAMPUSNAV_ROUTE_HISTORY_SIZE", 100)))
+        # Searches are counted across sessions in CAMPUSNAV_SEARCH_HISTORY, counting half after a month
+        self.search_history_file = os.environ.get("CAMPUSNAV_SEARCH_HISTORY", "data/search_history.json")
+        self.frequent_locations = SearchFrequency.load(self.search_history_file, top_size=10)
+        self.current_route = LinkedStructures()
+        # CAMPUSNAV_RECENT_LOCATIONS caps how many clicked locations are remembered
+        self.recent_locations = RecentItems(maxsize=int(os.environ.get("CAMPUSNAV_RECENT_LOCATIONS", 50)))
 
         # Create the map and menu frames
         self.map_frame = tk.Frame(self.root)
@@ -63,14 +78,21 @@ class CampusNavigationApp:
         self.menu_frame = tk.Frame(self.root)
         self.menu_frame.pack(side=tk.BOTTOM, fill=tk.X)
 
-        # Initialize the map
-        self.fig, self.ax = plt.subplots(figsize=(8, 6))
+        # Initialize the map; an embedded Figure needs no pyplot state
+        self.fig = Figure(figsize=(8, 6))
+        self.ax = self.fig.add_subplot()
         self.canvas = FigureCanvasTkAgg(self.fig, master=self.map_frame)
         self.canvas_widget = self.canvas.get_tk_widget()
         self.canvas_widget.pack(fill=tk.BOTH, expand=True)
 
         self.initialize_map()
 
+        # Only the changing artists are redrawn, over a cached copy of the map
+        self.blitter = BlitManager(self.canvas)
+
+        if self.profiler is not None:
+            self._instrument()
+
         # Connect the normal click handler after initializing the map
         self.normal_click_handler = self.fig.canvas.mpl_connect('button_press_event', self.normal_click)
 
@@ -92,6 +114,29 @@ class CampusNavigationApp:
         self.prompt_text_obj = None
         self.update_prompt_text()
 
+        # The window shows without the background image, which is swapped in once decoded
+        self.background = BackgroundImage("./assets/mercer_map.png")
+        self.background.load_async()
+        self.root.after(20, self.show_background)
+
+    def _instrument(self):
+        """Time the GUI handlers and the routing, lookup and drawing work they do."""
+        self.profiler.instrument(self, [
+            "normal_click", "find_shortest_route", "search_location", "walking_guide", "view_route_history",
+        ])
+        routing = ["find_shortest_path", "find_shortest_path_astar", "find_shortest_path_ch", "path_from_tree"]
+        for router in {self.core.graph, self.core.router, self.core.route_table} - {None}:
+            self.profiler.instrument(router, routing, "routing")
+        self.profiler.instrument(self.core, ["find_route", "find_alternative_routes"], "routing")
+        self.profiler.instrument(self.location_manager, [
+            "search_location", "get_location_name", "get_location_id", "get_location_coordinates",
+            "get_location_name_from_cords", "is_point_of_interest", "get_visible_Locations",
+            "nearest_visible_location", "visible_locations_within",
+        ], "lookup")
+        self.profiler.instrument(self.canvas, ["draw"], "drawing")
+        self.profiler.instrument(self.blitter, ["update", "redraw_background"], "drawing")
+        self.profiler.dump_on_signal()
+
     def disable_buttons(self):
         for button in self.buttons:
             button.config(state='disabled')
@@ -106,7 +151,9 @@ class CampusNavigationApp:
             self.prompt_text_obj.remove()
             self.prompt_text_box.remove()
 
-        self.prompt_text_obj = text_obj = self.ax.text(x, y, text, fontsize=12, va='bottom', ha='left', zorder=2)
+        self.prompt_text_obj = text_obj = self.blitter.add_artist(
+            self.ax.text(x, y, text, fontsize=12, va='bottom', ha='left', zorder=2)
+        )
 
         # Get bounding box of the text in data coordinates
         renderer = self.canvas.get_renderer()
@@ -120,26 +167,41 @@ class CampusNavigationApp:
         self.prompt_text_box = FancyBboxPatch((x-5, y-5), width+15, height+15,
                             boxstyle="round,pad=0.3", edgecolor='black',
                             facecolor='lightyellow', zorder=1)
-        self.ax.add_patch(self.prompt_text_box)
-
-        # Redraw text on top
-        self.ax.draw_artist(text_obj)
+        self.blitter.add_artist(self.ax.add_patch(self.prompt_text_box))
 
         # Render to canvas
-        self.canvas.draw()
+        self.blitter.update()
 
     def initialize_map(self):
         """Initialize the map with locations and background."""
         x_coords, y_coords, labels = extract_coordinates_and_labels(
             self.location_manager.get_visible_Locations()
         )
-        add_background_image(self.ax, "./assets/mercer_map.png")
-        self.ax.scatter(x_coords, y_coords, color="blue", label="Locations")
+        set_background_limits(self.ax)
+        locations = self.ax.scatter(x_coords, y_coords, color="blue", label="Locations")
         self.ax.set_xticks([])
         self.ax.set_yticks([])
         self.ax.set_title("Campus Map")
         self.ax.set_aspect(aspect=1006 / 978)
-        self.ax.legend()
+        # The legend is part of the cached static map, so it lists the route up front
+        route = Line2D([], [], color="red", linewidth=2, label="Shortest Route")
+        handles = [locations, route]
+        if self.alternative_count:
+            color, style = ALTERNATIVE_STYLES[0]
+            handles.append(Line2D([], [], color=color, linestyle=style, linewidth=2, label="Alternative Route"))
+        self.ax.legend(handles=handles)
+
+    def show_background(self):
+        """Draw the background image once it is decoded, checking again later until then."""
+        if not self.background.ready():
+            self.root.after(20, self.show_background)
+            return
+        if self.background.error:
+            print(self.background.error)
+            return
+        # Only the tiles in view are drawn, at a resolution matching the canvas
+        self.tile_view = TileView(self.ax, self.background.pyramid, BACKGROUND_EXTENT)
+        self.blitter.redraw_background()
 
     def clear_info_card(self):
         """Clear the currently displayed info card."""
@@ -153,19 +215,12 @@ class CampusNavigationApp:
                 render_location_info.previous_box.remove()
             render_location_info.previous_box = None
 
-        self.canvas.draw()
+        self.blitter.update()
 
     def display_info_card(self, name: str, x: int = 350, y: int = -120):
         """Display the info card with constraints to keep it within the map bounds."""
         # Display the info card text
-        text = name + '\n'
-
-        if name in self.location_manager.location_features:
-            text += '\nContains:'
-            for feature in self.location_manager.location_features[name]:
-                text += '\n- ' + feature
-        else:
-            text += '\nContains no notable\nfeatures or buildings.'
+        text = self.core.location_info(name)
 
         # Get the map's visible bounds
         x_min, x_max = self.ax.get_xlim()
@@ -176,7 +231,7 @@ class CampusNavigationApp:
         constrained_y = max(y_min + 50, min(y, y_max - 100))        # Add padding to avoid edges
 
         # Render the info card at the constrained position
-        render_location_info(self.ax, self.canvas, text, constrained_x, constrained_y)
+        render_location_info(self.ax, self.blitter, text, constrained_x, constrained_y)
 
     def normal_click(self, event):
         self.update_prompt_text()
@@ -186,7 +241,7 @@ class CampusNavigationApp:
 
         self.clear_info_card()
 
-        nearest_location = select_nearest_location(event, self.location_manager.get_visible_Locations())
+        nearest_location = select_nearest_location(event, self.location_manager)
 
         if nearest_location is None:
             return
@@ -196,7 +251,7 @@ class CampusNavigationApp:
         x, y = nearest_location['x'], nearest_location['y']
 
         # Add a static red dot at the selected location
-        self.current_marker = self.ax.plot(x, y, 'ro', markersize=12)
+        self.current_marker = self.blitter.add_artists(self.ax.plot(x, y, 'ro', markersize=12))
 
         # Display the info card
         self.display_info_card(nearest_location['name'], x, y)
@@ -206,7 +261,7 @@ class CampusNavigationApp:
         clear_current_marker(self.current_marker, self.ax)
 
         # Clear any existing shortest route lines
-        for line in self.ax.lines:
+        for line in list(self.ax.lines):
             line.remove()
 
         self.clear_info_card()
@@ -216,51 +271,51 @@ class CampusNavigationApp:
         label = tk.Label(popup, text="Select a location:")
         label.pack(pady=10)
 
-        location_names = [location["name"] for location in self.location_manager.locations]
+        location_names = self.core.sorted_location_names
 
         if not location_names:
             popup.destroy()
             return
-        
-        # Sort the location names alphabetically
-        sorted_location_names = self.sorting.merge_sort(location_names)
 
+        # Typing filters the choices through the name index; features are shown with their location
+        choices = {}
+
+        def on_type(event):
+            if event.keysym in ("Up", "Down", "Return", "Escape"):
+                return
+            query = combo_box.get()
+            if not query.strip():
+                combo_box.config(values=location_names)
+                return
+            choices.clear()
+            for text, name in self.core.search_names(query, limit=15):
+                choices[text if text == name else f"{text} ({name})"] = name
+            combo_box.config(values=list(choices))
 
-        combo_box = ttk.Combobox(popup, values=sorted_location_names, state="readonly")
+        combo_box = ttk.Combobox(popup, values=location_names)
         combo_box.pack(pady=10)
         combo_box.set("Select a location")
+        combo_box.bind("<KeyRelease>", on_type)
+        combo_box.bind("<FocusIn>", lambda event: combo_box.selection_range(0, tk.END))
 
         def on_select():
-            selected_name = combo_box.get()
-            if selected_name:
-                # Use binary search to find the location
-                index = self.searching.binary_search(sorted_location_names, selected_name)
-                if index != -1:
-                    result = self.location_manager.search_location(selected_name)
-                    if result:
-                        # Store the location in the frequent_locations array
-                        for i in range(self.frequent_locations.size):
-                            if self.frequent_locations.get(i) is None:
-                                self.frequent_locations.set(i, selected_name)
-                                break
-                            elif self.frequent_locations.get(i) == selected_name:
-                                # Avoid duplicates
-                                break
+            selected = combo_box.get()
+            if selected:
+                # A listed choice, an exact name, or else the best match for what was typed
+                result = self.core.search_location(choices.get(selected, selected))
+                if result is None:
+                    matches = self.core.search_names(selected, limit=1)
+                    result = self.core.search_location(matches[0][1]) if matches else None
+                if result:
+                    self.frequent_locations.record(result['name'])
                     x, y = result['x'], result['y']
                     self.clear_info_card()
-                    self.current_marker = self.ax.plot(x, y, 'ro', markersize=12)
+                    self.current_marker = self.blitter.add_artists(self.ax.plot(x, y, 'ro', markersize=12))
 
-                    text = result['name'] + '\n'
-                    if result['name'] in self.location_manager.location_features:
-                        text += '\nContains:'
-                        for feature in self.location_manager.location_features[result['name']]:
-                            text += '\n- ' + feature
-                    else:
-                        text += '\nContains no notable\nfeatures or buildings.'
+                    text = self.core.location_info(result['name'])
 
                     # Offset the info card position slightly to avoid overlap with the dot
-                    render_location_info(self.ax, self.canvas, text, x + 100, y)
-                    self.canvas.draw()
+                    render_location_info(self.ax, self.blitter, text, x + 100, y)
                 else:
                     tk.messagebox.showerror("Error", "Location not found!")
                     return
@@ -285,7 +340,7 @@ class CampusNavigationApp:
         selected_locations = []
 
         def on_click(event):
-            nearest_location = select_nearest_location(event, self.location_manager.get_visible_Locations())
+            nearest_location = select_nearest_location(event, self.location_manager)
             if nearest_location:
                 selected_locations.append(nearest_location)
 
@@ -294,7 +349,7 @@ class CampusNavigationApp:
                     self.fig.canvas.mpl_disconnect(cid)  # Disconnect the shortest route click handler
                     start_location = selected_locations[0]["id"]
                     end_location = selected_locations[1]["id"]
-                    route, total_distance = self.graph.find_shortest_path(start_location, end_location)
+                    route, total_distance = self.core.find_route(start_location, end_location)
                     if route:
                         # Clear the current route before adding the new one
                         self.current_route = LinkedStructures()
@@ -303,28 +358,31 @@ class CampusNavigationApp:
                         for location_id in route:
                             self.current_route.add_node(location_id)
 
-                        location_names = [self.location_manager.get_location_name(location_id) for location_id in route]
-                        route_text = f"Shortest Route: {location_names} (Distance: {total_distance}m)"
-
-                        # Add the route to the history directly using Stack
-                        self.route_history.push(route_text)
+                        # Add the route to the history, which names its locations only when shown
+                        self.route_history.push(route, total_distance)
 
                         # Clear the previous route
-                        for line in self.ax.lines:
+                        for line in list(self.ax.lines):
                             line.remove()
 
                         # Extract coordinates for the route
-                        route_coords = [
-                            self.location_manager.get_location_coordinates(location_id) for location_id in route
-                        ]
+                        route_coords = self.core.route_coordinates(route)
                         x_coords, y_coords = zip(*route_coords)
 
-                        # Draw the route on the map
-                        self.ax.plot(x_coords, y_coords, color="red", linewidth=2, label="Shortest Route")
-                        self.ax.legend()
-                        self.canvas.draw()
+                        # Draw the alternatives underneath the route itself
+                        alternatives = self.draw_alternative_routes(start_location, end_location,
+                                                                    route, total_distance)
 
-                        self.update_prompt_text(f'Total Distance: {total_distance}m')
+                        # Draw the route on the map
+                        self.blitter.add_artists(
+                            self.ax.plot(x_coords, y_coords, color="red", linewidth=2, label="Shortest Route", zorder=3)
+                        )
+                        self.blitter.update()
+
+                        prompt = f'Total Distance: {total_distance}m'
+                        if alternatives:
+                            prompt += ' (alternatives: ' + ', '.join(f'{distance}m' for distance in alternatives) + ')'
+                        self.update_prompt_text(prompt)
                         self.enable_buttons()
 
                     # Reconnect the normal click handler
@@ -336,6 +394,19 @@ class CampusNavigationApp:
         # Connect the event handler for selecting locations
         cid = self.fig.canvas.mpl_connect('button_press_event', on_click)
 
+    def draw_alternative_routes(self, start_id: int, end_id: int, route: list[int], distance: int) -> list[int]:
+        """Draw up to alternative_count other routes in their own styles and return their distances."""
+        if not self.alternative_count:
+            return []
+        routes = self.core.find_alternative_routes(start_id, end_id, self.alternative_count + 1,
+                                                   primary=(route, distance))
+        alternatives = [(path, distance) for path, distance in routes if path != route][:self.alternative_count]
+        for (path, _), (color, style) in zip(alternatives, ALTERNATIVE_STYLES):
+            x_coords, y_coords = zip(*self.core.route_coordinates(path))
+            self.blitter.add_artists(self.ax.plot(x_coords, y_coords, color=color, linestyle=style,
+                                                  linewidth=2, label="Alternative Route", zorder=2))
+        return [distance for _, distance in alternatives]
+
     def view_route_history(self):
         """Display route history with forward and back navigation."""
         # Clear the current marker if it exists
@@ -344,38 +415,38 @@ class CampusNavigationApp:
 
         popup = self.manage_popup("Route History", 400, 300)
 
-        history = self.route_history.list
+        history = self.route_history
 
-        if not history:
+        if history.is_empty():
             popup.destroy()
             self.update_prompt_text('No Route History Available')
             return
 
-        current_index = tk.IntVar(value=len(history) - 1)
+        history.latest()
 
         route_label = tk.Label(popup, text="", wraplength=350, justify="left")
         route_label.pack(pady=20)
 
         def update_route_label_and_map():
             """Update the label to show the current route."""
-            route_text = history[current_index.get()]
-            location_names, distance = parse_route_details(route_text)
+            entry = history.current()
             route_label.config(
-                text=format_route_label(current_index.get(), history, location_names, distance),
+                text=format_route_label(history.position, len(history), entry.names(self.core.route_names),
+                                        entry.distance),
                 font=("Arial", 18)
             )
-            update_route_on_map(self.ax, self.canvas, self.location_manager, location_names)
+            update_route_on_map(self.ax, self.blitter, self.location_manager, entry.route)
 
         def go_back():
             """Go to the previous route."""
-            if current_index.get() > 0:
-                current_index.set(current_index.get() - 1)
+            if history.current().older is not None:
+                history.back()
                 update_route_label_and_map()
 
         def go_forward():
             """Go to the next route."""
-            if current_index.get() < len(history) - 1:
-                current_index.set(current_index.get() + 1)
+            if history.current().newer is not None:
+                history.forward()
                 update_route_label_and_map()
 
         # Navigation buttons
@@ -396,14 +467,16 @@ class CampusNavigationApp:
         self.update_prompt_text("Starting walking guide...")
         self.disable_buttons()
 
-        # Initialize a queue to store the locations in the route
-        location_queue = Queue()
+        def route_locations():
+            """Yield the locations of the route in order."""
+            current_node = self.current_route.head
+            while current_node:
+                yield current_node.value
+                current_node = current_node.next
 
-        # Initialize the current node for traversal
-        current_node = self.current_route.head
-        while current_node:
-            location_queue.enqueue(current_node.value)
-            current_node = current_node.next
+        # Queue the locations of the route, to be visited one at a time
+        location_queue = Queue()
+        location_queue.enqueue_many(route_locations())
 
         def move_to_next_location():
             """Move to the next location in the route."""
@@ -417,8 +490,8 @@ class CampusNavigationApp:
             x, y = self.location_manager.get_location_coordinates(location_id)
 
             # Highlight the current location on the map
-            self.ax.plot(x, y, 'wo', markersize=10, label="Current Location")
-            self.canvas.draw()
+            self.blitter.add_artists(self.ax.plot(x, y, 'wo', markersize=10, label="Current Location"))
+            self.blitter.update()
 
             # Display information about the current location
             name = self.location_manager.get_location_name(location_id)
@@ -435,26 +508,6 @@ class CampusNavigationApp:
         # Start the guide by moving to the first location
         move_to_next_location()
 
-    def _initialize_location_tree(self):
-        """Initialize the tree structure for campus locations."""
-        root = "Campus"
-        self.location_tree.add_node(root)
-
-        # Group locations by their categories from the JSON file
-        categories = {}
-        for location in self.location_manager.locations:
-            category = location.get("category", "Miscellaneous")
-            location_name = location["name"]
-
-            if category not in categories:
-                categories[category] = []
-                self.location_tree.add_node(category)
-                self.location_tree.nodes[root].append(category)
-
-            categories[category].append(location_name)
-            self.location_tree.add_node(location_name)
-            self.location_tree.nodes[category].append(location_name)
-
     def build_location_tree(self):
         """Build and display the tree structure for campus locations in a popup."""
         popup = self.manage_popup("Location Tree", 400, 300)
@@ -474,35 +527,25 @@ class CampusNavigationApp:
         add_tree_nodes(root, root)
 
     def display_frequent_locations(self):
-        """Display the list of frequently accessed locations."""
-        popup = self.manage_popup("Frequent Locations", 300, 200)
+        """Display the most frequently searched locations, ranked."""
+        popup = self.manage_popup("Frequent Locations", 300, 320)
 
-        label = tk.Label(popup, text="Frequently Accessed Locations:")
+        label = tk.Label(popup, text="Frequently Searched Locations:")
         label.pack(pady=10)
 
-        # Ensure only unique locations are stored in the array
-        unique_locations = Set()
-        for i in range(self.frequent_locations.size):
-            location = self.frequent_locations.get(i)
-            if location is not None:
-                unique_locations.add(location)
-
-        # Convert the set to a list and sort it alphabetically
-        sorted_locations = self.sorting.merge_sort(list(unique_locations))
-
-         # Display the sorted unique locations
-        if sorted_locations:
-            for location in sorted_locations:
-                location_label = tk.Label(popup, text=location)
+        # Display the most searched locations, ranked by their decayed search counts
+        ranked_locations = self.frequent_locations.top()
+        if ranked_locations:
+            for rank, (location, score) in enumerate(ranked_locations, start=1):
+                location_label = tk.Label(popup, text=f"{rank}. {location} ({score:.1f})")
                 location_label.pack()
         else:
-            no_locations_label = tk.Label(popup, text="No locations accessed yet.")
+            no_locations_label = tk.Label(popup, text="No locations searched yet.")
             no_locations_label.pack()
 
     def access_location(self, location_name):
-        """Access a location and add it to the recent locations list."""
-        if not self.recent_locations.contains(location_name):
-            self.recent_locations.add(location_name)
+        """Access a location and make it the most recent location."""
+        self.recent_locations.touch(location_name)
 
     def display_recent_locations(self):
         """Display the list of recently accessed locations."""
@@ -511,15 +554,10 @@ class CampusNavigationApp:
         label = tk.Label(popup, text="Recently Accessed Locations:")
         label.pack(pady=10)
 
-        # Retrieve the recent locations as a list
-        recent_locations = [self.recent_locations.get(i) for i in range(self.recent_locations.size())]
-
-        # Sort the recent locations alphabetically
-        sorted_recent_locations = self.sorting.quick_sort(recent_locations)
-
-        # Display the sorted recent locations
-        if sorted_recent_locations:
-            for location in sorted_recent_locations:
+        # Display the recent locations, most recent first
+        recent_locations = self.recent_locations.most_recent()
+        if recent_locations:
+            for location in recent_locations:
                 location_label = tk.Label(popup, text=location)
                 location_label.pack()
         else:
@@ -537,6 +575,13 @@ class CampusNavigationApp:
     
     def exit_application(self):
         """Exit the application cleanly."""
+        try:
+            self.frequent_locations.save(self.search_history_file)
+        except OSError as e:
+            print(f"Could not save search history to {self.search_history_file}: {e}")
+        if self.profiler is not None:
+            print(f"Handler latencies written to {self.profiler.dump()}")
+            print(f"Route cache: {self.graph.route_cache}")
         print("Thank you for using Campus Navigation System!")
         self.root.destroy()
         os._exit(0)
@@ -0,0 +1,32 @@
+import hashlib
+import os
+
+from data_structures.binary_map import BinaryMap
+
+def file_hash(path: str) -> str:
+    """Return the SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def cache_path(map_file: str, suffix: str) -> str:
+    """Return the path of a file derived from map_file, stored next to it.
+
+    For example cache_path("data/campus_map.json", "routes.json") gives
+    "data/campus_map.routes.json".
+    """
+    base, _ = os.path.splitext(map_file)
+    return f"{base}.{suffix}"
+
+def load_binary_map(map_file: str) -> BinaryMap:
+    """Memory-map the compiled copy of map_file, or return None if it is missing or stale."""
+    binary_file = cache_path(map_file, "bin")
+    if not os.path.exists(binary_file):
+        return None
+    try:
+        source_hash = file_hash(map_file)
+    except OSError:
+        return None
+    return BinaryMap.load(binary_file, source_hash)
@@ -0,0 +1,59 @@
+# Loads a campus map once for both the location store and the routing graph
+import json
+import time
+
+from data_structures.graph import Graph
+from location_manager import LocationManager
+from map_cache import load_binary_map
+
+def read_map(map_file: str) -> tuple[list[dict], list[int], tuple[list, list, list]]:
+    """Read map_file once, from its compiled binary copy when that is up to date.
+
+    Returns (locations, ids, (from_ids, to_ids, distances)). A missing or
+    unreadable file gives an empty map, as LocationManager does.
+    """
+    binary_map = load_binary_map(map_file)
+    if binary_map is not None:
+        return (binary_map.locations(), binary_map.ids.tolist(),
+                (binary_map.edge_from.tolist(), binary_map.edge_to.tolist(), binary_map.edge_distance.tolist()))
+
+    try:
+        with open(map_file, "r") as file:
+            data = json.load(file)
+    except FileNotFoundError:
+        print(f"File {map_file} not found. Starting with an empty location list.")
+        data = {}
+    except json.JSONDecodeError:
+        print(f"Error decoding JSON from {map_file}. Starting with an empty location list.")
+        data = {}
+
+    locations = data.get("locations", [])
+    connections = data.get("connections", [])
+    return (locations, [location["id"] for location in locations],
+            ([connection["from"] for connection in connections],
+             [connection["to"] for connection in connections],
+             [connection["distance"] for connection in connections]))
+
+def load_map(map_file: str, features_file: str, **graph_options) -> tuple[LocationManager, Graph, dict[str, float]]:
+    """Parse map_file once and build both its LocationManager and its Graph.
+
+    graph_options are passed on to the Graph constructor. Returns
+    (location_manager, graph, timings), where timings holds the seconds
+    spent reading the file, building the location store and building the
+    graph.
+    """
+    timings = {}
+    start = time.perf_counter()
+    locations, ids, connections = read_map(map_file)
+    timings["read"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    location_manager = LocationManager(map_file, features_file, locations=locations)
+    timings["locations"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    graph = Graph.from_arrays(ids, *connections, **graph_options)
+    timings["graph"] = time.perf_counter() - start
+    print(f"Map loaded in {sum(timings.values()):.3f}s (" +
+          ", ".join(f"{phase} {seconds:.3f}s" for phase, seconds in timings.items()) + ").")
+    return location_manager, graph, timings
@@ -0,0 +1,82 @@
+# Builds the optional precomputed routing and background files stored next to a map
+import argparse
+import os
+
+from background import BackgroundImage
+from data_structures.contraction_hierarchy import ContractionHierarchy
+from data_structures.graph import Graph
+from data_structures.binary_map import BinaryMap
+from map_cache import file_hash, cache_path, load_binary_map
+from map_loader import read_map
+from route_table import RouteTable
+
+def load_graph(map_file: str) -> Graph:
+    """Build a Graph with every location of map_file as a node."""
+    _, ids, connections = read_map(map_file)
+    return Graph.from_arrays(ids, *connections)
+
+def precompute_binary_map(map_file: str) -> BinaryMap:
+    """Return an up to date compiled copy of map_file, rebuilding and saving it if stale."""
+    binary_map = load_binary_map(map_file)
+    if binary_map is None:
+        binary_map = BinaryMap.from_json(map_file)
+        binary_map.save(cache_path(map_file, "bin"), file_hash(map_file))
+    return binary_map
+
+def load_hierarchy(map_file: str) -> ContractionHierarchy:
+    """Load the hierarchy stored next to map_file if it matches the map's content."""
+    hierarchy_file = cache_path(map_file, "hierarchy.json")
+    if not os.path.exists(hierarchy_file):
+        return None
+    try:
+        source_hash = file_hash(map_file)
+    except OSError:
+        return None
+    return ContractionHierarchy.load(hierarchy_file, source_hash)
+
+def precompute_hierarchy(map_file: str, graph: Graph) -> ContractionHierarchy:
+    """Return an up to date hierarchy for map_file, rebuilding and saving it if stale."""
+    hierarchy = load_hierarchy(map_file)
+    if hierarchy is None:
+        hierarchy = graph.build_contraction_hierarchy()
+        hierarchy.save(cache_path(map_file, "hierarchy.json"), file_hash(map_file))
+    graph.hierarchy = hierarchy
+    return hierarchy
+
+def main():
+    parser = argparse.ArgumentParser(description="Precompute routing and background data for a campus map.")
+    parser.add_argument("map_file", nargs="?", default="data/campus_map.json")
+    parser.add_argument("--routes", action="store_true", help="build the all-pairs route table")
+    parser.add_argument("--hierarchy", action="store_true", help="build the contraction hierarchy")
+    parser.add_argument("--workers", type=int, default=None, help="processes used for the route table")
+    parser.add_argument("--binary", action="store_true", help="compile the map into the binary format")
+    parser.add_argument("--tiles", action="store_true", help="build the background image tile pyramid")
+    parser.add_argument("--image", default="assets/mercer_map.png", help="background image for --tiles")
+    args = parser.parse_args()
+
+    if not (args.routes or args.hierarchy or args.binary or args.tiles):
+        parser.error("choose at least one of --routes, --hierarchy, --binary and --tiles")
+
+    if args.binary:
+        binary_map = precompute_binary_map(args.map_file)
+        print(f"Binary map with {len(binary_map.ids)} locations and {len(binary_map.edge_from)} "
+              f"connections saved to {cache_path(args.map_file, 'bin')}")
+
+    if args.tiles:
+        background = BackgroundImage(args.image)
+        background.load()
+        print(f"Tile pyramid with {len(background.pyramid.levels)} levels saved to {background.tile_directory}")
+    if not (args.routes or args.hierarchy):
+        return
+
+    graph = load_graph(args.map_file)
+    if args.routes:
+        table = RouteTable.precompute(args.map_file, graph, args.workers)
+        print(f"Route table for {len(table.nodes)} nodes saved to {cache_path(args.map_file, 'routes.json')}")
+    if args.hierarchy:
+        hierarchy = precompute_hierarchy(args.map_file, graph)
+        print(f"Hierarchy with {len(hierarchy.middle)} shortcuts saved to "
+              f"{cache_path(args.map_file, 'hierarchy.json')}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+class BlitManager:
+    """Redraw the changing parts of the map over a cached copy of the static map.
+
+    Artists registered with add_artist are marked animated, so a full
+    canvas.draw() renders only the static map (background image, location
+    scatter, legend). That render is saved after every full draw, and update()
+    restores it and draws just the registered artists on top, instead of
+    re-rendering the whole figure.
+    """
+
+    def __init__(self, canvas):
+        """Initialize the manager for a matplotlib canvas."""
+        self.canvas = canvas
+        self.background = None
+        self.artists = []
+        self.cid = canvas.mpl_connect("draw_event", self._on_draw)
+
+    def _on_draw(self, event):
+        """Save the freshly drawn static map and draw the dynamic artists over it."""
+        self.background = self.canvas.copy_from_bbox(self.canvas.figure.bbox)
+        self._draw_artists()
+
+    def add_artist(self, artist):
+        """Register an artist that changes between redraws and return it."""
+        artist.set_animated(True)
+        self.artists.append(artist)
+        return artist
+
+    def add_artists(self, artists):
+        """Register several artists, such as the lines returned by ax.plot, and return them."""
+        for artist in artists:
+            self.add_artist(artist)
+        return artists
+
+    def _draw_artists(self):
+        # Artists removed from the axes since they were added are forgotten
+        self.artists = [artist for artist in self.artists if artist.axes is not None]
+        figure = self.canvas.figure
+        for artist in sorted(self.artists, key=lambda artist: artist.get_zorder()):
+            figure.draw_artist(artist)
+
+    def update(self):
+        """Show the current dynamic artists, re-rendering only what changed."""
+        if self.background is None:
+            # Nothing cached yet, a full draw saves the background via _on_draw
+            self.canvas.draw()
+            return
+        self.canvas.restore_region(self.background)
+        self._draw_artists()
+        self.canvas.blit(self.canvas.figure.bbox)
+
+    def redraw_background(self):
+        """Fully redraw the figure after the static map itself has changed."""
+        self.canvas.draw()
+
+
+class TileView:
+    """Shows the part of a tile pyramid that is visible in an axes.
+
+    Only the tiles overlapping the axes limits are drawn, from the coarsest
+    pyramid level that still has at least one image pixel per screen pixel.
+    The view follows changes to the axes limits and the canvas size.
+    """
+
+    def __init__(self, ax, pyramid, extent):
+        """Initialize the view of pyramid, whose full image covers extent (left, right, bottom, top)."""
+        self.ax = ax
+        self.pyramid = pyramid
+        self.extent = extent
+        self.image = None
+        self.shown = None
+        self.update()
+        ax.callbacks.connect("xlim_changed", self._on_change)
+        ax.callbacks.connect("ylim_changed", self._on_change)
+        self.cid = ax.figure.canvas.mpl_connect("resize_event", self._on_change)
+
+    def _on_change(self, _):
+        if self.update():
+            self.ax.figure.canvas.draw_idle()
+
+    def update(self) -> bool:
+        """Show the tiles for the current limits and canvas size, returning True if they changed."""
+        left, right, bottom, top = self.extent
+        width, height = right - left, top - bottom
+        x_0, x_1 = sorted(self.ax.get_xlim())
+        y_0, y_1 = sorted(self.ax.get_ylim())
+        # The visible part as fractions of the image, measured from its top left corner
+        view = ((x_0 - left) / width, (x_1 - left) / width, (top - y_1) / height, (top - y_0) / height)
+
+        image_height, image_width = self.pyramid.levels[0].shape[:2]
+        box = self.ax.bbox
+        density = min(image_width * (view[1] - view[0]) / max(box.width, 1),
+                      image_height * (view[3] - view[2]) / max(box.height, 1))
+        level = self.pyramid.choose_level(density)
+        pixels, bounds = self.pyramid.region(level, *view)
+        if (level, bounds) == self.shown:
+            return False
+        self.shown = (level, bounds)
+
+        if pixels is None:
+            if self.image is not None:
+                self.image.set_visible(False)
+            return True
+
+        extent = [left + bounds[0] * width, left + bounds[1] * width,
+                  top - bounds[3] * height, top - bounds[2] * height]
+        if self.image is None:
+            aspect = self.ax.get_aspect()
+            self.image = self.ax.imshow(pixels, extent=extent, aspect="auto", zorder=0)
+            self.ax.set_aspect(aspect)  # imshow resets it
+        else:
+            self.image.set_data(pixels)
+            self.image.set_extent(extent)
+            self.image.set_visible(True)
+        return True
@@ -0,0 +1,128 @@
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from data_structures.graph import Graph
+from map_cache import file_hash, cache_path
+
+UNREACHABLE = -1
+
+class RouteTable:
+    """Precomputed all-pairs shortest routes for a static graph.
+
+    distances[i][j] is the length of the shortest route from nodes[i] to
+    nodes[j] (None when unreachable) and next_hops[i][j] is the index of the
+    first node after nodes[i] on that route, so a lookup is a table walk.
+    """
+
+    def __init__(self, nodes: list[int], distances: list[list], next_hops: list[list[int]], source_hash: str = None):
+        self.nodes = nodes
+        self.distances = distances
+        self.next_hops = next_hops
+        self.source_hash = source_hash
+        self.index = {id: i for i, id in enumerate(nodes)}
+
+    @classmethod
+    def build(cls, graph: Graph, source_hash: str = None, workers: int = None) -> "RouteTable":
+        """Run Dijkstra from every node, in parallel across a process pool.
+
+        workers is the pool size (None uses every core, 1 runs in-process).
+        """
+        nodes = list(graph.paths)
+        if workers == 1 or len(nodes) < 2:
+            _init_worker(graph, nodes)
+            rows = [_table_row(source) for source in nodes]
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(graph, nodes)) as pool:
+                rows = list(pool.map(_table_row, nodes, chunksize=max(1, len(nodes) // 64)))
+
+        distances = [row[0] for row in rows]
+        next_hops = [row[1] for row in rows]
+        return cls(nodes, distances, next_hops, source_hash)
+
+    def find_shortest_path(self, start_id: int, end_id: int) -> tuple[list[int], int]:
+        """Look up the shortest path, returning the same shape as Graph.find_shortest_path."""
+        start = self.index[start_id]
+        end = self.index[end_id]
+        distance = self.distances[start][end]
+        if distance is None:
+            return [], 10**6
+
+        path = [start_id]
+        current = start
+        while current != end:
+            current = self.next_hops[current][end]
+            path.append(self.nodes[current])
+        return path, distance
+
+    def save(self, path: str):
+        """Write the table to a JSON file."""
+        with open(path, "w") as file:
+            json.dump({
+                "source_hash": self.source_hash,
+                "nodes": self.nodes,
+                "distances": self.distances,
+                "next_hops": self.next_hops,
+            }, file, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, path: str, source_hash: str = None) -> "RouteTable":
+        """Read a table from a JSON file.
+
+        Returns None if the file is missing or unreadable, or if source_hash
+        is given and the table was built from a different map.
+        """
+        try:
+            with open(path, "r") as file:
+                data = json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+        if source_hash is not None and data.get("source_hash") != source_hash:
+            return None
+        return cls(data["nodes"], data["distances"], data["next_hops"], data.get("source_hash"))
+
+    @classmethod
+    def load_for_map(cls, map_file: str) -> "RouteTable":
+        """Load the table stored next to map_file if it matches the map's content."""
+        table_file = cache_path(map_file, "routes.json")
+        if not os.path.exists(table_file):
+            return None
+        return cls.load(table_file, file_hash(map_file))
+
+    @classmethod
+    def precompute(cls, map_file: str, graph: Graph, workers: int = None) -> "RouteTable":
+        """Return an up to date table for map_file, rebuilding and saving it if stale."""
+        table = cls.load_for_map(map_file)
+        if table is None:
+            table = cls.build(graph, file_hash(map_file), workers)
+            table.save(cache_path(map_file, "routes.json"))
+        return table
+
+# Worker process state, set once per process by the pool initializer
+_graph = None
+_nodes = None
+_index = None
+
+def _init_worker(graph: Graph, nodes: list[int]):
+    global _graph, _nodes, _index
+    _graph = graph
+    _nodes = nodes
+    _index = {id: i for i, id in enumerate(nodes)}
+
+def _table_row(source_id: int) -> tuple[list, list[int]]:
+    """Build one row of the distance and next-hop tables."""
+    distances, previous = _graph.shortest_path_tree(source_id, cache=False)
+    distance_row = [None] * len(_nodes)
+    hop_row = [UNREACHABLE] * len(_nodes)
+
+    # previous is in settle order, so a node's predecessor already has its hop
+    for node, parent in previous.items():
+        i = _index[node]
+        distance_row[i] = distances[node]
+        if parent is None or parent == source_id:
+            hop_row[i] = i
+        else:
+            hop_row[i] = hop_row[_index[parent]]
+    return distance_row, hop_row
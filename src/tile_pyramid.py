@@ -0,0 +1,99 @@
+import json
+import math
+import os
+
+class TilePyramid:
+    """An image stored at several resolutions, each cut into square tiles.
+
+    Level 0 is the full image and every further level halves its width and
+    height, down to a level that fits in a single tile. Drawing picks the
+    coarsest level that still has at least one image pixel per screen pixel
+    and only the tiles overlapping the view, so redraw cost follows the canvas
+    size rather than the image size.
+    """
+
+    MANIFEST = "pyramid.json"
+
+    def __init__(self, levels: list, tile_size: int = 256):
+        """Initialize the pyramid from its level arrays, full resolution first."""
+        self.levels = levels
+        self.tile_size = tile_size
+
+    @classmethod
+    def build(cls, pixels, tile_size: int = 256) -> "TilePyramid":
+        """Build every level from full resolution pixels by averaging 2x2 blocks."""
+        import numpy as np
+
+        levels = [pixels]
+        while max(levels[-1].shape[:2]) > tile_size:
+            level = np.asarray(levels[-1], dtype=np.float32)
+            # Odd edges are padded by repeating the last row or column
+            pad = [(0, level.shape[0] % 2), (0, level.shape[1] % 2)] + [(0, 0)] * (level.ndim - 2)
+            level = np.pad(level, pad, mode="edge")
+            level = (level[0::2, 0::2] + level[1::2, 0::2] + level[0::2, 1::2] + level[1::2, 1::2]) / 4
+            levels.append(np.rint(level).astype(pixels.dtype))
+        return cls(levels, tile_size)
+
+    def save(self, directory: str):
+        """Save the downsampled levels to directory; level 0 is stored by the caller."""
+        import numpy as np
+
+        os.makedirs(directory, exist_ok=True)
+        for number, level in enumerate(self.levels[1:], start=1):
+            np.save(os.path.join(directory, f"level_{number}.npy"), level)
+        manifest = {
+            "tile_size": self.tile_size,
+            "shapes": [list(level.shape) for level in self.levels],
+        }
+        # Written last, so an interrupted save leaves no manifest and is rebuilt
+        with open(os.path.join(directory, self.MANIFEST), "w") as file:
+            json.dump(manifest, file)
+
+    @classmethod
+    def load(cls, directory: str, pixels):
+        """Memory-map the levels saved in directory over pixels, or return None if they don't match."""
+        import numpy as np
+
+        try:
+            with open(os.path.join(directory, cls.MANIFEST), "r") as file:
+                manifest = json.load(file)
+            if manifest["shapes"][0] != list(pixels.shape):
+                return None
+            levels = [pixels]
+            for number, shape in enumerate(manifest["shapes"][1:], start=1):
+                level = np.load(os.path.join(directory, f"level_{number}.npy"), mmap_mode="r")
+                if list(level.shape) != shape:
+                    return None
+                levels.append(level)
+        except (OSError, ValueError, KeyError):
+            return None
+        return cls(levels, manifest["tile_size"])
+
+    def choose_level(self, image_pixels_per_screen_pixel: float) -> int:
+        """Return the coarsest level with at least one image pixel per screen pixel."""
+        if image_pixels_per_screen_pixel <= 1:
+            return 0
+        return min(int(math.log2(image_pixels_per_screen_pixel)), len(self.levels) - 1)
+
+    def region(self, level: int, left: float, right: float, top: float, bottom: float):
+        """Return the tiles of level covering a part of the image, and the part they cover.
+
+        left, right, top and bottom are fractions of the image width and height,
+        measured from its top left corner. The result is the pixels of every
+        overlapping tile as one array, and its own (left, right, top, bottom)
+        as fractions of the image, which are tile aligned.
+        """
+        pixels = self.levels[level]
+        height, width = pixels.shape[:2]
+        tile = self.tile_size
+
+        first_column = max(0, math.floor(left * width / tile))
+        last_column = min(math.ceil(width / tile), math.ceil(right * width / tile))
+        first_row = max(0, math.floor(top * height / tile))
+        last_row = min(math.ceil(height / tile), math.ceil(bottom * height / tile))
+        if first_column >= last_column or first_row >= last_row:
+            return None, None
+
+        x_0, x_1 = first_column * tile, min(last_column * tile, width)
+        y_0, y_1 = first_row * tile, min(last_row * tile, height)
+        return pixels[y_0:y_1, x_0:x_1], (x_0 / width, x_1 / width, y_0 / height, y_1 / height)
@@ -1,8 +1,11 @@
-import matplotlib.pyplot as plt
-import matplotlib.image as mpimg
 import tkinter as tk
 from matplotlib.patches import FancyBboxPatch
 
+# Where the background image sits in map coordinates
+BACKGROUND_WIDTH, BACKGROUND_HEIGHT = 2600, 1674
+BACKGROUND_EXTENT = [-BACKGROUND_WIDTH // 2, BACKGROUND_WIDTH // 2,
+                     -BACKGROUND_HEIGHT // 2, BACKGROUND_HEIGHT // 2]
+
 def extract_coordinates_and_labels(locations):
     """Extract x, y coordinates and labels from the locations list."""
     x_coords = []
@@ -22,14 +25,18 @@ def extract_coordinates_and_labels(locations):
 def add_background_image(ax, background_image_path):
     """Add a background image to the plot."""
     if background_image_path:
+        import matplotlib.image as mpimg  # only needed here, so not imported at startup
         try:
             img = mpimg.imread(background_image_path)
-            img_height, img_width = 1674, 2600
-            extent = [-img_width // 2, img_width // 2, -img_height // 2, img_height // 2]
-            ax.imshow(img, extent=extent, aspect='auto')
+            ax.imshow(img, extent=BACKGROUND_EXTENT, aspect='auto')
         except FileNotFoundError:
             print(f"Background image not found at: {background_image_path}")
 
+def set_background_limits(ax):
+    """Fit the axes to the background image before the image itself is drawn."""
+    ax.set_xlim(BACKGROUND_EXTENT[0], BACKGROUND_EXTENT[1])
+    ax.set_ylim(BACKGROUND_EXTENT[2], BACKGROUND_EXTENT[3])
+
 def plot_locations(locations, background_image_path=None, allow_selection=False):
     """
     Plot the locations on a 2D map using matplotlib with an optional background image.
@@ -47,6 +54,8 @@ def plot_locations(locations, background_image_path=None, allow_selection=False)
         print("No locations available to plot.")
         return None
 
+    import matplotlib.pyplot as plt  # pyplot is only used by this standalone plot
+
     # Extract coordinates and labels
     x_coords, y_coords, labels = extract_coordinates_and_labels(locations)
 
@@ -92,48 +101,28 @@ def plot_locations(locations, background_image_path=None, allow_selection=False)
 
     return selected_point[0] if selected_point else None
 
-def select_nearest_location(event, locations):
+def select_nearest_location(event, location_manager):
     """Find the nearest location to the clicked coordinates."""
     if event.xdata is not None and event.ydata is not None:
-        nearest_location = min(
-            locations,
-            key=lambda loc: ((loc["x"] - event.xdata) ** 2 + (loc["y"] - event.ydata) ** 2) ** 0.5,
-        )
-        return nearest_location
+        return location_manager.nearest_visible_location(event.xdata, event.ydata)
     return None
 
-def parse_route_details(route_text):
-    """Parse route details from the route text."""
-    route_details = route_text.split(":")[1].strip()
-    location_names_part = route_details.split(" (")[0]
-    location_names = location_names_part.strip("[]").replace("'", "").split(", ")
-
-    distance_start = route_text.rfind("(Distance: ") + len("(Distance: ")
-    distance_end = route_text.rfind("m)")
-    distance = route_text[distance_start:distance_end].strip()
-
-    return location_names, distance
-
-
-def format_route_label(current_index, history, location_names, distance):
+def format_route_label(position, count, location_names, distance):
     """Format the route label text."""
     if len(location_names) >= 2:
         from_location = location_names[0]
         to_location = location_names[-1]
-        route_index = f"Route {current_index + 1}/{len(history)}"
+        route_index = f"Route {position}/{count}"
         return f"{route_index}\nFrom: {from_location}\nTo: {to_location}\nDistance: {distance}m"
     else:
         return "Invalid route data."
 
 
-def update_route_on_map(ax, canvas, location_manager, location_names):
+def update_route_on_map(ax, blitter, location_manager, location_ids):
     """Update the route on the map."""
-    # Convert location names to IDs
-    location_ids = [location_manager.get_location_id(name) for name in location_names]
-
     # Clear the previous route line from the map
-    for line in ax.lines:
-        if line.get_label() == "Shortest Route":
+    for line in list(ax.lines):
+        if line.get_label() in ("Shortest Route", "Alternative Route"):
             line.remove()
 
     # Get coordinates for the route and draw it on the map
@@ -141,9 +130,8 @@ def update_route_on_map(ax, canvas, location_manager, location_names):
         location_manager.get_location_coordinates(location_id) for location_id in location_ids
     ]
     x_coords, y_coords = zip(*route_coords)
-    ax.plot(x_coords, y_coords, color="red", linewidth=2, label="Shortest Route")
-    ax.legend()
-    canvas.draw()
+    blitter.add_artists(ax.plot(x_coords, y_coords, color="red", linewidth=2, label="Shortest Route"))
+    blitter.update()
     
 def create_popup_window(title, width, height):
     """Create and configure a popup window."""
@@ -157,7 +145,7 @@ def clear_current_marker(current_marker, ax):
     if current_marker and current_marker[0] in ax.lines:
         current_marker[0].remove()
 
-def render_location_info(ax, canvas, text, textX, textY):
+def render_location_info(ax, blitter, text, textX, textY):
     """Render location info as a text box on the map."""
     # Clear previous info card
     if hasattr(render_location_info, "previous_text_obj") and render_location_info.previous_text_obj:
@@ -171,8 +159,8 @@ def render_location_info(ax, canvas, text, textX, textY):
         render_location_info.previous_box = None
 
     # Render the new text
-    text_obj = ax.text(textX, textY, text, va='top', ha='left')
-    renderer = canvas.get_renderer()
+    text_obj = blitter.add_artist(ax.text(textX, textY, text, va='top', ha='left'))
+    renderer = blitter.canvas.get_renderer()
     bbox = text_obj.get_window_extent(renderer=renderer)
     inv = ax.transData.inverted()
     bbox_data = bbox.transformed(inv)
@@ -183,14 +171,14 @@ def render_location_info(ax, canvas, text, textX, textY):
     box = FancyBboxPatch((textX - 10, textY - height - 10), width + 20, height + 20,
                          boxstyle="round,pad=3", edgecolor='black',
                          facecolor='lightyellow', zorder=1)
-    ax.add_patch(box)
+    blitter.add_artist(ax.add_patch(box))
 
     # Save references to the current text and box
     render_location_info.previous_text_obj = text_obj
     render_location_info.previous_box = box
 
     # Render to canvas
-    canvas.draw()
+    blitter.update()
 
 def add_menu_buttons(menu_frame, buttons) -> list[tk.Button]:
     """Add buttons to the menu frame."""
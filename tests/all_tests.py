@@ -1,15 +1,45 @@
 import unittest
+from background_tester import background_tests
+from batch_routes_tester import batch_routes_tests
+from binary_map_tester import binary_map_tests
+from core_tester import core_tests
 from graph_tester import graph_tests
+from instrumentation_tester import instrumentation_tests
+from kd_tree_tester import kd_tree_tests
+from location_manager_tester import location_manager_tests
+from name_index_tester import name_index_tests
 from queue_tester import queue_tests
+from recent_items_tester import recent_items_tests
+from route_cache_tester import route_cache_tests
+from route_history_tester import route_history_tests
+from route_table_tester import route_table_tests
+from search_frequency_tester import search_frequency_tests
+from set_tester import set_tests
 from stack_tester import stack_tests
+from tile_pyramid_tester import tile_pyramid_tests
 from tree_tester import tree_tests
 
 def suite():
     loader = unittest.TestLoader()
     suite = unittest.TestSuite()
+    suite.addTest(loader.loadTestsFromTestCase(background_tests))
+    suite.addTest(loader.loadTestsFromTestCase(batch_routes_tests))
+    suite.addTest(loader.loadTestsFromTestCase(binary_map_tests))
+    suite.addTest(loader.loadTestsFromTestCase(core_tests))
     suite.addTest(loader.loadTestsFromTestCase(graph_tests))
+    suite.addTest(loader.loadTestsFromTestCase(instrumentation_tests))
+    suite.addTest(loader.loadTestsFromTestCase(kd_tree_tests))
+    suite.addTest(loader.loadTestsFromTestCase(location_manager_tests))
+    suite.addTest(loader.loadTestsFromTestCase(name_index_tests))
     suite.addTest(loader.loadTestsFromTestCase(queue_tests))
+    suite.addTest(loader.loadTestsFromTestCase(recent_items_tests))
+    suite.addTest(loader.loadTestsFromTestCase(route_cache_tests))
+    suite.addTest(loader.loadTestsFromTestCase(route_history_tests))
+    suite.addTest(loader.loadTestsFromTestCase(route_table_tests))
+    suite.addTest(loader.loadTestsFromTestCase(search_frequency_tests))
+    suite.addTest(loader.loadTestsFromTestCase(set_tests))
     suite.addTest(loader.loadTestsFromTestCase(stack_tests))
+    suite.addTest(loader.loadTestsFromTestCase(tile_pyramid_tests))
     suite.addTest(loader.loadTestsFromTestCase(tree_tests))
     return suite
 
@@ -0,0 +1,73 @@
+import unittest
+import sys
+import os
+import tempfile
+
+import numpy as np
+from PIL import Image
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+from background import BackgroundImage
+
+class background_tests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.image_file = os.path.join(self.directory.name, 'map.png')
+        self.pixels = np.arange(6 * 4 * 4, dtype=np.uint8).reshape(6, 4, 4)
+        Image.fromarray(self.pixels, 'RGBA').save(self.image_file)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_cache(self):
+        pixels = BackgroundImage(self.image_file).load()
+        self.assertTrue(np.array_equal(pixels, self.pixels))
+        self.assertTrue(os.path.exists(os.path.join(self.directory.name, 'map.npy')))
+        self.assertTrue(os.path.exists(os.path.join(self.directory.name, 'map.tiles', 'pyramid.json')))
+
+        # The second load maps the cached pixels instead of decoding
+        cached = BackgroundImage(self.image_file).load()
+        self.assertIsInstance(cached, np.memmap)
+        self.assertTrue(np.array_equal(cached, self.pixels))
+        del cached
+
+        # A changed image makes the cache stale
+        Image.fromarray(self.pixels[::-1].copy(), 'RGBA').save(self.image_file)
+        os.utime(self.image_file, (os.path.getmtime(self.image_file) + 10,) * 2)
+        pixels = BackgroundImage(self.image_file).load()
+        self.assertNotIsInstance(pixels, np.memmap)
+        self.assertTrue(np.array_equal(pixels, self.pixels[::-1]))
+
+    def test_converts_to_rgba(self):
+        rgb = self.pixels[:, :, :3].copy()
+        Image.fromarray(rgb, 'RGB').save(self.image_file)
+        pixels = BackgroundImage(self.image_file, cache=False).load()
+        self.assertEqual(pixels.shape, (6, 4, 4))
+        self.assertTrue(np.array_equal(pixels[:, :, :3], rgb))
+        self.assertTrue((pixels[:, :, 3] == 255).all())
+
+        palette = Image.fromarray(rgb, 'RGB').convert('P')
+        palette.save(self.image_file)
+        pixels = BackgroundImage(self.image_file, cache=False).load()
+        self.assertEqual(pixels.dtype, np.uint8)
+        self.assertTrue(np.array_equal(pixels, np.asarray(palette.convert('RGBA'))))
+
+    def test_load_async(self):
+        background = BackgroundImage(self.image_file, cache=False, tile_size=2)
+        self.assertFalse(background.ready())
+        background.load_async()
+        background._thread.join()
+        self.assertTrue(background.ready())
+        self.assertIsNone(background.error)
+        self.assertTrue(np.array_equal(background.pixels, self.pixels))
+        self.assertEqual([level.shape[:2] for level in background.pyramid.levels], [(6, 4), (3, 2), (2, 1)])
+        self.assertFalse(os.path.exists(os.path.join(self.directory.name, 'map.npy')))
+
+        missing = BackgroundImage(os.path.join(self.directory.name, 'missing.png'))
+        missing.load_async()
+        missing._thread.join()
+        self.assertIsNone(missing.pixels)
+        self.assertIn('not found', missing.error)
+
+if __name__ == '__main__':
+    unittest.main()
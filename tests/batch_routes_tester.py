@@ -0,0 +1,40 @@
+import unittest
+import sys
+import os
+import io
+import json
+import contextlib
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(os.path.join(ROOT, 'src'))
+import batch_routes as batch_routes_module
+from batch_routes import read_pairs, batch_routes
+
+MAP_FILE = os.path.join(ROOT, 'data', 'campus_map.json')
+FEATURES_FILE = os.path.join(ROOT, 'data', 'location_features.json')
+
+class batch_routes_tests(unittest.TestCase):
+    def test_read_pairs(self):
+        csv_file = io.StringIO('start,end\nAdams/Winship Lower,7\n-1,2\n')
+        self.assertEqual(list(read_pairs(csv_file)), [('Adams/Winship Lower', '7'), ('-1', '2')])
+        jsonl_file = io.StringIO('{"start": 1, "end": "UC Main Entrance"}\n\n{"start": -1, "end": 2}\n')
+        self.assertEqual(list(read_pairs(jsonl_file)), [(1, 'UC Main Entrance'), (-1, 2)])
+
+    def test_batch_routes(self):
+        pairs = [('Adams/Winship Lower', 'UC Main Entrance'), ('1', '2'), (1, 7), ('Nowhere', 1), (1, 999)]
+        with contextlib.redirect_stderr(io.StringIO()):
+            serial = [json.loads(line) for line in batch_routes(pairs, MAP_FILE, FEATURES_FILE, workers=1)]
+            # The repeated origin was searched into a local tree, not the shared cache
+            self.assertEqual(len(batch_routes_module._core.graph.tree_cache), 0)
+            pooled = [json.loads(line) for line in batch_routes(pairs, MAP_FILE, FEATURES_FILE, workers=2, chunk_size=2)]
+        self.assertEqual(serial, pooled)
+
+        self.assertEqual(serial[0], {'start': 1, 'end': 7, 'path': [1, 4, 2, -1, -3, -4, 7],
+                                     'distance': 417, 'nodes': 7})
+        self.assertEqual(serial[1]['path'], [1, 4, 2])
+        self.assertEqual(serial[2], serial[0])
+        self.assertIn('error', serial[3])
+        self.assertIn('999', serial[4]['error'])
+
+if __name__ == '__main__':
+    unittest.main()
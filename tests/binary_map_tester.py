@@ -0,0 +1,68 @@
+import unittest
+import sys
+import os
+import tempfile
+import contextlib
+import io
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from src.data_structures.binary_map import BinaryMap
+from src.data_structures.graph import Graph
+
+DATA = {
+    'locations': [
+        {'id': 1, 'name': 'Café', 'category': 'Dining', 'x': -5, 'y': 3, 'pointOfInterest': True},
+        {'id': -2, 'name': 'Path', 'x': 0, 'y': 0, 'pointOfInterest': False},
+        {'id': 7, 'name': 'Library', 'category': 'Dining', 'x': 2.5, 'y': 10, 'pointOfInterest': True},
+    ],
+    'connections': [{'from': 1, 'to': -2, 'distance': 4}, {'from': -2, 'to': 7, 'distance': 6}],
+}
+
+class binary_map_tests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'map.bin')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_round_trip(self):
+        BinaryMap.from_data(DATA).save(self.path, 'abc')
+        loaded = BinaryMap.load(self.path, 'abc')
+        self.assertEqual(loaded.locations(), DATA['locations'])
+        self.assertEqual(loaded.edge_from.tolist(), [1, -2])
+        self.assertEqual(loaded.edge_distance.format, 'q')
+        self.assertEqual(loaded.x.format, 'd')
+        self.assertEqual(loaded.string(loaded.category[2]), 'Dining')
+        self.assertEqual(len(loaded.string_offsets), 4 + 1)
+
+        # A saved map can be saved again from its mapped sections
+        copy = os.path.join(self.directory.name, 'copy.bin')
+        loaded.save(copy)
+        self.assertEqual(BinaryMap.load(copy).locations(), DATA['locations'])
+
+        empty = os.path.join(self.directory.name, 'empty.bin')
+        BinaryMap.from_data({}).save(empty)
+        self.assertEqual(BinaryMap.load(empty).locations(), [])
+
+    def test_stale_or_invalid(self):
+        BinaryMap.from_data(DATA).save(self.path, 'abc')
+        self.assertIsNone(BinaryMap.load(self.path, 'other'))
+        self.assertIsNone(BinaryMap.load(os.path.join(self.directory.name, 'missing.bin')))
+        with open(self.path, 'r+b') as file:
+            file.write(b'NOTAMAP!')
+        self.assertIsNone(BinaryMap.load(self.path))
+
+    def test_graph(self):
+        BinaryMap.from_data(DATA).save(self.path)
+        binary = Graph()
+        for location in DATA['locations']:
+            binary.add_node(location['id'])
+        with contextlib.redirect_stdout(io.StringIO()):
+            binary.load_from_binary(BinaryMap.load(self.path))
+        self.assertEqual(binary.paths, {1: {-2: 4}, -2: {1: 4, 7: 6}, 7: {-2: 6}})
+        self.assertEqual(binary.edge_count, 2)
+        self.assertEqual(binary.find_shortest_path(1, 7), ([1, -2, 7], 10))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+import sys
+import os
+import tempfile
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(os.path.join(ROOT, 'src'))
+from core import CampusNavCore
+
+class core_tests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.core = CampusNavCore(os.path.join(ROOT, 'data', 'campus_map.json'),
+                                 os.path.join(ROOT, 'data', 'location_features.json'))
+
+    def test_alternative_routes(self):
+        route, distance = self.core.find_route(1, 7)
+        for method in ('penalty', 'yen'):
+            routes = self.core.find_alternative_routes(1, 7, 3, method=method)
+            self.assertEqual(routes[0][1], distance)
+            self.assertEqual(len({tuple(path) for path, _ in routes}), len(routes))
+            self.assertEqual([d for _, d in routes], sorted(d for _, d in routes))
+
+    def test_find_route(self):
+        route, distance = self.core.find_route_by_name('Adams/Winship Lower', 'UC Main Entrance')
+        self.assertEqual(route, [1, 4, 2, -1, -3, -4, 7])
+        self.assertEqual(distance, 417)
+        names = self.core.route_names(route)
+        self.assertEqual((names[0], names[-1]), ('Adams/Winship Lower', 'UC Main Entrance'))
+        self.assertEqual(self.core.route_coordinates(route)[0], (-960, -260))
+
+    def test_load(self):
+        self.assertEqual(list(self.core.load_timings),
+                         ['read', 'locations', 'graph', 'routing data', 'location tree', 'search index'])
+        self.assertEqual(self.core.graph.node_count, len(self.core.location_manager.locations))
+        self.assertEqual(self.core.graph.edge_count, 62)
+
+    def test_missing_map(self):
+        with tempfile.TemporaryDirectory() as directory:
+            core = CampusNavCore(os.path.join(directory, 'campus_map.json'),
+                                 os.path.join(directory, 'location_features.json'))
+        self.assertEqual(core.graph.node_count, 0)
+        self.assertIsNone(core.graph.hierarchy)
+
+    def test_search_names(self):
+        self.assertEqual(self.core.search_names('uc main')[0], ('UC Main Entrance', 'UC Main Entrance'))
+        self.assertIn(('Panda Express', 'UC Main Entrance'), self.core.search_names('panda'))
+        self.assertEqual(self.core.search_names('Mercr Hal', 1), [('Mercer Hall', 'Mercer Hall')])
+        self.assertEqual(len(self.core.sorted_location_names), len(self.core.location_manager.locations))
+
+    def test_lookups(self):
+        self.assertEqual(self.core.nearest_location(-955, -255)['id'], 1)
+        self.assertIn('Contains:', self.core.location_info('UC Main Entrance'))
+        self.assertIn('no notable', self.core.location_info('Baseball Stadium'))
+        self.assertIn('Dorms', self.core.location_tree.get_children('Campus'))
+
+        nearest = self.core.nearest_points_of_interest(1, limit=3)
+        self.assertEqual(len(nearest), 3)
+        self.assertEqual(nearest, sorted(nearest))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,9 +1,12 @@
 import unittest
 import sys
 import os
+import random
+import tempfile
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from src.data_structures.graph import Graph
+from src.data_structures.contraction_hierarchy import ContractionHierarchy
 
 class graph_tests(unittest.TestCase):
     def test_graph(self):
@@ -32,7 +35,227 @@ class graph_tests(unittest.TestCase):
         self.assertEqual(path, [0, 1, 2, 3])
         self.assertEqual(dis, 30)
         self.assertEqual(g.get_edge_weight(0, 4), 10)
-        
+
+    def test_bulk_edges(self):
+        g = Graph.from_arrays([1, 2, 3, 4], [1, 2], [2, 3], [5, 7])
+        self.assertEqual(g.paths, {1: {2: 5}, 2: {1: 5, 3: 7}, 3: {2: 7}, 4: {}})
+        self.assertEqual((g.node_count, g.edge_count), (4, 2))
+        version = g.version
+
+        g.add_edges([3], [4], [1])
+        self.assertGreater(g.version, version)
+        self.assertEqual(g.find_shortest_path(1, 4), ([1, 2, 3, 4], 13))
+
+        # Nothing is added when any edge is invalid
+        self.assertRaises(ValueError, g.add_edges, [1, 9], [4, 1], [1, 1])
+        self.assertNotIn(4, g.paths[1])
+        self.assertRaises(ValueError, g.add_edges, [1], [4], [])
+        self.assertRaises(ValueError, Graph.from_arrays, [1, 2, 1], [], [], [])
+        self.assertEqual(Graph.from_arrays([1], [], [], [], cache_size=0).route_cache.maxsize, 0)
+
+    def test_astar(self):
+        # Without caches every call below runs its own search
+        g = Graph(cache_size=0, tree_budget=0)
+        coords = {}
+        for row in range(5):
+            for col in range(5):
+                g.add_node(row * 5 + col)
+                coords[row * 5 + col] = (col * 10, row * 10)
+        for row in range(5):
+            for col in range(5):
+                id = row * 5 + col
+                if col < 4:
+                    g.add_edge(id, id + 1, 10 + (id * 7) % 13)
+                if row < 4:
+                    g.add_edge(id, id + 5, 10 + (id * 11) % 17)
+
+        for start, end in [(0, 24), (4, 20), (12, 3), (7, 7)]:
+            path, dis = g.find_shortest_path_astar(start, end, coords)
+            self.assertEqual(dis, g.find_shortest_path(start, end)[1])
+            self.assertEqual(path[0], start)
+            self.assertEqual(path[-1], end)
+
+        g.find_shortest_path(0, 24)
+        dijkstra_settled = g.settled_count
+        g.find_shortest_path_astar(0, 24, coords)
+        self.assertLessEqual(g.settled_count, dijkstra_settled)
+
+    def test_astar_fallback(self):
+        g = Graph()
+        for i in range(3):
+            g.add_node(i)
+        g.add_edge(0, 1, 0)
+        g.add_edge(1, 2, 5)
+        coords = {0: (0, 0), 1: (100, 0), 2: (100, 5)}
+
+        self.assertEqual(g.heuristic_scale(coords), 0)
+        self.assertEqual(g.find_shortest_path_astar(0, 2, coords), ([0, 1, 2], 5))
+        self.assertEqual(g.heuristic_scale({0: (0, 0)}), 0)
+
+    def random_graph(self, rng, node_count, edge_count, weight):
+        g = Graph()
+        for i in range(node_count):
+            g.add_node(i)
+        for _ in range(edge_count):
+            a, b = rng.sample(range(node_count), 2)
+            if b not in g.paths[a]:
+                g.add_edge(a, b, weight())
+        return g
+
+    def assert_valid_path(self, g, path, dis):
+        self.assertEqual(sum(g.get_edge_weight(a, b) for a, b in zip(path, path[1:])), dis)
+
+    def test_bidirectional_matches_dijkstra(self):
+        rng = random.Random(0)
+        for trial in range(200):
+            node_count = rng.randint(2, 30)
+            g = self.random_graph(rng, node_count, rng.randint(0, 3 * node_count),
+                                  lambda: rng.randint(0, 20))
+            for _ in range(5):
+                start, end = rng.randrange(node_count), rng.randrange(node_count)
+                path, dis = g.find_shortest_path_bidirectional(start, end)
+                expected_path, expected_dis = g.find_shortest_path(start, end)
+                self.assertEqual(dis, expected_dis)
+                self.assertEqual(bool(path), bool(expected_path))
+                if path:
+                    self.assertEqual((path[0], path[-1]), (start, end))
+                    self.assert_valid_path(g, path, dis)
+
+    def test_bidirectional_unique_paths(self):
+        # Distinct powers of two never tie, so the shortest path is unique
+        rng = random.Random(1)
+        for trial in range(100):
+            node_count = rng.randint(2, 25)
+            exponents = iter(rng.sample(range(200), 200))
+            g = self.random_graph(rng, node_count, 3 * node_count, lambda: 2 ** next(exponents))
+            for _ in range(5):
+                start, end = rng.randrange(node_count), rng.randrange(node_count)
+                self.assertEqual(g.find_shortest_path_bidirectional(start, end),
+                                 g.find_shortest_path(start, end))
+
+    def test_distance_matrix(self):
+        rng = random.Random(4)
+        for trial in range(30):
+            node_count = rng.randint(2, 30)
+            g = self.random_graph(rng, node_count, rng.randint(0, 3 * node_count),
+                                  lambda: rng.randint(0, 20))
+            sources = [rng.randrange(node_count) for _ in range(rng.randint(1, 8))]
+            targets = [rng.randrange(node_count) for _ in range(rng.randint(1, 8))]
+            if trial % 3 == 0:
+                g.shortest_path_tree(sources[0])  # served from the cached tree
+            matrix = g.distance_matrix(sources, targets)
+            self.assertEqual(matrix.shape, (len(sources), len(targets)))
+            for i, start in enumerate(sources):
+                for j, end in enumerate(targets):
+                    path, dis = g.find_shortest_path(start, end)
+                    self.assertEqual(matrix[i, j], dis if path else float('inf'))
+
+        self.assertEqual(g.distance_matrix(sources, targets, workers=2).tolist(), matrix.tolist())
+        with self.assertRaises(KeyError):
+            g.distance_matrix([0], [node_count])
+
+    def simple_path_lengths(self, g, start, end):
+        lengths = []
+        def extend(path, dis):
+            if path[-1] == end:
+                lengths.append(dis)
+                return
+            for neighbor, weight in g.paths[path[-1]].items():
+                if neighbor not in path:
+                    extend(path + [neighbor], dis + weight)
+        extend([start], 0)
+        return sorted(lengths)
+
+    def test_k_shortest_paths(self):
+        rng = random.Random(5)
+        for trial in range(60):
+            node_count = rng.randint(2, 9)
+            g = self.random_graph(rng, node_count, rng.randint(0, 2 * node_count),
+                                  lambda: rng.randint(0, 20))
+            start, end = rng.randrange(node_count), rng.randrange(node_count)
+            k = rng.randint(1, 6)
+            paths = g.find_k_shortest_paths(start, end, k)
+            self.assertEqual([dis for _, dis in paths], self.simple_path_lengths(g, start, end)[:k])
+            self.assertEqual(len({tuple(path) for path, _ in paths}), len(paths))
+            for path, dis in paths:
+                self.assertEqual((path[0], path[-1]), (start, end))
+                self.assertEqual(len(set(path)), len(path))
+                self.assert_valid_path(g, path, dis)
+
+    def test_alternative_routes(self):
+        rng = random.Random(6)
+        for trial in range(60):
+            node_count = rng.randint(2, 30)
+            g = self.random_graph(rng, node_count, rng.randint(0, 3 * node_count),
+                                  lambda: rng.randint(1, 20))
+            start, end = rng.randrange(node_count), rng.randrange(node_count)
+            routes = g.find_alternative_routes(start, end, count=3)
+            shortest_path, shortest = g.find_shortest_path(start, end)
+            if not shortest_path:
+                self.assertEqual(routes, [])
+                continue
+            self.assertTrue(1 <= len(routes) <= 3)
+            self.assertEqual(routes[0][1], shortest)
+            self.assertEqual(len({tuple(path) for path, _ in routes}), len(routes))
+            for path, dis in routes:
+                self.assertEqual((path[0], path[-1]), (start, end))
+                self.assert_valid_path(g, path, dis)
+            # Starting from the route already found gives the same routes
+            self.assertEqual(g.find_alternative_routes(start, end, count=3,
+                                                       primary=(shortest_path, shortest)), routes)
+
+    def test_contraction_hierarchy(self):
+        rng = random.Random(2)
+        for trial in range(50):
+            node_count = rng.randint(2, 40)
+            g = self.random_graph(rng, node_count, 2 * node_count, lambda: rng.randint(0, 20))
+            g.build_contraction_hierarchy(witness_limit=rng.choice([1, 64]))
+            for _ in range(10):
+                start, end = rng.randrange(node_count), rng.randrange(node_count)
+                path, dis = g.find_shortest_path_ch(start, end)
+                self.assertEqual(dis, g.find_shortest_path(start, end)[1])
+                if path:
+                    self.assertEqual((path[0], path[-1]), (start, end))
+                    self.assert_valid_path(g, path, dis)
+
+    def test_contraction_hierarchy_save_and_load(self):
+        g = self.random_graph(random.Random(3), 20, 40, lambda: 5)
+        hierarchy = g.build_contraction_hierarchy()
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'hierarchy.json')
+            hierarchy.save(path, 'abc')
+            self.assertIsNone(ContractionHierarchy.load(path, 'def'))
+            loaded = ContractionHierarchy.load(path, 'abc')
+        for start in range(20):
+            self.assertEqual(loaded.find_shortest_path(start, 19), hierarchy.find_shortest_path(start, 19))
+
+        g.add_node(20)
+        self.assertIsNone(g.hierarchy)
+
+    def test_compact_graph(self):
+        rng = random.Random(4)
+        for trial in range(50):
+            node_count = rng.randint(2, 30)
+            g = self.random_graph(rng, node_count, 2 * node_count, lambda: rng.randint(0, 20))
+            compact = g.freeze()
+            self.assertEqual(compact.edge_count, g.edge_count)
+            for start, neighbors in g.paths.items():
+                for end, weight in neighbors.items():
+                    self.assertEqual(compact.get_edge_weight(start, end), weight)
+            for _ in range(10):
+                start, end = rng.randrange(node_count), rng.randrange(node_count)
+                self.assertEqual(compact.find_shortest_path(start, end)[1], g.find_shortest_path(start, end)[1])
+
+        coords = {i: (i, 0) for i in range(4)}
+        g = Graph()
+        for i in range(4):
+            g.add_node(i)
+        g.add_edge(0, 1, 2)
+        g.add_edge(1, 2, 2)
+        g.add_edge(0, 3, 9)
+        compact = g.freeze()
+        self.assertEqual(compact.find_shortest_path_astar(0, 2, coords), ([0, 1, 2], 4))
+        self.assertRaises(KeyError, compact.get_edge_weight, 1, 3)
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
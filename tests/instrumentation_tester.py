@@ -0,0 +1,49 @@
+import unittest
+import sys
+import os
+import json
+import tempfile
+from unittest import mock
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+from instrumentation import LatencyRecorder, Profiler
+
+class Routes:
+    def find(self, depth):
+        return self.find(depth - 1) if depth else 'done'
+
+class instrumentation_tests(unittest.TestCase):
+    def test_percentiles(self):
+        r = LatencyRecorder(window=100)
+        for ms in range(1, 201):
+            r.record('draw', ms / 1000)
+        summary = r.summary()['draw']
+        self.assertEqual(summary['count'], 200)
+        self.assertAlmostEqual(summary['p50_ms'], 150)
+        self.assertAlmostEqual(summary['p99_ms'], 199)
+
+    def test_phases_attributed_to_handler(self):
+        p = Profiler()
+        routes = Routes()
+        p.instrument(routes, ['find'], 'routing')
+        handler = p.wrap_handler('click', lambda: routes.find(3))
+        self.assertEqual(handler(), 'done')
+
+        summary = p.recorder.summary()
+        self.assertEqual(summary['handler:click']['count'], 1)
+        # Recursive calls inside the phase are timed once
+        self.assertEqual(summary['click/routing']['count'], 1)
+
+        with tempfile.TemporaryDirectory() as folder:
+            path = p.dump(os.path.join(folder, 'profile.json'))
+            with open(path) as file:
+                self.assertIn('click/routing', json.load(file))
+
+    def test_disabled_by_default(self):
+        # patch.dict restores the variable afterwards if it was set
+        with mock.patch.dict(os.environ):
+            os.environ.pop('CAMPUSNAV_PROFILE', None)
+            self.assertIsNone(Profiler.from_environment())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,34 @@
+import unittest
+import sys
+import os
+import random
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from src.data_structures.kd_tree import KDTree
+
+class kd_tree_tests(unittest.TestCase):
+    def test_nearest(self):
+        t = KDTree([(0, 0, 'a'), (10, 0, 'b'), (0, 10, 'c'), (10, 10, 'd')])
+        self.assertEqual(t.nearest(1, 2), 'a')
+        self.assertEqual(t.nearest(9, 1), 'b')
+        self.assertEqual(t.nearest(8, 7), 'd')
+        self.assertIsNone(KDTree().nearest(0, 0))
+
+    def test_within_radius(self):
+        t = KDTree([(0, 0, 'a'), (3, 0, 'b'), (0, 5, 'c'), (10, 10, 'd')])
+        self.assertEqual(t.within_radius(0, 0, 5), ['a', 'b', 'c'])
+        self.assertEqual(t.within_radius(10, 9, 1), ['d'])
+        self.assertEqual(t.within_radius(50, 50, 1), [])
+
+    def test_matches_linear_scan(self):
+        rng = random.Random(0)
+        points = [(rng.randint(0, 100), rng.randint(0, 100), i) for i in range(500)]
+        t = KDTree(points)
+        for _ in range(200):
+            x, y = rng.uniform(0, 100), rng.uniform(0, 100)
+            best = min((px - x) ** 2 + (py - y) ** 2 for px, py, _ in points)
+            px, py, _ = points[t.nearest(x, y)]
+            self.assertEqual((px - x) ** 2 + (py - y) ** 2, best)
+
+if __name__ == '__main__':
+    unittest.main()
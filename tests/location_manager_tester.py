@@ -0,0 +1,68 @@
+import unittest
+import sys
+import os
+import json
+import shutil
+import tempfile
+import contextlib
+import io
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(os.path.join(ROOT, 'src'))
+from location_manager import LocationManager
+from precompute import precompute_binary_map
+
+class location_manager_tests(unittest.TestCase):
+    def setUp(self):
+        self.manager = LocationManager(os.path.join(ROOT, 'data', 'campus_map.json'),
+                                       os.path.join(ROOT, 'data', 'location_features.json'))
+
+    def test_lookups(self):
+        self.assertEqual(self.manager.get_location_name(1), 'Adams/Winship Lower')
+        self.assertEqual(self.manager.get_location_id('Adams/Winship Lower'), 1)
+        self.assertEqual(self.manager.get_location_coordinates(1), (-960, -260))
+        self.assertEqual(self.manager.get_location_name_from_cords(-960, -260), 'Adams/Winship Lower')
+        self.assertTrue(self.manager.is_point_of_interest('Adams/Winship Lower'))
+        self.assertIsNone(self.manager.search_location('Nowhere'))
+        self.assertRaises(KeyError, self.manager.get_location_name, 10**6)
+
+    def test_add_and_remove(self):
+        self.manager.add_location({'id': 500, 'name': 'Kiosk', 'x': 1, 'y': 2, 'pointOfInterest': False})
+        self.assertEqual(self.manager.get_location_id('Kiosk'), 500)
+        self.assertEqual(self.manager.get_location_name_from_cords(1, 2), 'Kiosk')
+        self.assertRaises(ValueError, self.manager.add_location,
+                          {'id': 500, 'name': 'Other', 'x': 0, 'y': 0, 'pointOfInterest': False})
+
+        self.manager.add_location({'id': 501, 'name': 'Kiosk 2', 'x': 1, 'y': 2, 'pointOfInterest': False})
+        self.manager.remove_location(500)
+        self.assertRaises(KeyError, self.manager.get_location_id, 'Kiosk')
+        self.assertEqual(self.manager.get_location_name_from_cords(1, 2), 'Kiosk 2')
+        self.assertNotIn(500, self.manager.get_location_ids())
+
+    def test_nearest_visible_location(self):
+        self.assertEqual(self.manager.nearest_visible_location(-955, -255)['name'], 'Adams/Winship Lower')
+        nearby = self.manager.visible_locations_within(-960, -260, 100)
+        self.assertEqual(nearby[0]['name'], 'Adams/Winship Lower')
+        self.assertTrue(all(loc['pointOfInterest'] for loc in nearby))
+
+        self.manager.add_location({'id': 500, 'name': 'Kiosk', 'x': -950, 'y': -250, 'pointOfInterest': True})
+        self.assertEqual(self.manager.nearest_visible_location(-955, -255)['name'], 'Kiosk')
+
+if __name__ == '__main__':
+    unittest.main()
+
+    def test_binary_map(self):
+        with tempfile.TemporaryDirectory() as directory, contextlib.redirect_stdout(io.StringIO()):
+            map_file = os.path.join(directory, 'campus_map.json')
+            shutil.copy(os.path.join(ROOT, 'data', 'campus_map.json'), map_file)
+            precompute_binary_map(map_file)
+            self.assertTrue(os.path.exists(os.path.join(directory, 'campus_map.bin')))
+            self.assertEqual(LocationManager(map_file, 'missing.json').locations, self.manager.locations)
+
+            # Once the JSON changes the stale binary is ignored
+            with open(map_file) as file:
+                data = json.load(file)
+            data['locations'][0]['name'] = 'Renamed'
+            with open(map_file, 'w') as file:
+                json.dump(data, file)
+            self.assertEqual(LocationManager(map_file, 'missing.json').get_location_name(1), 'Renamed')
@@ -0,0 +1,46 @@
+import unittest
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from src.data_structures.name_index import NameIndex, normalize, prefix_distance
+
+ENTRIES = [
+    ('Mercer Hall', 'Mercer Hall'),
+    ('Jesse Mercer Statue', 'Jesse Mercer Statue'),
+    ('Mercer Village', 'Mercer Village'),
+    ('Chick-fil-a', 'University Center'),
+    ('University Center', 'University Center'),
+    ('Mercer', 'Mercer'),
+]
+
+class name_index_tests(unittest.TestCase):
+    def setUp(self):
+        self.index = NameIndex(ENTRIES + [ENTRIES[0]])
+
+    def test_normalize(self):
+        self.assertEqual(normalize('  Chick-fil-A! '), 'chick fil a')
+        self.assertEqual(len(self.index), len(ENTRIES))
+
+    def test_prefix(self):
+        self.assertEqual([text for text, _ in self.index.search('merc')],
+                         ['Mercer', 'Mercer Hall', 'Mercer Village', 'Jesse Mercer Statue'])
+        self.assertEqual(self.index.search('MERCER', 1), [('Mercer', 'Mercer')])
+        self.assertEqual(self.index.search('fil'), [('Chick-fil-a', 'University Center')])
+        self.assertEqual(self.index.search('center'), [('University Center', 'University Center')])
+        self.assertEqual(self.index.search(''), [])
+
+    def test_fuzzy(self):
+        self.assertEqual(self.index.search('univrsity')[0], ('University Center', 'University Center'))
+        self.assertEqual(self.index.search('statu')[0][0], 'Jesse Mercer Statue')
+        self.assertEqual(self.index.search('stadium'), [])
+        self.assertEqual(self.index.search('xyz'), [])
+
+    def test_prefix_distance(self):
+        self.assertEqual(prefix_distance('kitten', 'sitting', 5), 2)  # to "sittin"
+        self.assertEqual(prefix_distance('mercr', 'mercer hall', 1), 1)
+        self.assertEqual(prefix_distance('kitten', 'sitting', 1), 2)
+        self.assertEqual(prefix_distance('abc', 'abcdef', 1), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,8 @@
 import unittest
+import random
 import sys
 import os
+from collections import deque
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from src.data_structures.queue import Queue
@@ -39,5 +41,61 @@ class queue_tests(unittest.TestCase):
         q.clear()
         self.assertEqual(len(q), 0)
 
+    def test_falsy_items(self):
+        q = Queue()
+        q.enqueue(0)
+        q.enqueue(None)
+        self.assertFalse(q.isEmpty())
+        self.assertEqual(q.peek(), 0)
+        self.assertEqual(q.dequeue(), 0)
+        self.assertIsNone(q.dequeue())
+        self.assertTrue(q.isEmpty())
+        self.assertRaises(IndexError, q.dequeue)
+        self.assertRaises(IndexError, q.peek)
+
+    def test_default_not_shared(self):
+        q = Queue()
+        q.enqueue(1)
+        self.assertEqual(len(Queue()), 0)
+
+    def test_capacity(self):
+        q = Queue([1, 2], capacity=3)
+        q.enqueue(3)
+        self.assertTrue(q.isFull())
+        self.assertRaises(IndexError, q.enqueue, 4)
+        self.assertRaises(IndexError, q.enqueue_many, [4])
+        self.assertEqual(q.dequeue(), 1)
+        q.enqueue_many([4])
+        self.assertEqual(str(q), '2 3 4')
+        self.assertRaises(IndexError, Queue, [1, 2], capacity=1)
+
+    def test_enqueue_many_and_drain(self):
+        q = Queue(capacity=5)
+        q.enqueue_many([1, 2, 3, 4])
+        self.assertEqual(q.drain(3), [1, 2, 3])
+        q.enqueue_many([5, 6, 7, 8])  # wraps around the end of the buffer
+        self.assertEqual(q.drain(2), [4, 5])
+        self.assertEqual(q.drain(), [6, 7, 8])
+        self.assertEqual(q.drain(), [])
+
+    def test_matches_deque(self):
+        rng = random.Random(0)
+        q, expected = Queue(), deque()
+        for i in range(2000):
+            operation = rng.randrange(4)
+            if operation == 0:
+                q.enqueue(i)
+                expected.append(i)
+            elif operation == 1:
+                items = list(range(i, i + rng.randrange(20)))
+                q.enqueue_many(items)
+                expected.extend(items)
+            elif operation == 2 and expected:
+                self.assertEqual(q.dequeue(), expected.popleft())
+            else:
+                count = rng.randrange(10)
+                self.assertEqual(q.drain(count), [expected.popleft() for _ in range(min(count, len(expected)))])
+            self.assertEqual(list(q), list(expected))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
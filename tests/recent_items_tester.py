@@ -0,0 +1,29 @@
+import unittest
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from src.data_structures.recent_items import RecentItems
+
+class recent_items_tests(unittest.TestCase):
+    def test_touch(self):
+        recent = RecentItems()
+        for item in ['a', 'b', 'c', 'a']:
+            recent.touch(item)
+        self.assertEqual(len(recent), 3)
+        self.assertEqual(recent.most_recent(), ['a', 'c', 'b'])
+        self.assertEqual(recent.most_recent(2), ['a', 'c'])
+        self.assertIn('b', recent)
+        recent.remove('b')
+        self.assertNotIn('b', recent)
+
+    def test_maxsize(self):
+        recent = RecentItems(maxsize=2)
+        for item in ['a', 'b', 'a', 'c']:
+            recent.touch(item)
+        self.assertEqual(list(recent), ['a', 'c'])
+        recent.clear()
+        self.assertEqual(len(recent), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import unittest
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from src.data_structures.graph import Graph
+from src.data_structures.route_cache import RouteCache, ShortestPathTreeCache
+
+class route_cache_tests(unittest.TestCase):
+    def test_lru(self):
+        c = RouteCache(2)
+        c.put(1, 2, [1, 2], 5, 0)
+        c.put(3, 4, [3, 4], 6, 0)
+        self.assertEqual(c.get(2, 1, 0), ([2, 1], 5))
+        c.put(5, 6, [5, 6], 7, 0)
+        self.assertIsNone(c.get(3, 4, 0))
+        self.assertEqual(c.get(1, 2, 0), ([1, 2], 5))
+        self.assertEqual((c.hits, c.misses, c.evictions), (2, 1, 1))
+
+    def test_version_invalidates(self):
+        c = RouteCache(4)
+        c.put(1, 2, [1, 2], 5, 0)
+        self.assertIsNone(c.get(1, 2, 1))
+        self.assertEqual(c.invalidations, 1)
+        self.assertEqual(len(c), 0)
+
+    def test_graph_cache(self):
+        g = Graph(cache_size=8)
+        for i in range(4):
+            g.add_node(i)
+        g.add_edge(0, 1, 1)
+        g.add_edge(1, 2, 1)
+        g.add_edge(0, 2, 5)
+
+        self.assertEqual(g.find_shortest_path(0, 2), ([0, 1, 2], 2))
+        self.assertEqual(g.find_shortest_path(2, 0), ([2, 1, 0], 2))
+        self.assertEqual(g.route_cache.hits, 1)
+
+        g.remove_edge(1, 2)
+        self.assertEqual(g.find_shortest_path(0, 2), ([0, 2], 5))
+        self.assertEqual(g.route_cache.stats()['invalidations'], 1)
+
+        self.assertEqual(Graph(cache_size=0).route_cache.get(0, 1, 0), None)
+
+    def test_tree_budget(self):
+        c = ShortestPathTreeCache(5)
+        c.put(1, {1: 0, 2: 3}, {1: None, 2: 1}, 0)
+        c.put(2, {2: 0, 1: 3}, {2: None, 1: 2}, 0)
+        self.assertIsNotNone(c.get(1, 0))
+        c.put(3, {3: 0, 1: 5}, {3: None, 1: 3}, 0)
+        self.assertNotIn(2, c)
+        self.assertEqual((c.size, c.evictions), (4, 1))
+        c.put(4, dict.fromkeys(range(6), 0), dict.fromkeys(range(6)), 0)
+        self.assertNotIn(4, c)
+        self.assertIsNone(c.get(1, 1))
+
+    def test_graph_trees(self):
+        g = Graph(cache_size=0)
+        for i in range(5):
+            g.add_node(i)
+        g.add_edge(0, 1, 1)
+        g.add_edge(1, 2, 1)
+        g.add_edge(0, 3, 4)
+
+        self.assertEqual(g.distances_from(0, [1, 2, 3, 4]), [(1, 1), (2, 2), (4, 3)])
+        self.assertEqual(g.path_from_tree(0, 2), ([0, 1, 2], 2))
+        self.assertEqual(g.path_from_tree(0, 4), ([], 10**6))
+        # Point queries from either end reuse the cached tree
+        self.assertEqual(g.find_shortest_path(3, 0), ([3, 0], 4))
+        self.assertEqual(g.settled_count, 0)
+        self.assertEqual(g.tree_cache.hits, 3)
+
+        g.add_edge(2, 3, 1)
+        self.assertEqual(g.find_shortest_path(0, 3), ([0, 1, 2, 3], 3))
+
+if __name__ == '__main__':
+    unittest.main()
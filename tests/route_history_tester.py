@@ -0,0 +1,63 @@
+import unittest
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from src.data_structures.route_history import RouteHistory
+
+class route_history_tests(unittest.TestCase):
+    def test_navigation(self):
+        history = RouteHistory()
+        self.assertTrue(history.is_empty())
+        self.assertIsNone(history.latest())
+        history.push([1, 2, 3], 30)
+        history.push([3, 4], 10)
+        history.push([0, 5], 5)
+        self.assertEqual((list(history.current().route), history.position), ([0, 5], 3))
+        self.assertEqual(list(history.back().route), [3, 4])
+        self.assertEqual(list(history.back().route), [1, 2, 3])
+        self.assertEqual(list(history.back().route), [1, 2, 3])
+        self.assertEqual(history.position, 1)
+        self.assertEqual(list(history.forward().route), [3, 4])
+        self.assertEqual(history.position, 2)
+        self.assertEqual(list(history.latest().route), [0, 5])
+
+    def test_duplicates(self):
+        history = RouteHistory()
+        history.push([1, 2, 3], 30)
+        history.push([3, 4], 10)
+        history.push([1, 2, 3], 30)
+        self.assertEqual(len(history), 2)
+        self.assertEqual([list(entry.route) for entry in history], [[3, 4], [1, 2, 3]])
+        self.assertEqual(history.position, 2)
+
+    def test_limits(self):
+        history = RouteHistory(max_entries=3)
+        for i in range(10):
+            history.push([i, i + 1], i)
+        self.assertEqual([entry.distance for entry in history], [7, 8, 9])
+
+        history = RouteHistory(max_bytes=1)
+        history.push(list(range(100)), 1)
+        history.push([1, 2], 2)
+        self.assertEqual(len(history), 1)  # the newest route is always kept
+        self.assertEqual(history.bytes, history.current().size)
+        history.clear()
+        self.assertEqual((len(history), history.bytes), (0, 0))
+
+    def test_lazy_text(self):
+        history = RouteHistory()
+        calls = []
+
+        def route_names(ids):
+            calls.append(ids)
+            return [f'L{i}' for i in ids]
+
+        entry = history.push([1, 2], 25)
+        self.assertEqual(calls, [])
+        self.assertEqual(entry.text(route_names), "Shortest Route: ['L1', 'L2'] (Distance: 25m)")
+        entry.text(route_names)
+        self.assertEqual(calls, [[1, 2]])
+
+if __name__ == '__main__':
+    unittest.main()
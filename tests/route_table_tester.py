@@ -0,0 +1,48 @@
+import unittest
+import sys
+import os
+import tempfile
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+from data_structures.graph import Graph
+from route_table import RouteTable
+
+class route_table_tests(unittest.TestCase):
+    def setUp(self):
+        self.graph = Graph()
+        for i in range(-2, 5):
+            self.graph.add_node(i)
+        self.graph.add_edge(-2, 0, 4)
+        self.graph.add_edge(0, 1, 1)
+        self.graph.add_edge(1, 2, 1)
+        self.graph.add_edge(0, 2, 5)
+        self.graph.add_edge(2, 3, 2)
+        self.graph.add_edge(-1, 3, 7)
+
+    def test_matches_graph(self):
+        for workers in (1, 2):
+            table = RouteTable.build(self.graph, workers=workers)
+            for start in self.graph.paths:
+                for end in self.graph.paths:
+                    self.assertEqual(table.find_shortest_path(start, end)[1],
+                                     self.graph.find_shortest_path(start, end)[1])
+            self.assertEqual(table.find_shortest_path(-2, 3), ([-2, 0, 1, 2, 3], 8))
+            self.assertEqual(table.find_shortest_path(0, 4), ([], 10**6))
+
+    def test_invalidated_by_map_change(self):
+        with tempfile.TemporaryDirectory() as folder:
+            map_file = os.path.join(folder, 'map.json')
+            with open(map_file, 'w') as file:
+                file.write('{"locations": [], "connections": []}')
+
+            table = RouteTable.precompute(map_file, self.graph, workers=1)
+            self.assertIsNotNone(RouteTable.load_for_map(map_file))
+            self.assertEqual(RouteTable.load_for_map(map_file).find_shortest_path(-2, 3),
+                             table.find_shortest_path(-2, 3))
+
+            with open(map_file, 'w') as file:
+                file.write('{"locations": [], "connections": [] }')
+            self.assertIsNone(RouteTable.load_for_map(map_file))
+
+if __name__ == '__main__':
+    unittest.main()
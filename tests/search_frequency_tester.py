@@ -0,0 +1,74 @@
+import unittest
+import random
+import sys
+import os
+import tempfile
+from collections import Counter
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from src.data_structures.search_frequency import SearchFrequency
+
+DAY = 24 * 3600
+
+class search_frequency_tests(unittest.TestCase):
+    def test_ranking(self):
+        frequency = SearchFrequency(top_size=3, clock=lambda: 0)
+        for name in ['a', 'b', 'a', 'c', 'a', 'b', 'd']:
+            frequency.record(name)
+        self.assertEqual([name for name, _ in frequency.top()], ['a', 'b', 'c'])
+        self.assertAlmostEqual(frequency.top()[0][1], 3)
+        self.assertEqual(frequency.top(1), [('a', frequency.score('a'))])
+        self.assertEqual(frequency.score('missing'), 0)
+
+    def test_matches_counting(self):
+        rng = random.Random(0)
+        frequency = SearchFrequency(top_size=5, clock=lambda: 0)
+        searches = [rng.randrange(30) ** 2 % 17 for _ in range(2000)]
+        for name in searches:
+            frequency.record(name)
+        scores = [score for _, score in frequency.top()]
+        self.assertEqual(scores, [count for _, count in Counter(searches).most_common(5)])
+
+    def test_decay(self):
+        frequency = SearchFrequency(half_life=DAY, clock=lambda: 0)
+        for _ in range(4):
+            frequency.record('old', now=0)
+        for _ in range(3):
+            frequency.record('new', now=2 * DAY)
+        self.assertAlmostEqual(frequency.score('old', now=2 * DAY), 1)
+        self.assertEqual([name for name, _ in frequency.top(now=2 * DAY)], ['new', 'old'])
+
+        # Far enough ahead the counters are rescaled without changing the scores
+        frequency.record('new', now=1000 * DAY)
+        self.assertAlmostEqual(frequency.score('new', now=1000 * DAY), 1)
+        self.assertEqual(frequency.landmark, 1000 * DAY)
+
+    def test_capacity(self):
+        frequency = SearchFrequency(top_size=2, capacity=3, clock=lambda: 0)
+        for name in ['a'] * 5 + ['b'] * 4 + ['c', 'd', 'e', 'f']:
+            frequency.record(name)
+        self.assertEqual(len(frequency), 3)
+        self.assertEqual([name for name, _ in frequency.top()], ['a', 'b'])
+        self.assertIn('f', frequency)
+        self.assertNotIn('c', frequency)
+
+    def test_save_and_load(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'search_history.json')
+            frequency = SearchFrequency(half_life=DAY, clock=lambda: 0)
+            for name in ['a', 'b', 'a']:
+                frequency.record(name)
+            frequency.save(path)
+
+            # The saved half-life is kept unless the caller gives another
+            loaded = SearchFrequency.load(path, clock=lambda: DAY)
+            self.assertEqual(loaded.half_life, DAY)
+            self.assertEqual(loaded.top(), [('a', 1.0), ('b', 0.5)])
+            self.assertEqual(SearchFrequency.load(path, half_life=2 * DAY, clock=lambda: 0).half_life, 2 * DAY)
+            loaded.record('b')
+            self.assertEqual([name for name, _ in loaded.top()], ['b', 'a'])
+
+            self.assertEqual(len(SearchFrequency.load(os.path.join(directory, 'missing.json'))), 0)
+
+if __name__ == '__main__':
+    unittest.main()
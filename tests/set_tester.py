@@ -0,0 +1,38 @@
+import unittest
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from src.data_structures.set import Set
+
+class set_tests(unittest.TestCase):
+    def test_add(self):
+        s = Set()
+        s.add(1)
+        s.add(2)
+        s.add(1)
+        self.assertEqual(list(s), [1, 2])
+        self.assertEqual(len(s), 2)
+        self.assertEqual(s.size(), 2)
+
+    def test_remove(self):
+        s = Set([1, 2, 3])
+        s.remove(2)
+        s.remove(4)
+        self.assertEqual(list(s), [1, 3])
+
+    def test_contains(self):
+        s = Set([0, 'a'])
+        self.assertIn(0, s)
+        self.assertTrue(s.contains('a'))
+        self.assertNotIn(1, s)
+
+    def test_operations(self):
+        a, b = Set([1, 2, 3]), Set([3, 4, 2])
+        self.assertEqual(list(a.union(b)), [1, 2, 3, 4])
+        self.assertEqual(sorted(a.intersection(b)), [2, 3])
+        self.assertEqual(list(a.difference(b)), [1])
+        self.assertEqual(list(a), [1, 2, 3])
+
+if __name__ == '__main__':
+    unittest.main()
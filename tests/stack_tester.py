@@ -30,6 +30,16 @@ class stack_tests(unittest.TestCase):
         s.push(1)
         self.assertFalse(s.is_empty())
 
+    def test_falsy_items(self):
+        s = Stack()
+        s.push(0)
+        self.assertFalse(s.is_empty())
+        self.assertEqual(s.peek(), 0)
+        self.assertEqual(s.pop(), 0)
+        self.assertRaises(IndexError, s.pop)
+        s.push(1)
+        self.assertEqual(len(Stack()), 0)
+
     def test_len(self):
         s = Stack([1, 2, 3])
         self.assertEqual(len(s), 3)
@@ -0,0 +1,57 @@
+import unittest
+import sys
+import os
+import tempfile
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+from tile_pyramid import TilePyramid
+
+class tile_pyramid_tests(unittest.TestCase):
+    def test_build(self):
+        pixels = np.zeros((9, 20, 4), dtype=np.uint8)
+        pixels[:, 10:] = 200
+        pyramid = TilePyramid.build(pixels, tile_size=4)
+        self.assertEqual([level.shape[:2] for level in pyramid.levels], [(9, 20), (5, 10), (3, 5), (2, 3)])
+        self.assertEqual(pyramid.levels[1].dtype, np.uint8)
+        self.assertEqual(pyramid.levels[1][0, 4, 0], 0)
+        self.assertEqual(pyramid.levels[1][0, 5, 0], 200)
+        self.assertEqual(pyramid.levels[2][0, 2, 0], 100)
+
+        self.assertEqual(pyramid.choose_level(0.5), 0)
+        self.assertEqual(pyramid.choose_level(1.9), 0)
+        self.assertEqual(pyramid.choose_level(2), 1)
+        self.assertEqual(pyramid.choose_level(100), 3)
+
+    def test_region(self):
+        pyramid = TilePyramid.build(np.arange(10 * 10, dtype=np.uint8).reshape(10, 10), tile_size=4)
+        pixels, bounds = pyramid.region(0, 0.45, 0.55, 0.0, 0.2)
+        self.assertEqual(pixels.shape, (4, 4))
+        self.assertEqual(bounds, (0.4, 0.8, 0.0, 0.4))
+        self.assertEqual(pixels[0, 0], 4)
+
+        # Views reaching past the image are clipped, views beside it are empty
+        pixels, bounds = pyramid.region(0, -1, 2, 0.9, 1.5)
+        self.assertEqual(pixels.shape, (2, 10))
+        self.assertEqual(bounds, (0.0, 1.0, 0.8, 1.0))
+        self.assertEqual(pyramid.region(0, 1.2, 1.5, 0, 1), (None, None))
+
+    def test_save_load(self):
+        pixels = np.random.default_rng(1).integers(0, 256, (30, 17, 3), dtype=np.uint8)
+        pyramid = TilePyramid.build(pixels, tile_size=8)
+        with tempfile.TemporaryDirectory() as directory:
+            self.assertIsNone(TilePyramid.load(directory, pixels))
+            pyramid.save(directory)
+            loaded = TilePyramid.load(directory, pixels)
+            self.assertEqual(loaded.tile_size, 8)
+            self.assertEqual(len(loaded.levels), len(pyramid.levels))
+            for saved, level in zip(pyramid.levels, loaded.levels):
+                self.assertTrue(np.array_equal(saved, level))
+
+            # Levels saved for a different image are not used
+            self.assertIsNone(TilePyramid.load(directory, pixels[:20]))
+            del loaded, level
+
+if __name__ == '__main__':
+    unittest.main()